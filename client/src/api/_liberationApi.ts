@@ -446,10 +446,6 @@ export type NavMeshPoly = {
 export type NavMesh = {
   polys: NavMeshPoly[];
 };
-export type NavMeshes = {
-  blue: NavMesh;
-  red: NavMesh;
-};
 export type UnculledZone = {
   position: LatLng;
   radius: number;
@@ -462,7 +458,6 @@ export type Game = {
   flights: Flight[];
   iads_network: IadsNetwork;
   threat_zones: ThreatZoneContainer;
-  navmeshes: NavMeshes;
   map_center?: LatLng;
   unculled_zones: UnculledZone[];
 };
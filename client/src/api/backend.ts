@@ -13,6 +13,7 @@ export const backend = axios.create({
   baseURL: HTTP_URL,
 });
 
-export const WEBSOCKET_URL = `ws://${backendAddr}/eventstream`;
+// Flight positions are sent as binary messages, decoded by handleBinaryMessage.
+export const WEBSOCKET_URL = `ws://${backendAddr}/eventstream?flight_positions=binary`;
 
 export default backend;
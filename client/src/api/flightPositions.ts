@@ -0,0 +1,66 @@
+// Decodes the binary flight position messages sent by the event stream. See
+// game/server/eventstream/flightpositions.py for the format.
+import { AppDispatch } from "../app/store";
+import { updateFlightPositions } from "./flightsSlice";
+import { LatLng } from "leaflet";
+
+const FLIGHT_TABLE_MESSAGE = 1;
+const FLIGHT_POSITIONS_MESSAGE = 2;
+const HEADER_SIZE = 12;
+const UUID_SIZE = 16;
+
+interface FlightTable {
+  id: number;
+  flights: string[];
+}
+
+let flightTable: FlightTable = { id: -1, flights: [] };
+
+const uuidToString = (bytes: Uint8Array): string => {
+  const hex = Array.from(bytes, (b) =>
+    b.toString(16).padStart(2, "0")
+  ).join("");
+  return [
+    hex.slice(0, 8),
+    hex.slice(8, 12),
+    hex.slice(12, 16),
+    hex.slice(16, 20),
+    hex.slice(20),
+  ].join("-");
+};
+
+export const handleBinaryMessage = (
+  dispatch: AppDispatch,
+  buffer: ArrayBuffer
+) => {
+  const header = new DataView(buffer, 0, HEADER_SIZE);
+  const messageType = header.getUint32(0, true);
+  const tableId = header.getUint32(4, true);
+  const count = header.getUint32(8, true);
+
+  if (messageType === FLIGHT_TABLE_MESSAGE) {
+    const flights = [];
+    for (let i = 0; i < count; i++) {
+      const offset = HEADER_SIZE + i * UUID_SIZE;
+      flights.push(uuidToString(new Uint8Array(buffer, offset, UUID_SIZE)));
+    }
+    flightTable = { id: tableId, flights: flights };
+    return;
+  }
+
+  if (messageType !== FLIGHT_POSITIONS_MESSAGE || tableId !== flightTable.id) {
+    // Positions for a table we do not have, which the server will resend.
+    return;
+  }
+
+  const indices = new Uint32Array(buffer, HEADER_SIZE, count);
+  const latlngs = new Float32Array(buffer, HEADER_SIZE + count * 4, count * 2);
+  const positions: [string, LatLng][] = [];
+  for (let i = 0; i < count; i++) {
+    const position = { lat: latlngs[i * 2], lng: latlngs[i * 2 + 1] };
+    positions.push([flightTable.flights[indices[i]], position as LatLng]);
+  }
+  if (positions.length) {
+    dispatch(updateFlightPositions(positions));
+  }
+};
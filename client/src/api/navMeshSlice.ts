@@ -3,14 +3,16 @@ import { gameLoaded, gameUnloaded } from "./actions";
 import { NavMesh, NavMeshPoly } from "./liberationApi";
 import { createSlice, PayloadAction } from "@reduxjs/toolkit";
 
+// Navmeshes are null until they are loaded. They are not part of the game state
+// sent on load, since they are only needed for the navmesh debug layers.
 interface NavMeshState {
-  blue: NavMeshPoly[];
-  red: NavMeshPoly[];
+  blue: NavMeshPoly[] | null;
+  red: NavMeshPoly[] | null;
 }
 
 const initialState: NavMeshState = {
-  blue: [],
-  red: [],
+  blue: null,
+  red: null,
 };
 
 export interface INavMeshUpdate {
@@ -22,6 +24,13 @@ const navMeshSlice = createSlice({
   name: "navmesh",
   initialState: initialState,
   reducers: {
+    loaded: (state, action: PayloadAction<INavMeshUpdate>) => {
+      if (action.payload.blue) {
+        state.blue = action.payload.mesh.polys;
+      } else {
+        state.red = action.payload.mesh.polys;
+      }
+    },
     updated: (state, action: PayloadAction<INavMeshUpdate[]>) => {
       for (const [blue, navmesh] of Object.entries(action.payload)) {
         const data = {blue: (blue === "true"), mesh: navmesh} as unknown as INavMeshUpdate
@@ -35,18 +44,19 @@ const navMeshSlice = createSlice({
     },
   },
   extraReducers: (builder) => {
-    builder.addCase(gameLoaded, (state, action) => {
-      state.blue = action.payload.navmeshes.blue.polys;
-      state.red = action.payload.navmeshes.red.polys;
+    builder.addCase(gameLoaded, (state) => {
+      state.blue = null;
+      state.red = null;
     });
     builder.addCase(gameUnloaded, (state) => {
-      state.blue = [];
-      state.red = [];
+      state.blue = null;
+      state.red = null;
     });
   },
 });
 
-export const { updated: navMeshUpdated } = navMeshSlice.actions;
+export const { loaded: navMeshLoaded, updated: navMeshUpdated } =
+  navMeshSlice.actions;
 
 export const selectNavMeshes = (state: RootState) => state.navmeshes;
 
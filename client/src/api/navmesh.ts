@@ -0,0 +1,13 @@
+import { AppDispatch } from "../app/store";
+import backend from "./backend";
+import { NavMesh } from "./liberationApi";
+import { navMeshLoaded } from "./navMeshSlice";
+
+export default function loadNavMesh(dispatch: AppDispatch, blue: boolean) {
+  backend
+    .get("/navmesh/", { params: { for_player: blue } })
+    .then((response) => {
+      dispatch(navMeshLoaded({ blue: blue, mesh: response.data as NavMesh }));
+    })
+    .catch((error) => console.log(`Error fetching navmesh: ${error}`));
+}
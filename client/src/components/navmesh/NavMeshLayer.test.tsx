@@ -1,5 +1,9 @@
+import { HTTP_URL } from "../../api/backend";
 import { renderWithProviders } from "../../testutils";
 import NavMeshLayer from "./NavMeshLayer";
+import { act, waitFor } from "@testing-library/react";
+import { rest } from "msw";
+import { setupServer } from "msw/node";
 import { PropsWithChildren } from "react";
 
 const mockPolygon = jest.fn();
@@ -14,6 +18,29 @@ jest.mock("react-leaflet", () => ({
   },
 }));
 
+const loadedPoly = [
+  [
+    { lat: -1, lng: 0 },
+    { lat: 0, lng: 3 },
+    { lat: 1, lng: 0 },
+  ],
+];
+
+const server = setupServer(
+  rest.get(`${HTTP_URL}/navmesh/`, (req, res, ctx) => {
+    if (req.url.searchParams.get("for_player") !== "true") {
+      return res(ctx.status(404));
+    }
+    return res(
+      ctx.json({ polys: [{ poly: loadedPoly, threatened: false }] })
+    );
+  })
+);
+
+beforeAll(() => server.listen({ onUnhandledRequest: "error" }));
+afterEach(() => server.resetHandlers());
+afterAll(() => server.close());
+
 // The waypoints in test data below should all use `should_make: false`. Markers
 // need useMap() to check the zoom level to decide if they should be drawn or
 // not, and we don't have good options here for mocking that behavior.
@@ -122,4 +149,15 @@ describe("NavMeshLayer", () => {
     expect(mockPolygon).toHaveBeenCalledTimes(1);
     expect(mockLayerGroup).toHaveBeenCalledTimes(1);
   });
+  it("loads the navmesh when the layer is shown", async () => {
+    renderWithProviders(<NavMeshLayer blue={true} />);
+    expect(mockPolygon).not.toHaveBeenCalled();
+
+    act(() => mockLayerGroup.mock.calls[0][0].eventHandlers.add());
+    await waitFor(() =>
+      expect(mockPolygon).toHaveBeenCalledWith(
+        expect.objectContaining({ positions: loadedPoly })
+      )
+    );
+  });
 });
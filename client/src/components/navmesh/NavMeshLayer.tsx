@@ -1,5 +1,7 @@
+import loadNavMesh from "../../api/navmesh";
 import { selectNavMeshes } from "../../api/navMeshSlice";
-import { useAppSelector } from "../../app/hooks";
+import { useAppDispatch, useAppSelector } from "../../app/hooks";
+import { useEffect, useState } from "react";
 import { LayerGroup, Polygon } from "react-leaflet";
 
 interface NavMeshLayerProps {
@@ -7,11 +9,27 @@ interface NavMeshLayerProps {
 }
 
 export default function NavMeshLayer(props: NavMeshLayerProps) {
+  const dispatch = useAppDispatch();
   const meshes = useAppSelector(selectNavMeshes);
   const mesh = props.blue ? meshes.blue : meshes.red;
+  const [visible, setVisible] = useState(false);
+
+  useEffect(() => {
+    // Building a navmesh is expensive, so it is only requested once the layer is
+    // shown. Later changes are pushed by the event stream.
+    if (visible && mesh === null) {
+      loadNavMesh(dispatch, props.blue);
+    }
+  }, [dispatch, visible, mesh, props.blue]);
+
   return (
-    <LayerGroup>
-      {mesh.map((zone, idx) => {
+    <LayerGroup
+      eventHandlers={{
+        add: () => setVisible(true),
+        remove: () => setVisible(false),
+      }}
+    >
+      {(mesh ?? []).map((zone, idx) => {
         return (
           <Polygon
             key={idx}
@@ -2,7 +2,13 @@
 import { WEBSOCKET_URL } from "../../api/backend";
 import { ReactChild, createContext, useEffect, useState } from "react";
 
-const socket = new WebSocket(WEBSOCKET_URL);
+const connect = () => {
+  const ws = new WebSocket(WEBSOCKET_URL);
+  ws.binaryType = "arraybuffer";
+  return ws;
+};
+
+const socket = connect();
 
 export const SocketContext = createContext(socket);
 
@@ -14,7 +20,7 @@ export const SocketProvider = (props: SocketProviderProps) => {
   const [ws, setWs] = useState<WebSocket>(socket);
   useEffect(() => {
     const onClose = () => {
-      setWs(new WebSocket(WEBSOCKET_URL));
+      setWs(connect());
     };
 
     const onError = (error: Event) => {
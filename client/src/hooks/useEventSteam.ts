@@ -1,4 +1,5 @@
 import { handleStreamedEvents } from "../api/eventstream";
+import { handleBinaryMessage } from "../api/flightPositions";
 import { useAppDispatch } from "../app/hooks";
 import { useSocket } from "./useSocket";
 import { useCallback, useEffect } from "react";
@@ -9,7 +10,11 @@ export const useEventStream = () => {
 
   const onMessage = useCallback(
     (message: MessageEvent) => {
-      handleStreamedEvents(dispatch, JSON.parse(message.data));
+      if (message.data instanceof ArrayBuffer) {
+        handleBinaryMessage(dispatch, message.data);
+      } else {
+        handleStreamedEvents(dispatch, JSON.parse(message.data));
+      }
     },
     [dispatch]
   );
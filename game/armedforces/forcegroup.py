@@ -6,7 +6,6 @@
 from pathlib import Path
 from typing import Any, ClassVar, Iterator, Optional, TYPE_CHECKING, Type
 
-import yaml
 from dcs.unittype import ShipType, StaticType, UnitType as DcsUnitType, VehicleType
 
 from game.data.groups import GroupTask
@@ -17,6 +16,7 @@
 from game.layout import LAYOUTS
 from game.layout.layout import TgoLayout, TgoLayoutUnitGroup
 from game.point_with_heading import PointWithHeading
+from game.resourcecache import load_yaml
 from game.theater.theatergroundobject import (
     IadsGroundObject,
     IadsBuildingGroundObject,
@@ -276,6 +276,7 @@ def create_theater_group_for_tgo(
                 ground_group.iads_role = IadsRole.for_task(iads_task)
 
             ground_object.groups.append(ground_group)
+            ground_object.invalidate_threat_ranges()
 
         # A layout has to be created with an orientation of 0 deg.
         # Therefore the the clockwise rotation angle is always the heading of the
@@ -310,8 +311,7 @@ def _load_all(cls) -> None:
             if not file.is_file():
                 raise RuntimeError(f"{file.name} is not a valid ForceGroup")
 
-            with file.open(encoding="utf-8") as data_file:
-                data = yaml.safe_load(data_file)
+            data = load_yaml(file)
 
             name = data["name"]
 
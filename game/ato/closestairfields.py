@@ -14,15 +14,15 @@ class ClosestAirfields:
     """Precalculates which control points are closes to the given target."""
 
     def __init__(
-        self, target: MissionTarget, all_control_points: List[ControlPoint]
+        self, target: MissionTarget, closest_airfields: List[ControlPoint]
     ) -> None:
         self.target = target
-        # This cache is configured once on load, so it's important that it is
-        # complete and deterministic to avoid different behaviors across loads.
-        # E.g. https://github.com/dcs-liberation/dcs_liberation/issues/819
-        self.closest_airfields: List[ControlPoint] = sorted(
-            all_control_points, key=lambda c: self.target.distance_to(c)
-        )
+        self.closest_airfields = closest_airfields
+        self._distance_ranks = {cp: i for i, cp in enumerate(closest_airfields)}
+
+    def distance_rank(self, control_point: ControlPoint) -> int:
+        """Returns the position of the control point in closest_airfields."""
+        return self._distance_ranks[control_point]
 
     @property
     def operational_airfields(self) -> Iterator[ControlPoint]:
@@ -75,7 +75,11 @@ def get_closest_airfields(cls, location: MissionTarget) -> ClosestAirfields:
             raise RuntimeError("Call ObjectiveDistanceCache.set_theater before using")
 
         if location.name not in cls.closest_airfields:
+            # This cache is configured once on load, so it's important that it is
+            # complete and deterministic to avoid different behaviors across loads.
+            # E.g. https://github.com/dcs-liberation/dcs_liberation/issues/819
             cls.closest_airfields[location.name] = ClosestAirfields(
-                location, cls.theater.controlpoints
+                location,
+                cls.theater.spatial_index.control_points_by_distance(location),
             )
         return cls.closest_airfields[location.name]
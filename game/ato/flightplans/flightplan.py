@@ -49,11 +49,83 @@ def iter_waypoints(self) -> Iterator[FlightWaypoint]:
 LayoutT = TypeVar("LayoutT", bound=Layout)
 
 
+class LegTable:
+    """Cumulative travel time and fuel consumption to each waypoint of a flight plan.
+
+    Scheduling a package and simulating the mission ask for the time from the first
+    waypoint to another many times, and each answer otherwise sums the time of every
+    leg before that waypoint. The table sums each leg once.
+
+    Legs are only added to the table when a waypoint after them is first asked for, so
+    the legs that are evaluated are the same as if they were summed on each call.
+    """
+
+    def __init__(self, flight_plan: FlightPlan[Any]) -> None:
+        self.flight_plan = flight_plan
+        self.waypoints = flight_plan.waypoints
+        self._indices: dict[FlightWaypoint, int] = {}
+        for index, waypoint in enumerate(self.waypoints):
+            self._indices.setdefault(waypoint, index)
+        self._times = [timedelta()]
+        self._fuel = [0.0]
+
+    def index_of(self, waypoint: FlightWaypoint) -> int:
+        """Returns the index of the waypoint in the flight plan.
+
+        Raises:
+            ValueError: The waypoint is not in the flight plan.
+        """
+        try:
+            return self._indices[waypoint]
+        except KeyError:
+            # FlightWaypoint is hashed by identity but compared by value. Fall back to
+            # a search for waypoints that are equal but not identical.
+            return self.waypoints.index(waypoint)
+
+    def time_to(self, index: int) -> timedelta:
+        """Returns the total time between the first waypoint and the given waypoint."""
+        while len(self._times) <= index:
+            a = self.waypoints[len(self._times) - 1]
+            b = self.waypoints[len(self._times)]
+            self._times.append(
+                self._times[-1] + self.flight_plan.total_time_between_waypoints(a, b)
+            )
+        return self._times[index]
+
+    def fuel_to(self, index: int) -> float | None:
+        """Returns the fuel consumed between the first waypoint and the given waypoint.
+
+        Returns None if the fuel consumption of the aircraft is unknown.
+        """
+        if self.flight_plan.flight.unit_type.fuel_consumption is None:
+            return None
+        while len(self._fuel) <= index:
+            a = self.waypoints[len(self._fuel) - 1]
+            b = self.waypoints[len(self._fuel)]
+            consumption = self.flight_plan.fuel_consumption_between_points(a, b)
+            assert consumption is not None
+            self._fuel.append(self._fuel[-1] + consumption)
+        return self._fuel[index]
+
+
 class FlightPlan(ABC, Generic[LayoutT]):
     def __init__(self, flight: Flight, layout: LayoutT) -> None:
         self.flight = flight
         self.layout = layout
         self.tot_offset = self.default_tot_offset()
+        self._leg_table: LegTable | None = None
+        self._leg_table_key: object = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_leg_table"]
+        del state["_leg_table_key"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        state["_leg_table"] = None
+        state["_leg_table_key"] = None
+        self.__dict__.update(state)
 
     @property
     def package(self) -> Package:
@@ -162,17 +234,39 @@ def default_tot_offset(self) -> timedelta:
         """
         return timedelta()
 
-    def _travel_time_to_waypoint(self, destination: FlightWaypoint) -> timedelta:
-        total = timedelta()
+    def leg_table_key(self) -> object:
+        """Returns the state other than the waypoints that the leg table depends on.
 
-        if destination not in self.waypoints:
+        The leg table is rebuilt if the key changes.
+        """
+        return None
+
+    @property
+    def leg_table(self) -> LegTable:
+        key = self.leg_table_key()
+        if self._leg_table is None or key != self._leg_table_key:
+            self._leg_table = LegTable(self)
+            self._leg_table_key = key
+        return self._leg_table
+
+    def invalidate_leg_table(self) -> None:
+        """Discards the leg table so that it is rebuilt when next used.
+
+        Must be called after waypoints are added, removed or moved, or their altitude
+        changes.
+        """
+        self._leg_table = None
+
+    def _travel_time_to_waypoint(self, destination: FlightWaypoint) -> timedelta:
+        table = self.leg_table
+        try:
+            index = table.index_of(destination)
+        except ValueError as ex:
             raise PlanningError(
                 f"Did not find destination waypoint {destination} in "
                 f"waypoints for {self.flight}"
-            )
-
-        for previous_waypoint, waypoint in self.edges(until=destination):
-            total += self.total_time_between_waypoints(previous_waypoint, waypoint)
+            ) from ex
+        total = table.time_to(index)
 
         # Trim microseconds. Our simulation tick rate is 1 second, so anything that
         # takes 100.1 or 100.9 seconds will take 100 seconds. DCS doesn't handle
@@ -191,6 +285,14 @@ def total_time_between_waypoints(
         """
         return self.travel_time_between_waypoints(a, b)
 
+    def fuel_consumption_to_waypoint(self, index: int) -> float | None:
+        """Returns the fuel consumed between the first waypoint and the waypoint at the
+        given index, in pounds.
+
+        Returns None if the fuel consumption of the aircraft is unknown.
+        """
+        return self.leg_table.fuel_to(index)
+
     def travel_time_between_waypoints(
         self, a: FlightWaypoint, b: FlightWaypoint
     ) -> timedelta:
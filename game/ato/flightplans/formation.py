@@ -53,6 +53,11 @@ def best_flight_formation_speed(self) -> Speed:
                 )
         return min(speeds)
 
+    def leg_table_key(self) -> object:
+        # The package flies at the speed of its slowest flight, so the time of each leg
+        # at package speed changes when flights join or leave the package.
+        return self.package.formation_speed
+
     def speed_between_waypoints(self, a: FlightWaypoint, b: FlightWaypoint) -> Speed:
         if b in self.package_speed_waypoints:
             # Should be impossible, as any package with at least one
@@ -587,9 +587,13 @@ def clean_nav_points(self, points: Iterable[Point]) -> Iterator[Point]:
             current = nxt
 
     def nav_point_prunable(self, previous: Point, current: Point, nxt: Point) -> bool:
-        previous_threatened = self.threat_zones.path_threatened(previous, current)
-        next_threatened = self.threat_zones.path_threatened(current, nxt)
-        pruned_threatened = self.threat_zones.path_threatened(previous, nxt)
+        (
+            previous_threatened,
+            next_threatened,
+            pruned_threatened,
+        ) = self.threat_zones.segments_threatened(
+            [previous, current, previous], [current, nxt, nxt]
+        )
         previous_distance = meters(previous.distance_to_point(current))
         distance = meters(current.distance_to_point(nxt))
         distance_without = previous_distance + distance
@@ -605,7 +609,7 @@ def nav_point_prunable(self, previous: Point, current: Point, nxt: Point) -> boo
 
         # The new path is threatened. Only allow if both paths were
         # threatened anyway.
-        return previous_threatened and next_threatened
+        return bool(previous_threatened and next_threatened)
 
     @staticmethod
     def perturb(point: Point) -> Point:
@@ -23,3 +23,6 @@ def is_finished(self) -> bool:
 
     def on_game_tick(self, time: datetime, duration: timedelta) -> timedelta:
         return self.action.update_state(self, time, duration)
+
+    def next_event_time(self, time: datetime) -> datetime | None:
+        return self.action.next_event_time(time)
@@ -91,6 +91,17 @@ def will_join_air_combat(self) -> bool:
     def should_halt_sim(self) -> bool:
         return False
 
+    def next_event_time(self, time: datetime) -> Optional[datetime]:
+        """Returns the earliest time at which ticking this state may change the flight.
+
+        Ticks before the returned time only accumulate elapsed time, so the simulation
+        may skip directly to the first tick at or after it. None means that the state
+        will not change on its own.
+
+        The default implementation requests the next tick, which is always correct.
+        """
+        return time
+
     @property
     @abstractmethod
     def is_waiting_for_start(self) -> bool: ...
@@ -55,6 +55,10 @@ def on_game_tick(
         # across multiple flights.
         pass
 
+    def next_event_time(self, time: datetime) -> datetime | None:
+        # Leaving combat is an event of the combat, not of the flight.
+        return None
+
     @property
     def is_at_ip(self) -> bool:
         return False
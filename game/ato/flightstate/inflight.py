@@ -13,7 +13,7 @@
 from game.ato.flightwaypoint import FlightWaypoint
 from game.ato.flightwaypointtype import FlightWaypointType
 from game.ato.starttype import StartType
-from game.utils import Distance, LBS_TO_KG, Speed, pairwise
+from game.utils import Distance, LBS_TO_KG, Speed
 
 if TYPE_CHECKING:
     from game.ato.flight import Flight
@@ -58,7 +58,7 @@ def in_flight(self) -> bool:
         return True
 
     def has_passed_waypoint(self, waypoint: FlightWaypoint) -> bool:
-        index = self.flight.flight_plan.waypoints.index(waypoint)
+        index = self.flight.flight_plan.leg_table.index_of(waypoint)
         return index <= self.waypoint_index
 
     def travel_time_between_waypoints(self) -> timedelta:
@@ -80,12 +80,12 @@ def estimate_fuel_at_current_waypoint(self) -> float:
         if self.flight.unit_type.fuel_consumption is None:
             return initial_fuel
         initial_fuel -= self.flight.unit_type.fuel_consumption.taxi * LBS_TO_KG
-        waypoints = self.flight.flight_plan.waypoints[: self.waypoint_index + 1]
-        for a, b in pairwise(waypoints[:-1]):
-            consumption = self.flight.flight_plan.fuel_consumption_between_points(a, b)
-            assert consumption is not None
-            initial_fuel -= consumption * LBS_TO_KG
-        return initial_fuel
+        # Counts the legs up to the previous waypoint.
+        consumption = self.flight.flight_plan.fuel_consumption_to_waypoint(
+            max(self.waypoint_index - 1, 0)
+        )
+        assert consumption is not None
+        return initial_fuel - consumption * LBS_TO_KG
 
     def next_waypoint_state(self) -> FlightState:
         from .racetrack import RaceTrack
@@ -131,6 +131,21 @@ def on_game_tick(
             rollover = self.elapsed_time - self.total_time_to_next_waypoint
             new_state.on_game_tick(events, time, rollover)
 
+    def next_event_time(self, time: datetime) -> datetime | None:
+        for action in self.pending_actions:
+            if (event_time := action.next_event_time(time)) is not None:
+                return event_time
+
+        # The waypoint is reached on the first tick that takes the elapsed time past
+        # the travel time, so the event is one microsecond (the resolution of
+        # timedelta) after the travel time is used up.
+        return (
+            time
+            + self.total_time_to_next_waypoint
+            - self.elapsed_time
+            + timedelta(microseconds=1)
+        )
+
     @property
     def is_at_ip(self) -> bool:
         contact_types = {
@@ -34,6 +34,9 @@ def on_game_tick(
     ) -> None:
         return
 
+    def next_event_time(self, time: datetime) -> datetime | None:
+        return None
+
     @property
     def is_waiting_for_start(self) -> bool:
         return False
@@ -30,6 +30,9 @@ def on_game_tick(
             return
         self.flight.set_state(Navigating(self.flight, self.settings, waypoint_index=0))
 
+    def next_event_time(self, time: datetime) -> datetime:
+        return self.completion_time
+
     @property
     def is_waiting_for_start(self) -> bool:
         return False
@@ -28,6 +28,9 @@ def on_game_tick(
             return
         self.flight.set_state(Takeoff(self.flight, self.settings, time))
 
+    def next_event_time(self, time: datetime) -> datetime:
+        return self.completion_time
+
     @property
     def is_waiting_for_start(self) -> bool:
         return False
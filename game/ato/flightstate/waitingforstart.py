@@ -46,6 +46,9 @@ def on_game_tick(
             new_state = Navigating(self.flight, self.settings, waypoint_index=0)
         self.flight.set_state(new_state)
 
+    def next_event_time(self, time: datetime) -> datetime:
+        return self.start_time
+
     @property
     def is_waiting_for_start(self) -> bool:
         return True
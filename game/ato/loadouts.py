@@ -13,6 +13,7 @@
 from game.factions.faction import Faction
 
 from .flighttype import FlightType
+from .payloadindex import PayloadIndex
 
 if TYPE_CHECKING:
     from .flight import Flight
@@ -143,31 +144,19 @@ def iter_for(cls, flight: Flight) -> Iterator[Loadout]:
 
     @classmethod
     def iter_for_aircraft(cls, aircraft: AircraftType) -> Iterator[Loadout]:
-        # Dict of payload ID (numeric) to:
-        #
-        # {
-        #   "name": The name the user set in the ME
-        #   "pylons": List (as a dict) of dicts of:
-        #       {"CLSID": class ID, "num": pylon number}
-        #   "tasks": List (as a dict) of task IDs the payload is used by.
-        # }
-        payloads = aircraft.dcs_unit_type.load_payloads()
-        for payload in payloads.values():
-            name = payload["name"]
+        for payload in PayloadIndex.for_dcs_type(aircraft.dcs_unit_type).payloads:
             try:
-                pylon_assignments = cls.convert_dcs_loadout_to_pylon_map(
-                    payload["pylons"]
-                )
+                pylon_assignments = cls.convert_dcs_loadout_to_pylon_map(payload.pylons)
             except KeyError:
                 logging.exception(
                     "Ignoring %s loadout with invalid weapons: %s",
                     aircraft.variant_id,
-                    name,
+                    payload.name,
                 )
                 continue
 
             yield Loadout(
-                name,
+                payload.name,
                 pylon_assignments,
                 date=None,
             )
@@ -227,32 +216,14 @@ def default_for_task_and_aircraft(
     ) -> Loadout:
         # Iterate through each possible payload type for a given aircraft.
         # Some aircraft have custom loadouts that in aren't the standard set.
+        index = PayloadIndex.for_dcs_type(dcs_unit_type)
         for name in cls.default_loadout_names_for(task):
-            # This operation is cached, but must be called before load_by_name will
-            # work.
-            dcs_unit_type.load_payloads()
-            payload = dcs_unit_type.loadout_by_name(name)
+            # Equivalent to pydcs's loadout_by_name(), but served from the payload
+            # index so that the Lua payload files do not need to be parsed.
+            payload = index.named(name)
             if payload is not None:
                 try:
-                    # Pydcs returns the data in a different format for loadout_by_name()
-                    # than it does for load_payloads(), for some reason. Convert this
-                    # result to match the other so that we can reuse
-                    # convert_dcs_loadout_to_pylon_map.
-                    #
-                    # loadout_by_name() returns a list of pairs, with the first item
-                    # being the pylon index and the second being a dict with a single
-                    # clsid key.
-                    #
-                    # Each element of load_payloads() pylons is a dict of dicts with
-                    # both the CLSID key (yes, different case from the other API!) and a
-                    # num key for the pylon index. The outer dict is a mapping for a lua
-                    # table, so its keys are just indexes.
-                    pylons = cls.convert_dcs_loadout_to_pylon_map(
-                        {
-                            i: {"num": n, "CLSID": p["clsid"]}
-                            for i, (n, p) in enumerate(payload)
-                        }
-                    )
+                    pylons = cls.convert_dcs_loadout_to_pylon_map(payload.pylons)
                 except KeyError:
                     logging.exception(
                         "Ignoring %s loadout with invalid weapons: %s",
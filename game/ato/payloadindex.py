@@ -0,0 +1,104 @@
+"""Index of the payloads defined for each aircraft type.
+
+pydcs parses the Lua payload files of an aircraft type the first time its payloads are
+requested, once per session. The parsed payloads of each aircraft type are memoized for
+the session and stored in the resource cache, so later sessions only parse the Lua
+files again when a payload file changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, ClassVar, Optional
+
+import dcs.helicopters
+import dcs.planes
+from dcs.payloads import PayloadDirectories
+from dcs.unittype import FlyingType
+
+from game.resourcecache import load_derived
+
+#: The pylons of a payload as returned by pydcs. A dict (for a Lua table) of dicts with
+#: a "CLSID" key for the weapon and a "num" key for the pylon number.
+PayloadPylons = dict[int, dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class Payload:
+    name: str
+    pylons: PayloadPylons
+
+
+@dataclass(frozen=True)
+class PayloadIndex:
+    #: The payloads of the aircraft type in the order that pydcs loads them.
+    payloads: tuple[Payload, ...]
+
+    _by_dcs_type: ClassVar[dict[type[FlyingType], PayloadIndex]] = {}
+    _fingerprint: ClassVar[Optional[bytes]] = None
+
+    def named(self, name: str) -> Optional[Payload]:
+        """Returns the first payload with the given name, as pydcs does."""
+        for payload in self.payloads:
+            if payload.name == name:
+                return payload
+        return None
+
+    @classmethod
+    def for_dcs_type(cls, dcs_unit_type: type[FlyingType]) -> PayloadIndex:
+        index = cls._by_dcs_type.get(dcs_unit_type)
+        if index is None:
+            index = load_derived(
+                f"payloads/{dcs_unit_type.id}",
+                cls._payload_fingerprint(),
+                lambda: cls._from_pydcs(dcs_unit_type),
+            )
+            cls._by_dcs_type[dcs_unit_type] = index
+        return index
+
+    @classmethod
+    def _from_pydcs(cls, dcs_unit_type: type[FlyingType]) -> PayloadIndex:
+        # Dict of payload ID (numeric) to:
+        #
+        # {
+        #   "name": The name the user set in the ME
+        #   "pylons": List (as a dict) of dicts of:
+        #       {"CLSID": class ID, "num": pylon number}
+        #   "tasks": List (as a dict) of task IDs the payload is used by.
+        # }
+        payloads = dcs_unit_type.load_payloads()
+        return PayloadIndex(
+            tuple(
+                Payload(payload["name"], dict(payload["pylons"]))
+                for payload in payloads.values()
+            )
+        )
+
+    @classmethod
+    def _payload_fingerprint(cls) -> bytes:
+        # Computed once per session, after the payload directories have been
+        # configured. Payloads edited in the mission editor while the game is running
+        # are not reloaded by pydcs either.
+        if cls._fingerprint is None:
+            digest = hashlib.sha256()
+            # The aircraft definitions of pydcs determine how its payloads are read,
+            # and they change between pydcs commits without a change of version.
+            for path in (Path(dcs.planes.__file__), Path(dcs.helicopters.__file__)):
+                cls._add_file_to_digest(digest, path)
+            # Every directory that pydcs loads payloads from, including the mission
+            # editor's saved payloads.
+            for directory in PayloadDirectories.payload_dirs():
+                digest.update(f"{directory}".encode("utf-8"))
+                if not directory.exists():
+                    continue
+                for path in sorted(directory.glob("*.lua")):
+                    cls._add_file_to_digest(digest, path)
+            cls._fingerprint = digest.digest()
+        return cls._fingerprint
+
+    @staticmethod
+    def _add_file_to_digest(digest: Any, path: Path) -> None:
+        stat = path.stat()
+        digest.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}".encode("utf-8"))
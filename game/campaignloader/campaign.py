@@ -7,11 +7,11 @@
 from pathlib import Path
 from typing import Any, Dict, TYPE_CHECKING, Tuple
 
-import yaml
 from packaging.version import Version
 
 from game import persistence
 from game.profiling import logged_duration
+from game.resourcecache import load_yaml
 from game.theater import ConflictTheater
 from game.theater.iadsnetwork.iadsnetwork import IadsNetwork
 from game.theater.theaterloader import TheaterLoader
@@ -60,8 +60,7 @@ class Campaign:
 
     @classmethod
     def from_file(cls, path: Path) -> Campaign:
-        with path.open(encoding="utf-8") as campaign_file:
-            data = yaml.safe_load(campaign_file)
+        data = load_yaml(path)
 
         version_field = data.get("version", "0")
         try:
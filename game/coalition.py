@@ -58,8 +58,10 @@ def __init__(
         # breaks less frequent. Each of these properties has a non-underscore-prefixed
         # @property that should be used for non-Optional access.
         #
-        # All of these are late-initialized (whether via on_load or called later), but
-        # will be non-None after the game has finished loading.
+        # These are computed on first access rather than on load, since computing them
+        # for a large theater takes several seconds and they are not needed to show the
+        # map. They are recomputed by compute_threat_zones and compute_nav_meshes when
+        # the game state that they depend on changes.
         self._threat_zone: Optional[ThreatZones] = None
         self._navmesh: Optional[NavMesh] = None
         self.on_load()
@@ -85,12 +87,16 @@ def opponent(self) -> Coalition:
 
     @property
     def threat_zone(self) -> ThreatZones:
-        assert self._threat_zone is not None
+        if self._threat_zone is None:
+            with logged_duration(f"Threat zone computation ({self.faction.name})"):
+                self._threat_zone = ThreatZones.for_faction(self.game, self.player)
         return self._threat_zone
 
     @property
     def nav_mesh(self) -> NavMesh:
-        assert self._navmesh is not None
+        if self._navmesh is None:
+            with logged_duration(f"Navmesh computation ({self.faction.name})"):
+                self._navmesh = self._build_nav_mesh()
         return self._navmesh
 
     @property
@@ -108,6 +114,8 @@ def __getstate__(self) -> dict[str, Any]:
 
     def __setstate__(self, state: dict[str, Any]) -> None:
         self.__dict__.update(state)
+        self._threat_zone = None
+        self._navmesh = None
         # Regenerate any state that was not persisted.
         self.on_load()
 
@@ -128,15 +136,25 @@ def adjust_budget(self, amount: float) -> None:
         self.budget += amount
 
     def compute_threat_zones(self, events: GameUpdateEvents) -> None:
-        self._threat_zone = ThreatZones.for_faction(self.game, self.player)
+        # Threat zones are recomputed whenever a TGO is bought or sold, so update the
+        # existing zones rather than rebuilding them so only the affected areas are
+        # recomputed.
+        self._threat_zone = ThreatZones.for_faction(
+            self.game, self.player, previous=self._threat_zone
+        )
         events.update_threat_zones(self.player, self._threat_zone)
 
     def compute_nav_meshes(self, events: GameUpdateEvents) -> None:
-        self._navmesh = NavMesh.from_threat_zones(
-            self.opponent.threat_zone, self.game.theater
-        )
+        self._navmesh = self._build_nav_mesh()
         events.update_navmesh(self.player, self._navmesh)
 
+    def _build_nav_mesh(self) -> NavMesh:
+        return NavMesh.from_threat_zones(
+            self.opponent.threat_zone,
+            self.game.theater,
+            use_portal_search=self.game.settings.fast_flight_routing,
+        )
+
     def update_transit_network(self) -> None:
         self.transit_network = TransitNetworkBuilder(
             self.game.theater, self.player
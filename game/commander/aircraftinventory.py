@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from game.ato.flighttype import FlightType
+    from game.squadrons import AirWing, Squadron
+    from game.theater import MissionTarget
+    from .missionproposals import ProposedFlight
+
+
+class AircraftInventory:
+    """Index of the squadrons that may be assigned each mission type this turn.
+
+    Fulfilling a package allocates aircraft, pilots and callsigns for each flight and
+    builds their flight plans, only for the planner to backtrack if any flight cannot
+    be fulfilled. The index is used to cheaply rule out packages that cannot possibly
+    be fulfilled before attempting to fulfill them.
+
+    The squadrons that may be assigned each mission type do not change while the
+    theater commander plans a turn, but the number of untasked aircraft and available
+    pilots in each squadron does, so those are checked each time.
+
+    Missions that could not be fulfilled are also recorded so that the planner does not
+    attempt them again until the inventory changes. Missions that fail to be fulfilled
+    return their aircraft and pilots, so the inventory only changes during planning when
+    a package is fulfilled. Each fulfilled package begins a new epoch.
+    """
+
+    def __init__(self, air_wing: AirWing) -> None:
+        self.epoch = 0
+        self.auto_plannable_tasks: set[FlightType] = set()
+        self.squadrons_for_task: dict[FlightType, list[Squadron]] = defaultdict(list)
+        self._unfulfillable: set[tuple[type, MissionTarget, int, int]] = set()
+        for squadron in air_wing.iter_squadrons():
+            self.auto_plannable_tasks.update(squadron.auto_assignable_mission_types)
+            # Matches the airfields that AirWing.best_squadrons_for considers.
+            location = squadron.location
+            if location.captured != air_wing.player or location.ferry_only:
+                continue
+            if not location.runway_is_operational():
+                continue
+            for task in squadron.auto_assignable_mission_types:
+                self.squadrons_for_task[task].append(squadron)
+
+    def can_auto_plan(self, task: FlightType) -> bool:
+        """Returns True if any squadron may be automatically assigned the task.
+
+        Equivalent to AirWing.can_auto_plan.
+        """
+        return task in self.auto_plannable_tasks
+
+    def may_fulfill(self, location: MissionTarget, flight: ProposedFlight) -> bool:
+        """Returns False if no squadron can currently fulfill the proposed flight.
+
+        A result of True does not guarantee that the flight can be fulfilled, since
+        other flights in the same package may claim the same aircraft.
+        """
+        for squadron in self.squadrons_for_task[flight.task]:
+            if squadron.can_auto_assign_mission(
+                location, flight.task, flight.num_aircraft, this_turn=True
+            ):
+                return True
+        return False
+
+    def known_unfulfillable(
+        self, task_type: type, target: MissionTarget, purchase_multiplier: int
+    ) -> bool:
+        """Returns True if the mission failed to be fulfilled during this epoch."""
+        return (
+            task_type,
+            target,
+            purchase_multiplier,
+            self.epoch,
+        ) in self._unfulfillable
+
+    def record_unfulfillable(
+        self, task_type: type, target: MissionTarget, purchase_multiplier: int
+    ) -> None:
+        self._unfulfillable.add((task_type, target, purchase_multiplier, self.epoch))
+
+    def record_fulfilled(self) -> None:
+        """Begins a new epoch after aircraft were claimed for a package."""
+        self.epoch += 1
+        self._unfulfillable.clear()
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import copy
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Union
+
+import numpy as np
+import numpy.typing as npt
+from shapely.geometry import Point as ShapelyPoint
+from shapely.strtree import STRtree
+
+from game.utils import Distance, meters
+
+if TYPE_CHECKING:
+    from game.theater import MissionTarget
+    from game.theater.theatergroundobject import IadsGroundObject, NavalGroundObject
+
+AirDefense = Union["IadsGroundObject", "NavalGroundObject"]
+
+
+class AirDefenseIndex:
+    """Spatial index of enemy air defenses for finding those that cover a target.
+
+    Planning a package checks which enemy air defenses threaten or can detect the
+    target. The index finds the air defenses within range of the target with a query
+    of an STRtree of their positions rather than by checking the range of every air
+    defense.
+
+    Air defenses that the planner has eliminated are removed with without(), which
+    returns a new index that shares the tree with this one.
+    """
+
+    def __init__(self, air_defenses: Iterable[AirDefense]) -> None:
+        self.air_defenses = tuple(air_defenses)
+        self._eliminated: frozenset[AirDefense] = frozenset()
+        self._tree = STRtree(
+            [ShapelyPoint(a.position.x, a.position.y) for a in self.air_defenses]
+        )
+        self._threat_ranges = np.array(
+            [a.max_threat_range().meters for a in self.air_defenses], dtype=np.float64
+        )
+        self._detection_ranges = np.array(
+            [a.max_detection_range().meters for a in self.air_defenses],
+            dtype=np.float64,
+        )
+
+    def without(self, air_defense: AirDefense) -> AirDefenseIndex:
+        index = copy.copy(self)
+        index._eliminated = self._eliminated | {air_defense}
+        return index
+
+    def threatening(self, target: MissionTarget) -> list[tuple[AirDefense, Distance]]:
+        """Returns the air defenses that threaten the target.
+
+        Each air defense is returned with the distance from the edge of its threat range
+        to the target, which is negative since the target is within range. Air defenses
+        are returned in the order they were indexed.
+        """
+        return self._covering(target, self._threat_ranges)
+
+    def detecting(self, target: MissionTarget) -> list[tuple[AirDefense, Distance]]:
+        """Returns the air defenses that can detect the target.
+
+        Each air defense is returned with the distance from the edge of its detection
+        range to the target, which is negative since the target is within range. Air
+        defenses are returned in the order they were indexed.
+        """
+        return self._covering(target, self._detection_ranges)
+
+    def _covering(
+        self, target: MissionTarget, ranges: npt.NDArray[np.float64]
+    ) -> list[tuple[AirDefense, Distance]]:
+        if not self.air_defenses:
+            return []
+        # The tree is queried with the longest range and the range of each candidate is
+        # checked afterwards. The margin accounts for rounding differences between the
+        # distances computed by GEOS and by MissionTarget.distance_to.
+        candidates = self._tree.query(
+            ShapelyPoint(target.position.x, target.position.y),
+            predicate="dwithin",
+            distance=ranges.max() + 1,
+        )
+        covering = []
+        for index in np.sort(candidates).tolist():
+            air_defense = self.air_defenses[index]
+            air_defense_range = float(ranges[index])
+            if not air_defense_range or air_defense in self._eliminated:
+                continue
+            distance_to_threat = meters(air_defense.distance_to(target)) - meters(
+                air_defense_range
+            )
+            if distance_to_threat > meters(0):
+                continue
+            covering.append((air_defense, distance_to_threat))
+        return covering
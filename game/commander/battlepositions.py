@@ -8,21 +8,22 @@
 from game.utils import meters
 
 
-@dataclass
+@dataclass(frozen=True)
 class BattlePositions:
-    blocking_capture: list[VehicleGroupGroundObject]
-    defending_front_line: list[VehicleGroupGroundObject]
+    blocking_capture: tuple[VehicleGroupGroundObject, ...]
+    defending_front_line: tuple[VehicleGroupGroundObject, ...]
 
     @property
     def in_priority_order(self) -> Iterator[VehicleGroupGroundObject]:
         yield from self.blocking_capture
         yield from self.defending_front_line
 
-    def eliminate(self, battle_position: VehicleGroupGroundObject) -> None:
-        if battle_position in self.blocking_capture:
-            self.blocking_capture.remove(battle_position)
-        if battle_position in self.defending_front_line:
-            self.defending_front_line.remove(battle_position)
+    def without(self, battle_position: VehicleGroupGroundObject) -> BattlePositions:
+        """Returns a copy of these battle positions with battle_position eliminated."""
+        return BattlePositions(
+            tuple(p for p in self.blocking_capture if p != battle_position),
+            tuple(p for p in self.defending_front_line if p != battle_position),
+        )
 
     def __contains__(self, item: VehicleGroupGroundObject) -> bool:
         return item in self.in_priority_order
@@ -49,4 +50,4 @@ def for_control_point(cls, control_point: ControlPoint) -> BattlePositions:
             else:
                 defending.append(battle_position)
 
-        return BattlePositions(blocking, defending)
+        return BattlePositions(tuple(blocking), tuple(defending))
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import math
-import operator
 from collections.abc import Iterable, Iterator
 from typing import TYPE_CHECKING, TypeVar
 
+import numpy as np
+
 from game.ato.closestairfields import ClosestAirfields, ObjectiveDistanceCache
 from game.theater import (
     Airfield,
@@ -73,16 +74,12 @@ def threatening_ships(self) -> Iterator[NavalGroundObject]:
     def _targets_by_range(
         self, targets: Iterable[MissionTargetType]
     ) -> Iterator[MissionTargetType]:
-        target_ranges: list[tuple[MissionTargetType, float]] = []
-        for target in targets:
-            ranges: list[float] = []
-            for cp in self.friendly_control_points():
-                ranges.append(target.distance_to(cp))
-            target_ranges.append((target, min(ranges)))
-
-        target_ranges = sorted(target_ranges, key=operator.itemgetter(1))
-        for target, _range in target_ranges:
-            yield target
+        target_list = list(targets)
+        ranges = self.game.theater.spatial_index.distances_to_closest_control_point(
+            target_list, self.is_player
+        )
+        for index in np.argsort(ranges, kind="stable"):
+            yield target_list[index]
 
     def strike_targets(self) -> Iterator[BuildingGroundObject]:
         """Iterates over enemy strike targets.
@@ -90,7 +87,7 @@ def strike_targets(self) -> Iterator[BuildingGroundObject]:
         Targets are sorted by their closest proximity to any friendly control
         point (airfield or fleet).
         """
-        targets: list[tuple[BuildingGroundObject, float]] = []
+        targets: list[BuildingGroundObject] = []
         # Building objectives are made of several individual TGOs (one per
         # building).
         found_targets: set[str] = set()
@@ -127,14 +124,9 @@ def strike_targets(self) -> Iterator[BuildingGroundObject]:
                     continue
                 if ground_object.name in found_targets:
                     continue
-                ranges: list[float] = []
-                for friendly_cp in self.friendly_control_points():
-                    ranges.append(ground_object.distance_to(friendly_cp))
-                targets.append((ground_object, min(ranges)))
+                targets.append(ground_object)
                 found_targets.add(ground_object.name)
-        targets = sorted(targets, key=operator.itemgetter(1))
-        for target, _range in targets:
-            yield target
+        yield from self._targets_by_range(targets)
 
     def front_lines(self) -> Iterator[FrontLine]:
         """Iterates over all active front lines in the theater."""
@@ -23,6 +23,7 @@
 if TYPE_CHECKING:
     from game.ato import Flight
     from game.coalition import Coalition
+    from .aircraftinventory import AircraftInventory
 
 
 class PackageFulfiller:
@@ -84,14 +85,19 @@ def plan_flight(
     ) -> None:
         if not builder.plan_flight(flight):
             missing_types.add(flight.task)
-            purchase_order = AircraftProcurementRequest(
-                near=mission.location,
-                task_capability=flight.task,
-                number=flight.num_aircraft * purchase_multiplier,
-            )
-            # Reserves are planned for critical missions, so prioritize those orders
-            # over aircraft needed for non-critical missions.
-            self.add_procurement_request(purchase_order)
+            self.request_aircraft(mission, flight, purchase_multiplier)
+
+    def request_aircraft(
+        self, mission: ProposedMission, flight: ProposedFlight, purchase_multiplier: int
+    ) -> None:
+        purchase_order = AircraftProcurementRequest(
+            near=mission.location,
+            task_capability=flight.task,
+            number=flight.num_aircraft * purchase_multiplier,
+        )
+        # Reserves are planned for critical missions, so prioritize those orders
+        # over aircraft needed for non-critical missions.
+        self.add_procurement_request(purchase_order)
 
     def scrub_mission_missing_aircraft(
         self,
@@ -108,8 +114,13 @@ def scrub_mission_missing_aircraft(
                 mission, flight, builder, missing_types, purchase_multiplier
             )
 
-        missing_types_str = ", ".join(sorted([t.name for t in missing_types]))
         builder.release_planned_aircraft()
+        self.log_missing_aircraft(mission, missing_types)
+
+    def log_missing_aircraft(
+        self, mission: ProposedMission, missing_types: Iterable[FlightType]
+    ) -> None:
+        missing_types_str = ", ".join(sorted([t.name for t in missing_types]))
         color = "Blue" if self.is_player else "Red"
         logging.debug(
             f"{color}: not enough aircraft in range for {mission.location.name} "
@@ -118,17 +129,61 @@ def scrub_mission_missing_aircraft(
 
     def check_needed_escorts(self, builder: PackageBuilder) -> Dict[EscortType, bool]:
         threats = defaultdict(bool)
-        for flight in builder.package.flights:
-            if self.threat_zones.waypoints_threatened_by_aircraft(
-                flight.flight_plan.escorted_waypoints()
-            ):
-                threats[EscortType.AirToAir] = True
-            if self.threat_zones.waypoints_threatened_by_radar_sam(
-                list(flight.flight_plan.escorted_waypoints())
-            ):
-                threats[EscortType.Sead] = True
+        paths = self.threat_zones.waypoint_paths(
+            flight.flight_plan.escorted_waypoints()
+            for flight in builder.package.flights
+        )
+        if self.threat_zones.paths_threatened_by_aircraft(paths).any():
+            threats[EscortType.AirToAir] = True
+        if self.threat_zones.paths_threatened_by_radar_sam(paths).any():
+            threats[EscortType.Sead] = True
         return threats
 
+    def screen_mission(
+        self,
+        mission: ProposedMission,
+        purchase_multiplier: int,
+        inventory: AircraftInventory,
+    ) -> bool:
+        """Returns False if the mission certainly cannot be fulfilled.
+
+        This is much cheaper than plan_mission because nothing is allocated, but a
+        mission that passes the screen may still fail to be planned. Missions that fail
+        the screen place the same aircraft purchase requests that plan_mission would,
+        except that the screen does not account for flights in the same package
+        claiming the same aircraft.
+        """
+        primary_flights = []
+        escorts = []
+        for proposed_flight in mission.flights:
+            if not inventory.can_auto_plan(proposed_flight.task):
+                continue
+            if proposed_flight.escort_type is None:
+                primary_flights.append(proposed_flight)
+            else:
+                escorts.append(proposed_flight)
+
+        if not primary_flights:
+            # plan_mission does not purchase aircraft for missions that this air wing
+            # can never plan.
+            return False
+
+        missing = [
+            f for f in primary_flights if not inventory.may_fulfill(mission.location, f)
+        ]
+        if not missing:
+            return True
+
+        # plan_mission plans the escorts of a failed mission to purchase any missing
+        # escort aircraft too.
+        missing.extend(
+            f for f in escorts if not inventory.may_fulfill(mission.location, f)
+        )
+        for flight in missing:
+            self.request_aircraft(mission, flight, purchase_multiplier)
+        self.log_missing_aircraft(mission, {f.task for f in missing})
+        return False
+
     def plan_mission(
         self,
         mission: ProposedMission,
@@ -69,7 +69,7 @@ def preconditions_met(self, state: TheaterState) -> bool:
         return self.have_sufficient_front_line_advantage
 
     def apply_effects(self, state: TheaterState) -> None:
-        state.front_line_stances[self.front_line] = self.stance
+        state.set_front_line_stance(self.front_line, self.stance)
 
     def execute(self, coalition: Coalition) -> None:
         self.friendly_cp.stances[self.enemy_cp.id] = self.stance
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import itertools
 import operator
 from abc import abstractmethod
 from dataclasses import dataclass, field
@@ -16,7 +15,6 @@
 from game.settings import AutoAtoBehavior
 from game.theater import MissionTarget
 from game.theater.theatergroundobject import IadsGroundObject, NavalGroundObject
-from game.utils import Distance, meters
 
 if TYPE_CHECKING:
     from game.coalition import Coalition
@@ -90,22 +88,43 @@ def purchase_multiplier(self) -> int:
         return 1
 
     def fulfill_mission(self, state: TheaterState) -> bool:
+        inventory = state.context.inventory
+        # The purchase multiplier is part of the key because it changes the purchase
+        # requests that a failed mission places.
+        if inventory.known_unfulfillable(
+            type(self), self.target, self.purchase_multiplier
+        ):
+            return False
+
         color = "blue" if state.context.coalition.player else "red"
         self.propose_flights()
+        mission = ProposedMission(self.target, self.flights)
         fulfiller = PackageFulfiller(
             state.context.coalition,
             state.context.theater,
             state.context.game_db.flights,
             state.context.settings,
         )
+        if not fulfiller.screen_mission(mission, self.purchase_multiplier, inventory):
+            inventory.record_unfulfillable(
+                type(self), self.target, self.purchase_multiplier
+            )
+            return False
+
         with state.context.tracer.trace(f"{color} {self.flights[0].task} planning"):
             self.package = fulfiller.plan_mission(
-                ProposedMission(self.target, self.flights),
+                mission,
                 self.purchase_multiplier,
                 state.context.now,
                 state.context.tracer,
             )
-        return self.package is not None
+        if self.package is None:
+            inventory.record_unfulfillable(
+                type(self), self.target, self.purchase_multiplier
+            )
+            return False
+        inventory.record_fulfilled()
+        return True
 
     def propose_common_escorts(self) -> None:
         self.propose_flight(FlightType.SEAD_ESCORT, 2, EscortType.Sead)
@@ -114,32 +133,16 @@ def propose_common_escorts(self) -> None:
     def iter_iads_ranges(
         self, state: TheaterState, range_type: RangeType
     ) -> Iterator[Union[IadsGroundObject, NavalGroundObject]]:
-        target_ranges: list[
-            tuple[Union[IadsGroundObject, NavalGroundObject], Distance]
-        ] = []
-        all_iads: Iterator[Union[IadsGroundObject, NavalGroundObject]] = (
-            itertools.chain(state.enemy_air_defenses, state.enemy_ships)
-        )
-        for target in all_iads:
-            distance = meters(target.distance_to(self.target))
-            if range_type is RangeType.Detection:
-                target_range = target.max_detection_range()
-            elif range_type is RangeType.Threat:
-                target_range = target.max_threat_range()
-            else:
-                raise ValueError(f"Unknown RangeType: {range_type}")
-            if not target_range:
-                continue
-
-            # IADS out of range of our target area will have a positive
-            # distance_to_threat and should be pruned. The rest have a decreasing
-            # distance_to_threat as overlap increases. The most negative distance has
-            # the greatest coverage of the target and should be treated as the highest
-            # priority threat.
-            distance_to_threat = distance - target_range
-            if distance_to_threat > meters(0):
-                continue
-            target_ranges.append((target, distance_to_threat))
+        # IADS out of range of our target area are not returned by the index. The rest
+        # have a decreasing distance_to_threat as overlap increases. The most negative
+        # distance has the greatest coverage of the target and should be treated as the
+        # highest priority threat.
+        if range_type is RangeType.Detection:
+            target_ranges = state.enemy_air_defense_index.detecting(self.target)
+        elif range_type is RangeType.Threat:
+            target_ranges = state.enemy_air_defense_index.threatening(self.target)
+        else:
+            raise ValueError(f"Unknown RangeType: {range_type}")
 
         # TODO: Prioritize IADS by vulnerability?
         target_ranges = sorted(target_ranges, key=operator.itemgetter(1))
@@ -16,7 +16,7 @@ def preconditions_met(self, state: TheaterState) -> bool:
         return self.target in state.aewc_targets
 
     def apply_effects(self, state: TheaterState) -> None:
-        state.aewc_targets.remove(self.target)
+        state.support_aewc_target(self.target)
 
     def propose_flights(self) -> None:
         self.propose_flight(FlightType.AEWC, 1)
@@ -26,7 +26,7 @@ def preconditions_met(self, state: TheaterState) -> bool:
         return super().preconditions_met(state)
 
     def apply_effects(self, state: TheaterState) -> None:
-        state.vulnerable_front_lines.remove(self.target)
+        state.cover_vulnerable_front_line(self.target)
 
     def propose_flights(self) -> None:
         self.propose_flight(FlightType.CAS, 2)
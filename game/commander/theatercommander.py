@@ -56,25 +56,28 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 from game.ato.starttype import StartType
 from game.commander.tasks.compound.nextaction import PlanNextAction
 from game.commander.tasks.theatercommandertask import TheaterCommanderTask
 from game.commander.theaterstate import TheaterState
 from game.htn import Planner
-from game.profiling import MultiEventTracer
+from game.profiling import MultiEventTracer, PlannerStats
 
 if TYPE_CHECKING:
     from game import Game
 
 
 class TheaterCommander(Planner[TheaterState, TheaterCommanderTask]):
-    def __init__(self, game: Game, player: bool) -> None:
+    def __init__(
+        self, game: Game, player: bool, stats: Optional[PlannerStats] = None
+    ) -> None:
         super().__init__(
             PlanNextAction(
                 aircraft_cold_start=game.settings.default_start_type is StartType.COLD
-            )
+            ),
+            stats,
         )
         self.game = game
         self.player = player
@@ -86,6 +89,11 @@ def plan_missions(self, now: datetime, tracer: MultiEventTracer) -> None:
             if result is None:
                 # Planned all viable tasks this turn.
                 return
+            coalition = self.game.coalition_for(self.player)
             for task in result.tasks:
-                task.execute(self.game.coalition_for(self.player))
+                if self.stats is None:
+                    task.execute(coalition)
+                    continue
+                with self.stats.trace(self.stats.executions, task):
+                    task.execute(coalition)
             state = result.end_state
@@ -3,11 +3,13 @@
 import dataclasses
 import itertools
 import math
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, TYPE_CHECKING, Union
+from typing import Optional, TYPE_CHECKING, TypeVar, Union
 
+from game.commander.aircraftinventory import AircraftInventory
+from game.commander.airdefenseindex import AirDefenseIndex
 from game.commander.battlepositions import BattlePositions
 from game.commander.objectivefinder import ObjectiveFinder
 from game.db import GameDb
@@ -40,59 +42,114 @@ class PersistentContext:
     now: datetime
     settings: Settings
     tracer: MultiEventTracer
+    inventory: AircraftInventory
+
+
+T = TypeVar("T")
+
+
+def without(items: tuple[T, ...], item: T) -> tuple[T, ...]:
+    """Returns a copy of items with the first occurrence of item removed.
+
+    Raises ValueError if item is not in items, matching list.remove.
+    """
+    index = items.index(item)
+    return items[:index] + items[index + 1 :]
 
 
 @dataclass
 class TheaterState(WorldState["TheaterState"]):
+    """The world state of the theater commander's HTN planner.
+
+    The planner clones the state for every compound task method it tries, but most
+    tasks change at most one or two fields, so clones share their collections. Every
+    field is an immutable tuple or a read-only mapping that is replaced rather than
+    modified when a task applies its effects, so only the fields that a task actually
+    changes are copied. Tasks must use the methods of this class to change the state.
+    """
+
     context: PersistentContext
-    barcaps_needed: dict[ControlPoint, int]
-    active_front_lines: list[FrontLine]
-    front_line_stances: dict[FrontLine, Optional[CombatStance]]
-    vulnerable_front_lines: list[FrontLine]
-    aewc_targets: list[MissionTarget]
-    refueling_targets: list[MissionTarget]
-    enemy_air_defenses: list[IadsGroundObject]
+    barcaps_needed: Mapping[ControlPoint, int]
+    active_front_lines: tuple[FrontLine, ...]
+    front_line_stances: Mapping[FrontLine, Optional[CombatStance]]
+    vulnerable_front_lines: tuple[FrontLine, ...]
+    aewc_targets: tuple[MissionTarget, ...]
+    refueling_targets: tuple[MissionTarget, ...]
+    enemy_air_defenses: tuple[IadsGroundObject, ...]
     threatening_air_defenses: list[Union[IadsGroundObject, NavalGroundObject]]
     detecting_air_defenses: list[Union[IadsGroundObject, NavalGroundObject]]
-    enemy_convoys: list[Convoy]
-    enemy_shipping: list[CargoShip]
-    enemy_ships: list[NavalGroundObject]
-    enemy_battle_positions: dict[ControlPoint, BattlePositions]
-    oca_targets: list[ControlPoint]
-    strike_targets: list[TheaterGroundObject]
-    enemy_barcaps: list[ControlPoint]
+    enemy_convoys: tuple[Convoy, ...]
+    enemy_shipping: tuple[CargoShip, ...]
+    enemy_ships: tuple[NavalGroundObject, ...]
+    enemy_air_defense_index: AirDefenseIndex
+    enemy_battle_positions: Mapping[ControlPoint, BattlePositions]
+    oca_targets: tuple[ControlPoint, ...]
+    strike_targets: tuple[TheaterGroundObject, ...]
+    enemy_barcaps: tuple[ControlPoint, ...]
     threat_zones: ThreatZones
 
-    def _rebuild_threat_zones(self) -> None:
-        """Recreates the theater's threat zones based on the current planned state."""
-        self.threat_zones = ThreatZones.for_threats(
-            self.context.theater,
-            self.context.coalition.opponent.doctrine,
-            barcap_locations=self.enemy_barcaps,
-            air_defenses=itertools.chain(self.enemy_air_defenses, self.enemy_ships),
-        )
-
     def eliminate_air_defense(self, target: IadsGroundObject) -> None:
         if target in self.threatening_air_defenses:
             self.threatening_air_defenses.remove(target)
         if target in self.detecting_air_defenses:
             self.detecting_air_defenses.remove(target)
-        self.enemy_air_defenses.remove(target)
-        self._rebuild_threat_zones()
+        self.enemy_air_defenses = without(self.enemy_air_defenses, target)
+        self.enemy_air_defense_index = self.enemy_air_defense_index.without(target)
+        self.threat_zones = self.threat_zones.without_threat(target)
 
     def eliminate_ship(self, target: NavalGroundObject) -> None:
         if target in self.threatening_air_defenses:
             self.threatening_air_defenses.remove(target)
         if target in self.detecting_air_defenses:
             self.detecting_air_defenses.remove(target)
-        self.enemy_ships.remove(target)
-        self._rebuild_threat_zones()
+        self.enemy_ships = without(self.enemy_ships, target)
+        self.enemy_air_defense_index = self.enemy_air_defense_index.without(target)
+        self.threat_zones = self.threat_zones.without_threat(target)
 
     def has_battle_position(self, target: VehicleGroupGroundObject) -> bool:
         return target in self.enemy_battle_positions[target.control_point]
 
     def eliminate_battle_position(self, target: VehicleGroupGroundObject) -> None:
-        self.enemy_battle_positions[target.control_point].eliminate(target)
+        positions = self.enemy_battle_positions[target.control_point]
+        self.enemy_battle_positions = {
+            **self.enemy_battle_positions,
+            target.control_point: positions.without(target),
+        }
+
+    def eliminate_convoy(self, target: Convoy) -> None:
+        self.enemy_convoys = without(self.enemy_convoys, target)
+
+    def eliminate_cargo_ship(self, target: CargoShip) -> None:
+        self.enemy_shipping = without(self.enemy_shipping, target)
+
+    def eliminate_oca_target(self, target: ControlPoint) -> None:
+        self.oca_targets = without(self.oca_targets, target)
+
+    def eliminate_strike_target(self, target: TheaterGroundObject) -> None:
+        self.strike_targets = without(self.strike_targets, target)
+
+    def cover_vulnerable_front_line(self, front_line: FrontLine) -> None:
+        self.vulnerable_front_lines = without(self.vulnerable_front_lines, front_line)
+
+    def deactivate_front_line(self, front_line: FrontLine) -> None:
+        self.active_front_lines = without(self.active_front_lines, front_line)
+
+    def set_front_line_stance(
+        self, front_line: FrontLine, stance: CombatStance
+    ) -> None:
+        self.front_line_stances = {**self.front_line_stances, front_line: stance}
+
+    def support_aewc_target(self, target: MissionTarget) -> None:
+        self.aewc_targets = without(self.aewc_targets, target)
+
+    def support_refueling_target(self, target: MissionTarget) -> None:
+        self.refueling_targets = without(self.refueling_targets, target)
+
+    def plan_barcap_round(self, target: ControlPoint) -> None:
+        self.barcaps_needed = {
+            **self.barcaps_needed,
+            target: self.barcaps_needed[target] - 1,
+        }
 
     def ammo_dumps_at(
         self, control_point: ControlPoint
@@ -106,36 +163,17 @@ def ammo_dumps_at(
 
     def clone(self) -> TheaterState:
         # Do not use copy.deepcopy. Copying every TGO, control point, etc is absurdly
-        # expensive.
-        return TheaterState(
-            context=self.context,
-            barcaps_needed=dict(self.barcaps_needed),
-            active_front_lines=list(self.active_front_lines),
-            front_line_stances=dict(self.front_line_stances),
-            vulnerable_front_lines=list(self.vulnerable_front_lines),
-            aewc_targets=list(self.aewc_targets),
-            refueling_targets=list(self.refueling_targets),
-            enemy_air_defenses=list(self.enemy_air_defenses),
-            enemy_convoys=list(self.enemy_convoys),
-            enemy_shipping=list(self.enemy_shipping),
-            enemy_ships=list(self.enemy_ships),
-            enemy_battle_positions={
-                cp: dataclasses.replace(g)
-                for cp, g in self.enemy_battle_positions.items()
-            },
-            oca_targets=list(self.oca_targets),
-            strike_targets=list(self.strike_targets),
-            enemy_barcaps=list(self.enemy_barcaps),
-            threat_zones=self.threat_zones,
-            # Persistent properties are not copied. These are a way for failed subtasks
-            # to communicate requirements to other tasks. For example, the task to
-            # attack enemy battle_positions might fail because the target area has IADS
-            # protection. In that case, the preconditions of PlanBai would fail, but
-            # would add the IADS that prevented it from being planned to the list of
-            # IADS threats so that DegradeIads will consider it a threat later.
-            threatening_air_defenses=self.threatening_air_defenses,
-            detecting_air_defenses=self.detecting_air_defenses,
-        )
+        # expensive. None of the fields are modified in place, so the clone can share
+        # all of them with this state.
+        #
+        # The persistent properties are shared deliberately, and are the only lists
+        # that are modified in place. These are a way for failed subtasks to
+        # communicate requirements to other tasks. For example, the task to attack
+        # enemy battle_positions might fail because the target area has IADS
+        # protection. In that case, the preconditions of PlanBai would fail, but would
+        # add the IADS that prevented it from being planned to the list of IADS threats
+        # so that DegradeIads will consider it a threat later.
+        return dataclasses.replace(self)
 
     @classmethod
     def from_game(
@@ -153,6 +191,7 @@ def from_game(
             now,
             game.settings,
             tracer,
+            AircraftInventory(coalition.air_wing),
         )
 
         # Plan enough rounds of CAP that the target has coverage over the expected
@@ -166,28 +205,33 @@ def from_game(
         if theater_refuling_point is not None:
             refueling_targets.append(theater_refuling_point)
 
+        enemy_air_defenses = tuple(finder.enemy_air_defenses())
+        enemy_ships = tuple(finder.enemy_ships())
         return TheaterState(
             context=context,
             barcaps_needed={
                 cp: barcap_rounds for cp in finder.vulnerable_control_points()
             },
-            active_front_lines=list(finder.front_lines()),
+            active_front_lines=tuple(finder.front_lines()),
             front_line_stances={f: None for f in finder.front_lines()},
-            vulnerable_front_lines=list(finder.front_lines()),
-            aewc_targets=[finder.farthest_friendly_control_point()],
-            refueling_targets=refueling_targets,
-            enemy_air_defenses=list(finder.enemy_air_defenses()),
+            vulnerable_front_lines=tuple(finder.front_lines()),
+            aewc_targets=(finder.farthest_friendly_control_point(),),
+            refueling_targets=tuple(refueling_targets),
+            enemy_air_defenses=enemy_air_defenses,
             threatening_air_defenses=[],
             detecting_air_defenses=[],
-            enemy_convoys=list(finder.convoys()),
-            enemy_shipping=list(finder.cargo_ships()),
-            enemy_ships=list(finder.enemy_ships()),
+            enemy_convoys=tuple(finder.convoys()),
+            enemy_shipping=tuple(finder.cargo_ships()),
+            enemy_ships=enemy_ships,
+            enemy_air_defense_index=AirDefenseIndex(
+                itertools.chain(enemy_air_defenses, enemy_ships)
+            ),
             enemy_battle_positions={
                 cp: BattlePositions.for_control_point(cp)
                 for cp in ordered_capturable_points
             },
-            oca_targets=list(finder.oca_targets(min_aircraft=20)),
-            strike_targets=list(finder.strike_targets()),
-            enemy_barcaps=list(game.theater.control_points_for(not player)),
+            oca_targets=tuple(finder.oca_targets(min_aircraft=20)),
+            strike_targets=tuple(finder.strike_targets()),
+            enemy_barcaps=tuple(game.theater.control_points_for(not player)),
             threat_zones=game.threat_zone_for(not player),
         )
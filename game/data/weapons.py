@@ -3,18 +3,20 @@
 import datetime
 import inspect
 import logging
+from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import unique, Enum
 from functools import cached_property
 from pathlib import Path
 from typing import Iterator, Optional, Any, ClassVar
 
-import yaml
 from dcs.flyingunit import FlyingUnit
+from dcs.unittype import FlyingType
 from dcs.weapons_data import weapon_ids
 
 from game.dcs.aircrafttype import AircraftType
 from game.factions.faction import Faction
+from game.resourcecache import load_yaml
 
 
 PydcsWeapon = Any
@@ -168,8 +170,7 @@ def named(cls, name: str) -> WeaponGroup:
     @classmethod
     def _each_weapon_group(cls) -> Iterator[WeaponGroup]:
         for group_file_path in Path("resources/weapons").glob("**/*.yaml"):
-            with group_file_path.open(encoding="utf8") as group_file:
-                data = yaml.safe_load(group_file)
+            data = load_yaml(group_file_path)
             name = data["name"]
             try:
                 weapon_type = WeaponType(data["type"])
@@ -228,7 +229,9 @@ def load_all(cls) -> None:
 @dataclass(frozen=True)
 class Pylon:
     number: int
-    allowed: set[Weapon]
+    allowed: frozenset[Weapon]
+
+    _by_dcs_type: ClassVar[dict[type[FlyingType], dict[int, Pylon]]] = {}
 
     def can_equip(self, weapon: Weapon) -> bool:
         # TODO: Fix pydcs to support the <CLEAN> "weapon".
@@ -256,29 +259,47 @@ def available_on(self, date: datetime.date, faction: Faction) -> Iterator[Weapon
 
     @classmethod
     def for_aircraft(cls, aircraft: AircraftType, number: int) -> Pylon:
+        pylon = cls._pylons_of(aircraft.dcs_unit_type).get(number)
+        if pylon is None:
+            return cls(number, frozenset())
+        return pylon
+
+    @classmethod
+    def iter_pylons(cls, aircraft: AircraftType) -> Iterator[Pylon]:
+        for pylon in sorted(list(aircraft.dcs_unit_type.pylons)):
+            yield cls.for_aircraft(aircraft, pylon)
+
+    @classmethod
+    def _pylons_of(cls, dcs_unit_type: type[FlyingType]) -> dict[int, Pylon]:
+        """Returns the pylons of the aircraft type indexed by number.
+
+        The pylons are read from the pydcs type on first use and memoized.
+        """
+        pylons = cls._by_dcs_type.get(dcs_unit_type)
+        if pylons is not None:
+            return pylons
+
         # In pydcs these are all arbitrary inner classes of the aircraft type.
         # The only way to identify them is by their name.
-        pylons = [
+        pylon_classes = [
             v
-            for v in aircraft.dcs_unit_type.__dict__.values()
+            for v in dcs_unit_type.__dict__.values()
             if inspect.isclass(v) and v.__name__.startswith("Pylon")
         ]
 
         # And that Pylon class has members with irrelevant names that have
         # values of (pylon number, allowed weapon).
-        allowed = set()
-        for pylon in pylons:
-            for key, value in pylon.__dict__.items():
+        allowed: dict[int, set[Weapon]] = defaultdict(set)
+        for pylon_class in pylon_classes:
+            for key, value in pylon_class.__dict__.items():
                 if key.startswith("__"):
                     continue
                 pylon_number, weapon = value
-                if pylon_number != number:
-                    continue
-                allowed.add(Weapon.with_clsid(weapon["clsid"]))
-
-        return cls(number, allowed)
-
-    @classmethod
-    def iter_pylons(cls, aircraft: AircraftType) -> Iterator[Pylon]:
-        for pylon in sorted(list(aircraft.dcs_unit_type.pylons)):
-            yield cls.for_aircraft(aircraft, pylon)
+                allowed[pylon_number].add(Weapon.with_clsid(weapon["clsid"]))
+
+        pylons = {
+            number: cls(number, frozenset(weapons))
+            for number, weapons in allowed.items()
+        }
+        cls._by_dcs_type[dcs_unit_type] = pylons
+        return pylons
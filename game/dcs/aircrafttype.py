@@ -391,6 +391,18 @@ def priority_list_for_task(cls, task: FlightType) -> list[AircraftType]:
                 capable.append(aircraft)
         return list(reversed(sorted(capable, key=lambda a: a.task_priority(task))))
 
+    @classmethod
+    @cache
+    def priority_ranks_for_task(cls, task: FlightType) -> dict[AircraftType, int]:
+        """Returns the position of each aircraft in priority_list_for_task.
+
+        The result is cached and must not be modified.
+        """
+        return {
+            aircraft: rank
+            for rank, aircraft in enumerate(cls.priority_list_for_task(task))
+        }
+
     def iter_task_capabilities(self) -> Iterator[FlightType]:
         yield from self.task_priorities
 
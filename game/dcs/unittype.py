@@ -7,10 +7,10 @@
 from pathlib import Path
 from typing import ClassVar, Generic, Iterator, Self, Type, TypeVar, Any
 
-import yaml
 from dcs.unittype import UnitType as DcsUnitType
 
 from game.data.units import UnitClass
+from game.resourcecache import load_yaml
 
 DcsUnitTypeT = TypeVar("DcsUnitTypeT", bound=Type[DcsUnitType])
 
@@ -65,8 +65,7 @@ def _each_variant_of(cls, unit: DcsUnitTypeT) -> Iterator[Self]:
             logging.warning(f"No data for {unit.id}; it will not be available")
             return
 
-        with data_path.open(encoding="utf-8") as data_file:
-            data = yaml.safe_load(data_file)
+        data = load_yaml(data_path)
 
         for variant_id, variant_data in data.get("variants", {unit.id: {}}).items():
             if variant_data is None:
@@ -79,6 +78,12 @@ def _variant_from_dict(
     ) -> Self:
         raise NotImplementedError
 
+    @classmethod
+    def load_all(cls) -> None:
+        """Loads the data for every unit type, if it has not already been loaded."""
+        if not cls._loaded:
+            cls._load_all()
+
     @classmethod
     def _load_all(cls) -> None:
         for unit_type in cls.each_dcs_type():
@@ -6,9 +6,8 @@
 from collections.abc import Iterator
 from pathlib import Path
 
-import yaml
-
 from game import persistence
+from game.resourcecache import load_yaml
 from .faction import Faction
 
 
@@ -56,14 +55,14 @@ def load(cls) -> Factions:
         factions = {}
         for path in cls.iter_faction_files():
             try:
-                with path.open("r", encoding="utf-8") as fdata:
-                    if path.suffix == ".yaml":
-                        data = yaml.safe_load(fdata)
-                    else:
+                if path.suffix == ".yaml":
+                    data = load_yaml(path)
+                else:
+                    with path.open("r", encoding="utf-8") as fdata:
                         data = json.load(fdata)
-                    faction = Faction.from_dict(data)
-                    factions[faction.name] = faction
-                    logging.info("Loaded faction from %s", path)
+                faction = Faction.from_dict(data)
+                factions[faction.name] = faction
+                logging.info("Loaded faction from %s", path)
             except Exception:
                 logging.exception(f"Unable to load faction from %s", path)
 
@@ -25,6 +25,9 @@ def update_state(
         state.finish()
         return duration
 
+    def next_event_time(self, time: datetime) -> datetime | None:
+        return None
+
     def describe(self) -> str:
         return "Searching for targets"
 
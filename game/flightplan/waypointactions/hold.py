@@ -39,6 +39,9 @@ def update_state(
             return time - push_time
         return timedelta()
 
+    def next_event_time(self, time: datetime) -> datetime:
+        return self._push_time_provider()
+
     def iter_tasks(self, ctx: TaskContext) -> Iterator[Task]:
         remaining_time = self._push_time_provider() - ctx.mission_start_time
         if remaining_time <= timedelta():
@@ -24,3 +24,13 @@ def update_state(
 
     @abstractmethod
     def iter_tasks(self, ctx: TaskContext) -> Iterator[Task]: ...
+
+    def next_event_time(self, time: datetime) -> datetime | None:
+        """Returns the earliest time at which the action may finish.
+
+        Until then, the action is assumed to consume all the time it is ticked with.
+        None means that the action finishes on its next tick without consuming any
+        time. The default implementation requests the next tick, which is always
+        correct.
+        """
+        return time
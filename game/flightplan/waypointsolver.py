@@ -6,13 +6,14 @@
 from typing import TYPE_CHECKING, Any
 
 from dcs import Point
-from dcs.mapping import Point as DcsPoint
 from dcs.terrain import Terrain
-from numpy import float64, array
+from numpy import float64, column_stack
 from numpy._typing import NDArray
 from shapely import transform, to_geojson
 from shapely.geometry.base import BaseGeometry
 
+from game.theater.projection import TerrainProjection
+
 if TYPE_CHECKING:
     from .waypointstrategy import WaypointStrategy
 
@@ -39,17 +40,13 @@ def to_geojson(self, geometry: BaseGeometry) -> dict[str, Any]:
             return json.loads(to_geojson(geometry))
 
         assert self._terrain is not None
-        origin = DcsPoint(0, 0, self._terrain)
+        projection = TerrainProjection.for_terrain(self._terrain)
 
         def xy_to_ll(points: NDArray[float64]) -> NDArray[float64]:
-            ll_points = []
-            for point in points:
-                p = origin.new_in_same_map(point[0], point[1])
-                latlng = p.latlng()
-                # Longitude is unintuitively first because it's the "X" coordinate:
-                # https://datatracker.ietf.org/doc/html/rfc7946#section-3.1.1
-                ll_points.append([latlng.lng, latlng.lat])
-            return array(ll_points)
+            lat, lng = projection.xy_to_latlng(points[:, 0], points[:, 1])
+            # Longitude is unintuitively first because it's the "X" coordinate:
+            # https://datatracker.ietf.org/doc/html/rfc7946#section-3.1.1
+            return column_stack((lng, lat))
 
         transformed = transform(geometry, xy_to_ll)
         return json.loads(to_geojson(transformed))
@@ -3,9 +3,8 @@
 from pathlib import Path
 from typing import Any
 
-from dcs.mapping import Point as DcsPoint, LatLng
 from dcs.terrain import Terrain
-from numpy import float64, array
+from numpy import float64, column_stack
 from numpy._typing import NDArray
 from shapely import transform
 from shapely.geometry import shape
@@ -14,6 +13,7 @@
 from game.data.doctrine import Doctrine
 from .ipsolver import IpSolver
 from .waypointsolver import WaypointSolver
+from ..theater.projection import TerrainProjection
 from ..theater.theaterloader import TERRAINS_BY_NAME
 
 
@@ -25,14 +25,13 @@ def geometry_ll_to_xy(geometry: BaseGeometry, terrain: Terrain) -> BaseGeometry:
     if geometry.is_empty:
         return geometry
 
+    projection = TerrainProjection.for_terrain(terrain)
+
     def ll_to_xy(points: NDArray[float64]) -> NDArray[float64]:
-        ll_points = []
-        for point in points:
-            # Longitude is unintuitively first because it's the "X" coordinate:
-            # https://datatracker.ietf.org/doc/html/rfc7946#section-3.1.1
-            p = DcsPoint.from_latlng(LatLng(point[1], point[0]), terrain)
-            ll_points.append([p.x, p.y])
-        return array(ll_points)
+        # Longitude is unintuitively first because it's the "X" coordinate:
+        # https://datatracker.ietf.org/doc/html/rfc7946#section-3.1.1
+        x, y = projection.latlng_to_xy(points[:, 1], points[:, 0])
+        return column_stack((x, y))
 
     return transform(geometry, ll_to_xy)
 
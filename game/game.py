@@ -26,7 +26,7 @@
 from .infos.information import Information
 from .lasercodes.lasercoderegistry import LaserCodeRegistry
 from .persistence import SaveManager
-from .profiling import logged_duration
+from .profiling import log_cache_stats, logged_duration
 from .settings import Settings
 from .theater import ConflictTheater
 from .theater.bullseye import Bullseye
@@ -135,11 +135,14 @@ def __init__(
 
         for control_point in self.theater.controlpoints:
             control_point.finish_init(self)
+        # The campaign loader used the spatial index before the control points were
+        # fully initialized.
+        self.theater.invalidate_spatial_index()
 
         self.blue.configure_default_air_wing(air_wing_config)
         self.red.configure_default_air_wing(air_wing_config)
 
-        self.on_load(game_still_initializing=True)
+        self.on_load()
 
     def __setstate__(self, state: dict[str, Any]) -> None:
         self.__dict__.update(state)
@@ -214,7 +217,13 @@ def coalition_for(self, player: bool) -> Coalition:
     def adjust_budget(self, amount: float, player: bool) -> None:
         self.coalition_for(player).adjust_budget(amount)
 
-    def on_load(self, game_still_initializing: bool = False) -> None:
+    def on_load(self) -> None:
+        """Regenerates the state that is not persisted.
+
+        Threat zones and navmeshes are not computed here. They are computed the first
+        time they are used, since computing them for both coalitions takes longer than
+        the rest of loading the game.
+        """
         from .sim import GameUpdateEvents
 
         if not hasattr(self, "name_generator"):
@@ -228,16 +237,16 @@ def on_load(self, game_still_initializing: bool = False) -> None:
 
         # The installed plugins may have changed between runs. We need to load the
         # current configuration and patch in the options that were previously set.
-        new_plugin_manager = LuaPluginManager.load()
-        new_plugin_manager.update_with(self.lua_plugin_manager)
-        self.lua_plugin_manager = new_plugin_manager
+        with logged_duration("Loading Lua plugins"):
+            new_plugin_manager = LuaPluginManager.load()
+            new_plugin_manager.update_with(self.lua_plugin_manager)
+            self.lua_plugin_manager = new_plugin_manager
 
         ObjectiveDistanceCache.set_theater(self.theater)
-        self.compute_unculled_zones(GameUpdateEvents())
-        if not game_still_initializing:
-            # We don't need to push events that happen during load. The UI will fully
-            # reset when we're done.
-            self.compute_threat_zones(GameUpdateEvents())
+        # We don't need to push events that happen during load. The UI will fully reset
+        # when we're done.
+        with logged_duration("Computing culling positions"):
+            self.compute_unculled_zones(GameUpdateEvents())
 
     def finish_turn(self, events: GameUpdateEvents, skipped: bool = False) -> None:
         """Finalizes the current turn and advances to the next turn.
@@ -441,6 +450,7 @@ def initialize_turn(
         with logged_duration("Computing culling positions"):
             self.compute_unculled_zones(events)
 
+        log_cache_stats()
         events.begin_new_turn()
 
     def message(self, title: str, text: str = "") -> None:
@@ -6,6 +6,8 @@
 from dataclasses import dataclass
 from typing import Any, Generic, Optional, TypeVar
 
+from game.profiling import PlannerStats
+
 WorldStateT = TypeVar("WorldStateT", bound="WorldState[Any]")
 
 
@@ -65,8 +67,12 @@ def pop(self) -> PlanningState[WorldStateT, PrimitiveTaskT]:
 
 
 class Planner(Generic[WorldStateT, PrimitiveTaskT]):
-    def __init__(self, main_task: Task[WorldStateT]) -> None:
+    def __init__(
+        self, main_task: Task[WorldStateT], stats: Optional[PlannerStats] = None
+    ) -> None:
         self.main_task = main_task
+        # Profiling is opt-in because it adds a timer to every step of planning.
+        self.stats = stats
 
     def plan(
         self, initial_state: WorldStateT
@@ -78,8 +84,8 @@ def plan(
         while planning_state.tasks_to_process:
             task = planning_state.tasks_to_process.popleft()
             if isinstance(task, PrimitiveTask):
-                if task.preconditions_met(planning_state.state):
-                    task.apply_effects(planning_state.state)
+                if self._preconditions_met(task, planning_state.state):
+                    self._apply_effects(task, planning_state.state)
                     # Ignore type erasure. We've already verified that this is a Planner
                     # with a WorldStateT and a PrimitiveTaskT, so we know that the task
                     # list is a list of CompoundTask[WorldStateT] and PrimitiveTaskT. We
@@ -88,7 +94,7 @@ def plan(
                     # isinstance.
                     planning_state.plan.append(task)  # type: ignore
                 else:
-                    planning_state = history.pop()
+                    planning_state = self._backtrack(history)
             else:
                 assert isinstance(task, CompoundTask)
                 # If the methods field of our current state is not None that means we're
@@ -102,14 +108,14 @@ def plan(
                 else:
                     methods = planning_state.methods
                 try:
-                    method = next(methods)
+                    method = self._next_method(task, methods)
                     # Push the current node back onto the stack so that we resume
                     # handling this task when we pop back to this state.
                     resume_tasks: deque[Task[WorldStateT]] = deque([task])
                     resume_tasks.extend(planning_state.tasks_to_process)
                     history.push(
                         PlanningState(
-                            planning_state.state.clone(),
+                            self._clone(planning_state.state),
                             resume_tasks,
                             planning_state.plan,
                             methods,
@@ -119,8 +125,58 @@ def plan(
                     planning_state.tasks_to_process.extendleft(reversed(method))
                 except StopIteration:
                     try:
-                        planning_state = history.pop()
+                        planning_state = self._backtrack(history)
                     except IndexError:
                         # No valid plan was found.
+                        if self.stats is not None:
+                            self.stats.plans_failed += 1
                         return None
+        if self.stats is not None:
+            self.stats.plans_found += 1
         return PlanningResult(planning_state.plan, planning_state.state)
+
+    def _preconditions_met(
+        self, task: PrimitiveTask[WorldStateT], state: WorldStateT
+    ) -> bool:
+        if self.stats is None:
+            return task.preconditions_met(state)
+        with self.stats.trace(self.stats.preconditions, task):
+            met = task.preconditions_met(state)
+        if not met:
+            self.stats.preconditions_failed[type(task).__name__] += 1
+        return met
+
+    def _apply_effects(
+        self, task: PrimitiveTask[WorldStateT], state: WorldStateT
+    ) -> None:
+        if self.stats is None:
+            task.apply_effects(state)
+            return
+        with self.stats.trace(self.stats.effects, task):
+            task.apply_effects(state)
+
+    def _next_method(
+        self,
+        task: CompoundTask[WorldStateT],
+        methods: Iterator[Method[WorldStateT]],
+    ) -> Method[WorldStateT]:
+        # each_valid_method is a generator for most tasks, so the work of decomposing
+        # the task happens when the next method is requested.
+        if self.stats is None:
+            return next(methods)
+        with self.stats.trace(self.stats.decompositions, task):
+            return next(methods)
+
+    def _clone(self, state: WorldStateT) -> WorldStateT:
+        if self.stats is None:
+            return state.clone()
+        with self.stats.trace(self.stats.clones, state):
+            return state.clone()
+
+    def _backtrack(
+        self, history: PlanningHistory[WorldStateT, PrimitiveTaskT]
+    ) -> PlanningState[WorldStateT, PrimitiveTaskT]:
+        planning_state = history.pop()
+        if self.stats is not None:
+            self.stats.backtracks += 1
+        return planning_state
@@ -2,10 +2,12 @@
 
 import heapq
 import math
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Set, Tuple, Union
 
+import numpy as np
+import shapely
 from dcs.mapping import Point
 from shapely.geometry import (
     LineString,
@@ -15,7 +17,9 @@
     box,
 )
 from shapely.ops import nearest_points, triangulate
+from shapely.strtree import STRtree
 
+from game.profiling import cache_stats
 from game.theater import ConflictTheater
 from game.threatzones import ThreatZones
 from game.utils import nautical_miles
@@ -90,30 +94,319 @@ def pop(self) -> Optional[NavPoint]:
             return None
 
 
+# Travel through a threatened nav poly is weighted by this factor.
+THREATENED_COST_MODIFIER = 3.0
+
+# The maximum number of routes remembered by each nav mesh.
+ROUTE_CACHE_SIZE = 1024
+
+# Route endpoints are rounded to this many meters when looking up cached routes.
+ROUTE_CACHE_RESOLUTION = 100
+
+# Origin poly, destination poly, and the rounded origin and destination coordinates.
+RouteKey = Tuple[int, int, int, int, int, int]
+
+_route_cache_stats = cache_stats("Nav mesh route cache")
+
+
+def _cross(ax: float, ay: float, bx: float, by: float) -> float:
+    return ax * by - ay * bx
+
+
+class NavMeshPortals:
+    """The adjacency of a nav mesh in a compact form for path searches.
+
+    Polys are identified by their index in the mesh's poly list. The portals of poly i
+    are the entries [offsets[i], offsets[i + 1]) of the other arrays. Each portal is
+    the edge that poly i shares with the poly neighbors[j], and spans from starts[j]
+    to ends[j].
+    """
+
+    def __init__(self, polys: List[NavMeshPoly]) -> None:
+        index_of = {navpoly: i for i, navpoly in enumerate(polys)}
+        offsets = [0]
+        neighbors: list[int] = []
+        endpoints: list[tuple[float, float, float, float]] = []
+        for navpoly in polys:
+            for neighbor, boundary in navpoly.neighbors.items():
+                # Polys that share only a vertex are neighbors too, so that portal
+                # is a single point. The point-based search also routes through
+                # those, and there may be no other way around a gap in the mesh.
+                coords = shapely.get_coordinates(boundary)
+                (start_x, start_y), (end_x, end_y) = coords[0], coords[-1]
+                neighbors.append(index_of[neighbor])
+                endpoints.append((start_x, start_y, end_x, end_y))
+            offsets.append(len(neighbors))
+
+        self.offsets = np.array(offsets, dtype=np.int64)
+        self.neighbors = np.array(neighbors, dtype=np.int64)
+        portal_coords = np.array(endpoints, dtype=np.float64).reshape(-1, 4)
+        self.starts = portal_coords[:, :2]
+        self.ends = portal_coords[:, 2:]
+        self.centroids = shapely.get_coordinates(
+            shapely.centroid([p.poly for p in polys])
+        ).reshape(-1, 2)
+        self.cost_modifiers = np.array(
+            [THREATENED_COST_MODIFIER if p.threatened else 1.0 for p in polys],
+            dtype=np.float64,
+        )
+
+        # The search itself is scalar code, and indexing into lists of Python floats
+        # is much faster than indexing into numpy arrays one element at a time, so
+        # unpack the arrays into per-poly lists of (neighbor, x0, y0, x1, y1).
+        rows = [
+            (n, *coords)
+            for n, coords in zip(self.neighbors.tolist(), portal_coords.tolist())
+        ]
+        self._offsets = self.offsets.tolist()
+        self._adjacency = [
+            rows[start:end] for start, end in zip(self._offsets[:-1], self._offsets[1:])
+        ]
+        self._cost_modifiers = self.cost_modifiers.tolist()
+        self._centroids = self.centroids.tolist()
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def search(
+        self,
+        origin: tuple[float, float],
+        origin_id: int,
+        destination: tuple[float, float],
+        destination_id: int,
+    ) -> Optional[list[tuple[int, int]]]:
+        """Finds the sequence of polys to travel through from origin to destination.
+
+        A* over the portals of the mesh. As in the point-based search, the position at
+        which the path enters each poly is the point on the portal closest to the
+        position at which the path entered the previous poly. The search state is the
+        poly and the portal it was entered through, since the best way to reach a
+        poly through one portal may not be the best way to continue from it.
+
+        The point-based search also keeps every distinct entry point into each portal.
+        Keeping only the cheapest one means that this search very occasionally finds
+        a slightly longer route than that one would have, which is accepted in
+        exchange for a search that is orders of magnitude faster.
+
+        Returns:
+            The list of (poly id, portal index) pairs traversed, starting with the
+            origin poly and ending with the destination poly. The portal index is the
+            portal used to enter the poly, and is -1 for the origin. None if there is
+            no path.
+        """
+        dest_x, dest_y = destination
+        origin_state = (origin_id, -1)
+        goal = (len(self), -1)
+        best_known: dict[tuple[int, int], float] = {origin_state: 0.0}
+        entry_points: dict[tuple[int, int], tuple[float, float]] = {
+            origin_state: origin
+        }
+        came_from: dict[tuple[int, int], Optional[tuple[int, int]]] = {
+            origin_state: None
+        }
+        closed: set[tuple[int, int]] = set()
+        frontier: list[tuple[float, tuple[int, int]]] = [(0.0, origin_state)]
+        while frontier:
+            _, state = heapq.heappop(frontier)
+            if state == goal:
+                break
+            if state in closed:
+                continue
+            closed.add(state)
+
+            current = state[0]
+            cost = best_known[state]
+            x, y = entry_points[state]
+            modifier = self._cost_modifiers[current]
+            if current == destination_id:
+                goal_cost = cost + math.hypot(dest_x - x, dest_y - y) * modifier
+                if goal_cost < best_known.get(goal, math.inf):
+                    best_known[goal] = goal_cost
+                    came_from[goal] = state
+                    heapq.heappush(frontier, (goal_cost, goal))
+
+            previous = came_from[state]
+            offset = self._offsets[current]
+            for i, (neighbor, x0, y0, x1, y1) in enumerate(self._adjacency[current]):
+                if previous is not None and neighbor == previous[0]:
+                    # Don't backtrack.
+                    continue
+                neighbor_state = (neighbor, offset + i)
+                if neighbor_state in closed:
+                    continue
+                # Closest point to (x, y) on the portal segment.
+                dx = x1 - x0
+                dy = y1 - y0
+                length_sq = dx * dx + dy * dy
+                t = 0.0
+                if length_sq > 0:
+                    t = min(max(((x - x0) * dx + (y - y0) * dy) / length_sq, 0.0), 1.0)
+                px = x0 + t * dx
+                py = y0 + t * dy
+                neighbor_cost = cost + math.hypot(px - x, py - y) * modifier
+                if neighbor_cost < best_known.get(neighbor_state, math.inf):
+                    best_known[neighbor_state] = neighbor_cost
+                    entry_points[neighbor_state] = (px, py)
+                    came_from[neighbor_state] = state
+                    estimated = neighbor_cost + math.hypot(dest_x - px, dest_y - py)
+                    heapq.heappush(frontier, (estimated, neighbor_state))
+
+        if goal not in came_from:
+            return None
+
+        corridor: list[tuple[int, int]] = []
+        corridor_state = came_from[goal]
+        while corridor_state is not None:
+            corridor.append(corridor_state)
+            corridor_state = came_from[corridor_state]
+        corridor.reverse()
+        return corridor
+
+    def string_pull(
+        self,
+        origin: tuple[float, float],
+        destination: tuple[float, float],
+        corridor: list[tuple[int, int]],
+    ) -> list[tuple[float, float]]:
+        """Finds the shortest path from origin to destination through the corridor.
+
+        This is the "simple stupid funnel algorithm" described at
+        http://digestingduck.blogspot.com/2010/03/simple-stupid-funnel-algorithm.html.
+        """
+        portals = [(origin, origin)]
+        for (previous, _), (_, portal) in zip(corridor, corridor[1:]):
+            x0, y0 = self.starts[portal].tolist()
+            x1, y1 = self.ends[portal].tolist()
+            # Orient the portal relative to the direction of travel, which is from
+            # the center of the previous poly across the portal.
+            cx, cy = self._centroids[previous]
+            mx = (x0 + x1) / 2
+            my = (y0 + y1) / 2
+            if _cross(mx - cx, my - cy, x0 - mx, y0 - my) > 0:
+                portals.append(((x0, y0), (x1, y1)))
+            else:
+                portals.append(((x1, y1), (x0, y0)))
+        portals.append((destination, destination))
+
+        path = [origin]
+        apex = left = right = origin
+        apex_index = left_index = right_index = 0
+        i = 1
+        while i < len(portals):
+            new_left, new_right = portals[i]
+
+            # Try to narrow the funnel from the right.
+            if (
+                _cross(
+                    right[0] - apex[0],
+                    right[1] - apex[1],
+                    new_right[0] - apex[0],
+                    new_right[1] - apex[1],
+                )
+                >= 0
+            ):
+                if apex == right or (
+                    _cross(
+                        new_right[0] - apex[0],
+                        new_right[1] - apex[1],
+                        left[0] - apex[0],
+                        left[1] - apex[1],
+                    )
+                    > 0
+                ):
+                    right = new_right
+                    right_index = i
+                else:
+                    # The right side crossed over the left. The left point is a
+                    # corner of the path, so restart the funnel from there.
+                    path.append(left)
+                    apex = right = left
+                    apex_index = right_index = left_index
+                    i = apex_index + 1
+                    continue
+
+            # Try to narrow the funnel from the left.
+            if (
+                _cross(
+                    new_left[0] - apex[0],
+                    new_left[1] - apex[1],
+                    left[0] - apex[0],
+                    left[1] - apex[1],
+                )
+                >= 0
+            ):
+                if apex == left or (
+                    _cross(
+                        right[0] - apex[0],
+                        right[1] - apex[1],
+                        new_left[0] - apex[0],
+                        new_left[1] - apex[1],
+                    )
+                    > 0
+                ):
+                    left = new_left
+                    left_index = i
+                else:
+                    path.append(right)
+                    apex = left = right
+                    apex_index = left_index = right_index
+                    i = apex_index + 1
+                    continue
+
+            i += 1
+
+        if path[-1] != destination:
+            path.append(destination)
+        return path
+
+
 class NavMesh:
-    def __init__(self, polys: List[NavMeshPoly], theater: ConflictTheater) -> None:
+    def __init__(
+        self,
+        polys: List[NavMeshPoly],
+        theater: ConflictTheater,
+        use_portal_search: bool = False,
+    ) -> None:
         self.polys = polys
         self.theater = theater
+        # Spatial index over the nav polys. The indices returned by queries are
+        # indices into self.polys.
+        self._index = STRtree([p.poly for p in polys])
+        self.portals: Optional[NavMeshPortals] = None
+        if use_portal_search:
+            self.portals = NavMeshPortals(polys)
+        # Routes are only valid for the mesh that produced them. The coalition
+        # replaces its mesh rather than modifying it when threats change, so the
+        # cache is dropped along with the outdated mesh.
+        self._route_cache: OrderedDict[RouteKey, List[Point]] = OrderedDict()
 
     def localize(self, point: Point) -> Optional[NavMeshPoly]:
-        # This is a naive implementation but it's O(n). Runs at about 10k
-        # lookups a second on a 5950X. Flights usually have 5-10 waypoints, so
-        # that's 1k-2k flights before we lose a full second to localization as a
-        # part of flight plan creation.
+        poly_id = self._localize_id(point)
+        if poly_id is None:
+            return None
+        return self.polys[poly_id]
+
+    def _localize_id(self, point: Point) -> Optional[int]:
+        # Large theaters with many threats produce meshes with thousands of
+        # triangles, and every leg of every flight plan is localized twice, so a
+        # linear scan of the polys was too slow. The index narrows the candidates
+        # down to the polys whose bounding boxes contain the point before checking
+        # for intersection.
         #
-        # Can improve the algorithm later if needed, but that seems unnecessary
-        # currently.
-        p = ShapelyPoint(point.x, point.y)
-        for navpoly in self.polys:
-            if navpoly.poly.intersects(p):
-                return navpoly
-        return None
+        # A point on a shared edge intersects more than one poly. Take the lowest
+        # index to match the behavior of a linear scan of self.polys.
+        candidates = self._index.query(
+            ShapelyPoint(point.x, point.y), predicate="intersects"
+        )
+        if not len(candidates):
+            return None
+        return int(min(candidates))
 
     @staticmethod
     def travel_cost(a: NavPoint, b: NavPoint) -> float:
         modifier = 1.0
         if a.poly.threatened:
-            modifier = 3.0
+            modifier = THREATENED_COST_MODIFIER
         return a.point.distance(b.point) * modifier
 
     def travel_heuristic(self, a: NavPoint, b: NavPoint) -> float:
@@ -144,20 +437,83 @@ def dcs_to_shapely_point(point: Point) -> ShapelyPoint:
         return ShapelyPoint(point.x, point.y)
 
     def shortest_path(self, origin: Point, destination: Point) -> List[Point]:
-        origin_poly = self.localize(origin)
-        if origin_poly is None:
+        origin_id = self._localize_id(origin)
+        if origin_id is None:
             raise NavMeshError(f"Origin point {origin} is outside the navmesh")
-        destination_poly = self.localize(destination)
-        if destination_poly is None:
+        destination_id = self._localize_id(destination)
+        if destination_id is None:
             raise NavMeshError(
                 f"Destination point {destination} is outside the navmesh"
             )
 
+        # Mission planning and flight plan recreation route the same legs (airbase
+        # to target area and back) many times per turn, so remember recent routes.
+        key = (
+            origin_id,
+            destination_id,
+            round(origin.x / ROUTE_CACHE_RESOLUTION),
+            round(origin.y / ROUTE_CACHE_RESOLUTION),
+            round(destination.x / ROUTE_CACHE_RESOLUTION),
+            round(destination.y / ROUTE_CACHE_RESOLUTION),
+        )
+        cached = self._route_cache.get(key)
+        if cached is None:
+            _route_cache_stats.record_miss()
+            cached = self._find_path(origin, origin_id, destination, destination_id)
+            self._route_cache[key] = cached
+            if len(self._route_cache) > ROUTE_CACHE_SIZE:
+                self._route_cache.popitem(last=False)
+        else:
+            _route_cache_stats.record_hit()
+            self._route_cache.move_to_end(key)
+
+        # The cached route may have been found for slightly different endpoints, so
+        # replace those with the requested ones. This also prevents the caller from
+        # modifying the cached list.
+        path = list(cached)
+        path[0] = Point(origin.x, origin.y, self.theater.terrain)
+        path[-1] = Point(destination.x, destination.y, self.theater.terrain)
+        return path
+
+    def _find_path(
+        self,
+        origin: Point,
+        origin_id: int,
+        destination: Point,
+        destination_id: int,
+    ) -> List[Point]:
+        if self.portals is not None:
+            return self._portal_shortest_path(
+                origin, origin_id, destination, destination_id
+            )
+
         return self._shortest_path(
-            NavPoint(self.dcs_to_shapely_point(origin), origin_poly),
-            NavPoint(self.dcs_to_shapely_point(destination), destination_poly),
+            NavPoint(self.dcs_to_shapely_point(origin), self.polys[origin_id]),
+            NavPoint(
+                self.dcs_to_shapely_point(destination), self.polys[destination_id]
+            ),
         )
 
+    def _portal_shortest_path(
+        self,
+        origin: Point,
+        origin_id: int,
+        destination: Point,
+        destination_id: int,
+    ) -> List[Point]:
+        assert self.portals is not None
+        origin_xy = (origin.x, origin.y)
+        destination_xy = (destination.x, destination.y)
+        corridor = self.portals.search(
+            origin_xy, origin_id, destination_xy, destination_id
+        )
+        if corridor is None:
+            raise NavMeshError(f"Could not find path to {destination} from {origin}")
+        return [
+            Point(x, y, self.theater.terrain)
+            for x, y in self.portals.string_pull(origin_xy, destination_xy, corridor)
+        ]
+
     def _shortest_path(self, origin: NavPoint, destination: NavPoint) -> List[Point]:
         # Adapted from
         # https://www.redblobgames.com/pathfinding/a-star/implementation.py.
@@ -218,8 +574,10 @@ def map_bounds(theater: ConflictTheater) -> Polygon:
     def create_navpolys(
         polys: List[Polygon], threat_zones: ThreatZones
     ) -> List[NavMeshPoly]:
+        threatened = threat_zones.geometries_threatened(polys)
         return [
-            NavMeshPoly(i, p, threat_zones.threatened(p)) for i, p in enumerate(polys)
+            NavMeshPoly(i, p, bool(t))
+            for i, (p, t) in enumerate(zip(polys, threatened))
         ]
 
     @staticmethod
@@ -248,7 +606,10 @@ def associate_neighbors(polys: List[NavMeshPoly]) -> None:
 
     @classmethod
     def from_threat_zones(
-        cls, threat_zones: ThreatZones, theater: ConflictTheater
+        cls,
+        threat_zones: ThreatZones,
+        theater: ConflictTheater,
+        use_portal_search: bool = False,
     ) -> NavMesh:
         # Simplify the threat poly to reduce the number of nav zones. Increase
         # the size of the zone and then simplify it with the buffer size as the
@@ -272,4 +633,4 @@ def from_threat_zones(
         # Triangulate the safe-region to build the navmesh.
         navpolys = cls.create_navpolys(triangulate(bounds), threat_zones)
         cls.associate_neighbors(navpolys)
-        return NavMesh(navpolys, theater)
+        return NavMesh(navpolys, theater, use_portal_search)
@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+from game import resourcecache
+
 _dcs_saved_game_folder: Path | None = None
 
 
@@ -10,6 +12,7 @@ def set_dcs_save_game_directory(user_folder: Path) -> None:
     _dcs_saved_game_folder = user_folder
     if not save_dir().exists():
         save_dir().mkdir(parents=True)
+    resourcecache.configure(user_folder)
 
 
 def base_path() -> str:
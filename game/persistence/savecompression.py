@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import lzma
+import zlib
+from enum import Enum, unique
+from typing import Optional
+from zipfile import ZIP_DEFLATED, ZIP_LZMA, ZIP_STORED
+
+# The lowest zlib level is several times faster than the default, and the pickled game
+# is mostly repetitive enough that the saves are not much larger.
+DEFLATE_LEVEL = 1
+
+
+@unique
+class SaveCompression(Enum):
+    """The compression used for the games stored in a save game bundle.
+
+    The compression method is recorded by the zip file for each member of the bundle,
+    so bundles can be loaded regardless of the compression they were saved with,
+    including saves from older versions that always used LZMA.
+    """
+
+    #: Smallest saves, but compressing a late campaign game takes several seconds.
+    LZMA = "LZMA"
+    #: Fast zlib compression. Saves are larger than with LZMA.
+    DEFLATE = "Deflate"
+    #: No compression. Fastest to write and load, but saves are several times larger.
+    NONE = "None"
+
+    @property
+    def zip_compression(self) -> int:
+        return {
+            SaveCompression.LZMA: ZIP_LZMA,
+            SaveCompression.DEFLATE: ZIP_DEFLATED,
+            SaveCompression.NONE: ZIP_STORED,
+        }[self]
+
+    @property
+    def compress_level(self) -> Optional[int]:
+        if self is SaveCompression.DEFLATE:
+            return DEFLATE_LEVEL
+        return None
+
+    def compress(self, data: bytes) -> bytes:
+        """Compresses data outside of a zip member.
+
+        The result begins with a tag for the compression, so decompress does not need
+        to know which compression was used.
+        """
+        if self is SaveCompression.LZMA:
+            return b"L" + lzma.compress(data)
+        if self is SaveCompression.DEFLATE:
+            return b"Z" + zlib.compress(data, DEFLATE_LEVEL)
+        return b"N" + data
+
+    @staticmethod
+    def decompress(data: bytes) -> bytes:
+        tag = data[:1]
+        if tag == b"L":
+            return lzma.decompress(data[1:])
+        if tag == b"Z":
+            return zlib.decompress(data[1:])
+        if tag == b"N":
+            return data[1:]
+        raise ValueError(f"Unknown compression tag {tag!r}")
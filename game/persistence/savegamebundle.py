@@ -1,25 +1,72 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 import pickle
 import shutil
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import ExitStack
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import TYPE_CHECKING
-from zipfile import ZIP_LZMA, ZipFile
+from typing import TYPE_CHECKING, Union
+from zipfile import ZIP_STORED, ZipFile, ZipInfo
+
+from shapely.geometry.base import BaseGeometry
 
 from game.profiling import logged_duration
-from game.zipfileext import ZipFileExt
+from . import segmentedpickle
+from .savecompression import SaveCompression
+from .segmentedpickle import (
+    NotSegmentableError,
+    Segment,
+    SegmentLoader,
+    SegmentedSnapshot,
+)
 
 if TYPE_CHECKING:
     from game import Game
 
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# A game pickled as a whole, or in segments.
+Snapshot = Union[bytes, SegmentedSnapshot]
+
+# Marks the members that hold the manifest of a segmented snapshot rather than a
+# pickled game. Saves from earlier versions only contain pickled games.
+MANIFEST_COMMENT = b"liberation-segments-2"
+
+# The segments of a snapshot are compressed together in packs, since segments have much
+# in common (such as the names of the classes they pickle) that compressing each segment
+# on its own would store once per segment. Each pack is stored in this directory of the
+# bundle, named by the SHA-256 of the digests of its segments. Snapshots that share a
+# pack share the member.
+PACK_DIRECTORY = "segments/"
+
+# A pack ends after each segment whose SHA-256 begins with a byte below this, so packs
+# hold 16 segments on average. The boundaries depend only on the segments, so a pack is
+# shared by two snapshots unless one of its segments changed.
+PACK_BOUNDARY = 256 // 16
+
+# A pack also ends once it holds this many bytes, which bounds the size of a pack that
+# must be decompressed to load any one of its segments.
+MAX_PACK_SIZE = 4 * 1024 * 1024
+
+# The root segment of a snapshot, and the type, pack digest, offset within the pack and
+# length of each segment.
+Manifest = tuple[int, dict[int, tuple[type, bytes, int, int]]]
+
 
 class SaveGameBundle:
     """The bundle of saved game assets.
 
     A save game bundle includes the pickled game object (as well as some backups of
     other game states, like the turn start and previous turn) and the state.json.
+
+    Each game is stored as a manifest of the segments it was pickled in (see
+    segmentedpickle). The segments are compressed in packs that are stored once for all
+    games in the bundle, since the games in a bundle are usually similar. Bundles written by earlier versions
+    store each game as a single pickle.
     """
 
     MANUAL_SAVE_NAME = "player.liberation"
@@ -89,35 +136,107 @@ def load_pre_sim_checkpoint(self) -> Game:
         return self._load_from(self.PRE_SIM_CHECKPOINT_SAVE_NAME)
 
     def _load_from(self, name: str) -> Game:
-        with ZipFile(self.bundle_path) as zip_bundle:
-            with zip_bundle.open(name, "r") as save:
-                game = pickle.load(save)
+        # Game.on_load runs as part of unpickling the game and logs its own phases.
+        with logged_duration(f"Loading {name} from {self.bundle_path}"):
+            with ZipFile(self.bundle_path) as zip_bundle:
+                info = zip_bundle.getinfo(name)
+                if info.comment == MANIFEST_COMMENT:
+                    game = self._load_segmented(zip_bundle, info)
+                else:
+                    with zip_bundle.open(info, "r") as save:
+                        game = pickle.load(save)
                 game.save_manager.set_loaded_from(self)
                 return game
 
-    def _update_bundle_member(
-        self, game: Game, name: str, copy_from: SaveGameBundle | None
+    @staticmethod
+    def _load_segmented(zip_bundle: ZipFile, info: ZipInfo) -> Game:
+        manifest: Manifest = pickle.loads(zip_bundle.read(info))
+        root, segments = manifest
+        # Each pack is decompressed once, the first time one of its segments is read.
+        packs: dict[bytes, bytes] = {}
+
+        def read_segment(key: int) -> bytes:
+            _, pack_digest, offset, length = segments[key]
+            if (pack := packs.get(pack_digest)) is None:
+                pack = SaveCompression.decompress(
+                    zip_bundle.read(_pack_name(pack_digest))
+                )
+                packs[pack_digest] = pack
+            return pack[offset : offset + length]
+
+        loader = SegmentLoader(
+            {key: location[0] for key, location in segments.items()}, read_segment
+        )
+        return loader.object_for(root)
+
+    @staticmethod
+    def snapshot(game: Game) -> Snapshot:
+        """Returns the pickled game to be written to a bundle with write_members.
+
+        Pickling captures the state of the game at the time of the call, so the game
+        can continue to change while the snapshot is compressed and written.
+
+        The game is pickled in segments when possible, which are only written to the
+        bundle if the bundle does not already contain them. Otherwise, the game is
+        pickled as a whole.
+        """
+        try:
+            return segmentedpickle.snapshot(
+                game, _segment_types(), _value_types(), _promoted_objects
+            )
+        except NotSegmentableError as ex:
+            logging.warning("Saving the game without segments: %s", ex)
+            return pickle.dumps(game, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def write_members(
+        self,
+        members: Mapping[str, Snapshot],
+        compression: SaveCompression,
+        copy_from: SaveGameBundle | None,
     ) -> None:
+        """Writes the given snapshots to the bundle, replacing any existing members.
+
+        The other members of copy_from are copied to the bundle. The bundle is replaced
+        atomically, so an error or crash while writing leaves the existing bundle
+        intact.
+        """
         # Perform all save work in a copy of the current save to avoid corrupting the
-        # save if there's an error while saving.
+        # save if there's an error while saving. The copy is created next to the save
+        # so that it can be moved over the save, rather than copied.
         with NamedTemporaryFile(
-            "wb", suffix=".liberation.zip", delete=False
+            "wb",
+            dir=self.bundle_path.parent,
+            prefix=f".{self.bundle_path.name}.",
+            suffix=".tmp",
+            delete=False,
         ) as temp_save_file:
             temp_file_path = Path(temp_save_file.name)
 
-        # We don't have all the state to create the temporary save from scratch (no last
-        # turn, start of turn, etc.), so copy the existing save to create the temp save.
-        #
-        # Python doesn't actually support overwriting or removing zipfile members, so we
-        # have to create a new zipfile and copy over only the files that we won't be
-        # writing.
-        if copy_from is not None and copy_from.bundle_path.exists():
-            shutil.copy(copy_from.bundle_path, temp_file_path)
-            ZipFileExt.remove_member(temp_file_path, name, missing_ok=True)
-
-        with ZipFile(temp_file_path, "a", compression=ZIP_LZMA) as zip_bundle:
-            with zip_bundle.open(name, "w") as entry:
-                pickle.dump(game, entry)
+        try:
+            with ExitStack() as exit_stack:
+                zip_bundle = exit_stack.enter_context(
+                    ZipFile(
+                        temp_file_path,
+                        "w",
+                        compression=compression.zip_compression,
+                        compresslevel=compression.compress_level,
+                    )
+                )
+                # We don't have all the state to create the temporary save from
+                # scratch (no last turn, start of turn, etc.), so copy the other
+                # members of the existing save into the temp save.
+                #
+                # Python doesn't support overwriting or removing zipfile members, so
+                # the members are streamed from one archive to the other in a single
+                # pass rather than copying the archive and then rewriting it without
+                # the members we're about to write.
+                source = None
+                if copy_from is not None and copy_from.bundle_path.exists():
+                    source = exit_stack.enter_context(ZipFile(copy_from.bundle_path))
+                self._write_bundle(zip_bundle, members, compression, source)
+        except BaseException:
+            temp_file_path.unlink(missing_ok=True)
+            raise
 
         try:
             temp_file_path.replace(self.bundle_path)
@@ -134,3 +253,157 @@ def _update_bundle_member(
                 self.bundle_path,
                 temp_file_path,
             )
+
+    def _update_bundle_member(
+        self, game: Game, name: str, copy_from: SaveGameBundle | None
+    ) -> None:
+        self.write_members(
+            {name: self.snapshot(game)}, game.settings.save_compression, copy_from
+        )
+
+    @staticmethod
+    def _write_bundle(
+        zip_bundle: ZipFile,
+        members: Mapping[str, Snapshot],
+        compression: SaveCompression,
+        source: ZipFile | None,
+    ) -> None:
+        manifests: dict[str, bytes] = {}
+        pack_digests: set[bytes] = set()
+        source_packs: set[str] = set()
+        if source is not None:
+            for info in source.infolist():
+                if info.filename.startswith(PACK_DIRECTORY):
+                    source_packs.add(info.filename)
+                elif info.filename in members:
+                    continue
+                elif info.comment == MANIFEST_COMMENT:
+                    manifest_data = source.read(info)
+                    manifests[info.filename] = manifest_data
+                    _, kept_segments = pickle.loads(manifest_data)
+                    pack_digests.update(p for _, p, _, _ in kept_segments.values())
+                else:
+                    # Members are written with the compression of the destination, so
+                    # saves from older versions are converted as they are copied.
+                    with source.open(info) as source_member:
+                        with zip_bundle.open(info.filename, "w") as destination_member:
+                            while chunk := source_member.read(COPY_CHUNK_SIZE):
+                                destination_member.write(chunk)
+
+        new_packs: dict[bytes, list[bytes]] = {}
+        for name, snapshot in members.items():
+            if isinstance(snapshot, bytes):
+                zip_bundle.writestr(name, snapshot)
+                continue
+            digests = {
+                key: hashlib.sha256(segment.data).digest()
+                for key, segment in snapshot.segments.items()
+            }
+            locations: dict[bytes, tuple[bytes, int, int]] = {}
+            unique_segments = {
+                digest: snapshot.segments[key] for key, digest in digests.items()
+            }
+            for pack in _iter_packs(unique_segments.items()):
+                pack_digest = hashlib.sha256(b"".join(d for d, _ in pack)).digest()
+                offset = 0
+                for digest, segment in pack:
+                    locations[digest] = (pack_digest, offset, len(segment.data))
+                    offset += len(segment.data)
+                new_packs[pack_digest] = [segment.data for _, segment in pack]
+            segments: dict[int, tuple[type, bytes, int, int]] = {}
+            for key, digest in digests.items():
+                pack_digest, offset, length = locations[digest]
+                segments[key] = (
+                    snapshot.segments[key].type,
+                    pack_digest,
+                    offset,
+                    length,
+                )
+            manifest: Manifest = (snapshot.root, segments)
+            manifests[name] = pickle.dumps(manifest, protocol=pickle.HIGHEST_PROTOCOL)
+            pack_digests.update(new_packs)
+
+        # Only the packs used by a manifest are written, which drops the packs that were
+        # only used by the snapshots being replaced. Packs are compressed before they
+        # are stored so that packs already in the bundle can be copied without being
+        # decompressed and compressed again.
+        for digest in pack_digests:
+            pack_name = _pack_name(digest)
+            if source is not None and pack_name in source_packs:
+                pack_data = source.read(pack_name)
+            else:
+                pack_data = compression.compress(b"".join(new_packs[digest]))
+            zip_bundle.writestr(pack_name, pack_data, compress_type=ZIP_STORED)
+
+        for name, manifest_data in manifests.items():
+            manifest_info = ZipInfo(name, date_time=time.localtime()[:6])
+            manifest_info.comment = MANIFEST_COMMENT
+            zip_bundle.writestr(
+                manifest_info,
+                manifest_data,
+                compress_type=compression.zip_compression,
+                compresslevel=compression.compress_level,
+            )
+
+
+def _pack_name(digest: bytes) -> str:
+    return f"{PACK_DIRECTORY}{digest.hex()}"
+
+
+def _iter_packs(
+    segments: Iterable[tuple[bytes, Segment]],
+) -> Iterator[list[tuple[bytes, Segment]]]:
+    """Groups segments, with their digests, into the packs they are compressed in.
+
+    Segments are ordered by type so that similar segments are compressed together, and
+    then by digest so that the order does not depend on the order they were pickled in.
+    """
+    pack: list[tuple[bytes, Segment]] = []
+    size = 0
+    for digest, segment in sorted(
+        segments, key=lambda s: (s[1].type.__module__, s[1].type.__qualname__, s[0])
+    ):
+        pack.append((digest, segment))
+        size += len(segment.data)
+        if digest[0] < PACK_BOUNDARY or size >= MAX_PACK_SIZE:
+            yield pack
+            pack = []
+            size = 0
+    if pack:
+        yield pack
+
+
+def _segment_types() -> tuple[type, ...]:
+    """Returns the types of the objects that are pickled as their own segments.
+
+    These are the objects that often do not change between two snapshots of a game.
+    """
+    # Imported here since these modules (indirectly) import this one.
+    from game.ato import Flight, Package
+    from game.ato.airtaaskingorder import AirTaskingOrder
+    from game.coalition import Coalition
+    from game.squadrons import AirWing, Squadron
+    from game.theater import ConflictTheater, ControlPoint
+    from game.theater.theatergroundobject import TheaterGroundObject
+
+    return (
+        AirTaskingOrder,
+        AirWing,
+        Coalition,
+        ConflictTheater,
+        ControlPoint,
+        Flight,
+        Package,
+        Squadron,
+        TheaterGroundObject,
+    )
+
+
+def _value_types() -> tuple[type, ...]:
+    # Shapely geometries are immutable, so they can be copied into each segment.
+    return (BaseGeometry,)
+
+
+# The objects that were shared between segments of the last snapshot. See
+# segmentedpickle.snapshot.
+_promoted_objects: dict[int, type] = {}
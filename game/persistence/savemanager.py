@@ -8,10 +8,14 @@
 from qt_ui import liberation_install
 from .paths import save_dir
 from .savegamebundle import SaveGameBundle
+from .savewriter import SaveWriter
 
 if TYPE_CHECKING:
     from game.game import Game
 
+# Shared by every game, since the writer is not part of the saved game state.
+_save_writer = SaveWriter()
+
 
 class SaveManager:
     def __init__(self, game: Game) -> None:
@@ -36,6 +40,10 @@ def default_save_bundle(self) -> SaveGameBundle:
         return SaveGameBundle(self.default_save_location)
 
     def save_player(self, override_destination: Path | None = None) -> None:
+        # Player saves are written immediately so that the player knows the game was
+        # saved, and errors are reported. Any queued autosaves are written first, since
+        # this save may copy them from the same bundle.
+        self.flush()
         copy_from = self.last_saved_bundle
         with self._save_bundle_context(override_destination) as bundle:
             self.player_save_location = bundle.bundle_path
@@ -44,16 +52,28 @@ def save_player(self, override_destination: Path | None = None) -> None:
             liberation_install.save_config()
 
     def save_last_turn(self) -> None:
-        with self._save_bundle_context() as bundle:
-            bundle.save_last_turn(self.game)
+        """Queues the last turn save. See SaveGameBundle.save_last_turn."""
+        self._save_in_background(SaveGameBundle.LAST_TURN_SAVE_NAME)
 
     def save_start_of_turn(self) -> None:
-        with self._save_bundle_context() as bundle:
-            bundle.save_start_of_turn(self.game)
+        """Queues the start of turn save. See SaveGameBundle.save_start_of_turn."""
+        self._save_in_background(SaveGameBundle.START_OF_TURN_SAVE_NAME)
 
     def save_pre_sim_checkpoint(self) -> None:
+        """Queues the pre-sim checkpoint.
+
+        See SaveGameBundle.save_pre_sim_checkpoint.
+        """
+        self._save_in_background(SaveGameBundle.PRE_SIM_CHECKPOINT_SAVE_NAME)
+
+    @staticmethod
+    def flush() -> None:
+        """Blocks until every queued save has been written."""
+        _save_writer.flush()
+
+    def _save_in_background(self, name: str) -> None:
         with self._save_bundle_context() as bundle:
-            bundle.save_pre_sim_checkpoint(self.game)
+            _save_writer.submit(bundle, name, self.game, copy_from=bundle)
 
     def set_loaded_from(self, bundle: SaveGameBundle) -> None:
         """Reconfigures this save manager based on the loaded game.
@@ -86,18 +106,22 @@ def _save_bundle_context(
             raise
 
     def load_pre_sim_checkpoint(self) -> Game:
+        self.flush()
         return self.default_save_bundle.load_pre_sim_checkpoint()
 
     @staticmethod
     def load_last_turn(bundle_path: Path) -> Game:
+        SaveManager.flush()
         return SaveGameBundle(bundle_path).load_last_turn()
 
     @staticmethod
     def load_start_of_turn(bundle_path: Path) -> Game:
+        SaveManager.flush()
         return SaveGameBundle(bundle_path).load_start_of_turn()
 
     @staticmethod
     def load_player_save(bundle_path: Path) -> Game:
+        SaveManager.flush()
         return SaveGameBundle(bundle_path).load_player()
 
     @staticmethod
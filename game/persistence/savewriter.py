@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from game.profiling import logged_duration
+from .savecompression import SaveCompression
+from .savegamebundle import SaveGameBundle, Snapshot
+
+if TYPE_CHECKING:
+    from game import Game
+
+
+@dataclass
+class PendingWrite:
+    bundle: SaveGameBundle
+    copy_from: SaveGameBundle | None
+    compression: SaveCompression
+    #: Snapshots to write, by bundle member name.
+    members: dict[str, Snapshot] = field(default_factory=dict)
+
+    def write(self) -> None:
+        with logged_duration(f"Writing {', '.join(self.members)} to save bundle"):
+            self.bundle.write_members(self.members, self.compression, self.copy_from)
+
+
+class SaveWriter:
+    """Writes save game bundles on a background thread.
+
+    The game is pickled on the caller's thread, which captures its state at the time of
+    the save and is much faster than compressing and writing the bundle. The snapshot is
+    then queued for the writer thread.
+
+    Snapshots queued for a bundle that has not yet been written are written together,
+    so a bundle is only rewritten once for several saves in quick succession, such as
+    the last turn and start of turn saves made when the turn ends. A newer snapshot of
+    the same member replaces the queued one.
+
+    Errors on the writer thread are logged rather than raised, since the code that
+    queued the save has already moved on.
+    """
+
+    def __init__(self) -> None:
+        # Keyed by bundle path, in the order the bundles will be written.
+        self._pending: dict[Path, PendingWrite] = {}
+        self._writing = False
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def submit(
+        self,
+        bundle: SaveGameBundle,
+        name: str,
+        game: Game,
+        copy_from: SaveGameBundle | None,
+    ) -> None:
+        """Snapshots the game and queues it to be written to the named bundle member."""
+        with logged_duration(f"Snapshotting {name}"):
+            data = SaveGameBundle.snapshot(game)
+
+        with self._condition:
+            pending = self._pending.get(bundle.bundle_path)
+            if pending is None:
+                pending = PendingWrite(
+                    bundle, copy_from, game.settings.save_compression
+                )
+                self._pending[bundle.bundle_path] = pending
+            else:
+                pending.compression = game.settings.save_compression
+            pending.members[name] = data
+            self._start()
+            self._condition.notify_all()
+
+    def flush(self) -> None:
+        """Blocks until every queued save has been written."""
+        with self._condition:
+            while self._pending or self._writing:
+                self._condition.wait()
+
+    def _start(self) -> None:
+        if self._thread is not None:
+            return
+        # A daemon thread does not keep the process alive on its own, but the queue is
+        # flushed at exit so that the last saves are not lost.
+        self._thread = threading.Thread(
+            target=self._run, name="SaveWriter", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+                pending = self._pending.pop(next(iter(self._pending)))
+                self._writing = True
+
+            try:
+                pending.write()
+            except Exception:
+                logging.exception(
+                    "Failed to write save game %s", pending.bundle.bundle_path
+                )
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
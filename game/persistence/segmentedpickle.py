@@ -0,0 +1,315 @@
+"""Pickles an object graph as separate segments that can be shared between snapshots.
+
+A game is pickled as one segment for the game object and one for each object of the
+given root types (control points, squadrons, packages, etc.). Each segment is an
+ordinary pickle of the object's state in which references to the other segments are
+persistent IDs. A snapshot of a game that changed only slightly since the last one
+shares most of its segments with that snapshot, so a save bundle only needs to store
+the segments that changed.
+
+Segments refer to each other by the id() of their object, so segments of unchanged
+objects are identical between snapshots taken in the same session.
+
+Pickling preserves the identity of shared objects, which pickling each segment on its
+own would not. An object that would be pickled by more than one segment is found while
+pickling the segments and is split into its own segment, and the segments are pickled
+again. If such an object cannot be restored from its own segment (because it has a
+custom __reduce__, for example) the graph cannot be segmented and NotSegmentableError
+is raised.
+
+Loading replicates the order in which pickle restores objects: a segment is restored
+the first time it is referenced, before the object that referenced it. Objects that
+implement __setstate__ see the same partially restored objects (for cycles) that they
+would when loading a single pickle.
+"""
+
+from __future__ import annotations
+
+import copyreg
+import datetime
+import io
+import pickle
+import sys
+import types
+import uuid
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from decimal import Decimal
+from enum import Enum
+from fractions import Fraction
+from pathlib import PurePath
+from typing import Any
+
+# Objects of these types have no identity that needs to be preserved, either because
+# they are immutable or because they are pickled by reference.
+VALUE_TYPES: tuple[type, ...] = (
+    str,
+    bytes,
+    int,
+    float,
+    complex,
+    bool,
+    type(None),
+    tuple,
+    frozenset,
+    range,
+    slice,
+    type,
+    Enum,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.ModuleType,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    datetime.tzinfo,
+    uuid.UUID,
+    Decimal,
+    Fraction,
+    PurePath,
+)
+
+# Builtin containers that can be restored from their own segment.
+CONTAINER_TYPES: tuple[type, ...] = (list, dict, set)
+
+# The number of times a snapshot is pickled again after finding shared objects before
+# giving up.
+MAX_PASSES = 4
+
+
+class NotSegmentableError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class Segment:
+    #: The type of the object, which is created before its state is restored.
+    type: type
+    #: The pickled state of the object.
+    data: bytes
+
+
+@dataclass(frozen=True)
+class SegmentedSnapshot:
+    root: int
+    segments: dict[int, Segment]
+
+
+# The kinds of objects pickled by a snapshot. Plain ints rather than an enum since the
+# kind is checked for every object that is pickled.
+_VALUE = 0
+_IDENTITY = 1
+_ROOT = 2
+
+
+class _Snapshotter:
+    def __init__(
+        self,
+        root_types: tuple[type, ...],
+        value_types: tuple[type, ...],
+        promoted: dict[int, type],
+        obj: Any,
+    ) -> None:
+        self.root_types = root_types
+        self.value_types = VALUE_TYPES + value_types
+        self.promoted = promoted
+        self.kinds: dict[type, int] = {}
+        self.segments: dict[int, Segment] = {}
+        self.pending: list[Any] = []
+        # Maps the id() of each object that is not a segment to the segment that
+        # pickled it.
+        self.owners: dict[int, int] = {}
+        self.shared: dict[int, Any] = {}
+        # Keeps every pickled object alive until the snapshot is complete so that
+        # id()s are not reused.
+        self.alive: list[Any] = [obj]
+
+    def kind(self, obj_type: type) -> int:
+        if issubclass(obj_type, self.value_types):
+            kind = _VALUE
+        elif issubclass(obj_type, self.root_types):
+            kind = _ROOT
+        else:
+            kind = _IDENTITY
+        self.kinds[obj_type] = kind
+        return kind
+
+    def persistent_id_for(self, segment: int) -> Callable[[Any], int | None]:
+        # The pickler calls persistent_id for every object it pickles, so this is a
+        # closure over locals rather than a method to keep the overhead down.
+        kinds = self.kinds
+        promoted = self.promoted
+        segments = self.segments
+        owners = self.owners
+        keep_alive = self.alive.append
+
+        def persistent_id(obj: Any) -> int | None:
+            obj_type = type(obj)
+            kind = kinds.get(obj_type)
+            if kind is None:
+                kind = self.kind(obj_type)
+            if kind == _VALUE:
+                return None
+            key = id(obj)
+            if key in segments:
+                # Includes the segment's own object and the object the snapshot was
+                # taken of, which may not be one of the root types.
+                return key
+            if kind == _ROOT or promoted.get(key) is obj_type:
+                self.add_segment(obj)
+                return key
+            if owners.setdefault(key, segment) != segment:
+                self.shared[key] = obj
+            else:
+                keep_alive(obj)
+            return None
+
+        return persistent_id
+
+    def add_segment(self, obj: Any) -> None:
+        # The segment is reserved before it is pickled so that references from other
+        # segments do not queue it again.
+        self.segments[id(obj)] = Segment(type(obj), b"")
+        self.pending.append(obj)
+        self.alive.append(obj)
+
+    def run(self, obj: Any) -> SegmentedSnapshot:
+        self.add_segment(obj)
+        while self.pending:
+            segment_obj = self.pending.pop()
+            state = _state_of(segment_obj)
+            self.alive.append(state)
+            data = io.BytesIO()
+            pickler = pickle.Pickler(data, protocol=pickle.HIGHEST_PROTOCOL)
+            pickler.persistent_id = self.persistent_id_for(  # type: ignore[assignment]
+                id(segment_obj)
+            )
+            pickler.dump(state)
+            self.segments[id(segment_obj)] = Segment(type(segment_obj), data.getvalue())
+        return SegmentedSnapshot(id(obj), self.segments)
+
+
+def _state_of(obj: Any) -> Any:
+    """Returns the state to restore obj from after creating it empty.
+
+    Raises:
+        NotSegmentableError: The object cannot be created empty, such as objects
+            with a custom __reduce__.
+    """
+    obj_type = type(obj)
+    if obj_type is list or obj_type is set:
+        return list(obj)
+    if obj_type is dict:
+        return dict(obj)
+    if obj_type not in copyreg.dispatch_table and not isinstance(obj, CONTAINER_TYPES):
+        reduced = obj.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+        if (
+            isinstance(reduced, tuple)
+            and reduced[0] is copyreg.__newobj__  # type: ignore[attr-defined]
+            and reduced[1] == (obj_type,)
+            and all(r is None for r in reduced[3:])
+        ):
+            return reduced[2] if len(reduced) > 2 else None
+    raise NotSegmentableError(f"{obj_type.__name__} cannot be segmented")
+
+
+def snapshot(
+    obj: Any,
+    root_types: tuple[type, ...],
+    value_types: tuple[type, ...] = (),
+    promoted: dict[int, type] | None = None,
+) -> SegmentedSnapshot:
+    """Pickles obj as a segmented snapshot.
+
+    Args:
+        obj: The object to pickle.
+        root_types: The types of the objects to pickle as their own segments.
+        value_types: Types with no identity to preserve, in addition to VALUE_TYPES.
+            Objects of these types may be pickled by more than one segment.
+        promoted: The objects that were shared by segments of a previous snapshot, by
+            id(), which are also pickled as their own segments. Passing the same dict
+            to each snapshot usually avoids pickling the snapshot twice. It is updated
+            with the shared objects of this snapshot.
+
+    Raises:
+        NotSegmentableError: The graph contains a shared object that cannot be restored
+            from its own segment.
+    """
+    if promoted is None:
+        promoted = {}
+    for _ in range(MAX_PASSES):
+        snapshotter = _Snapshotter(root_types, value_types, promoted, obj)
+        result = snapshotter.run(obj)
+        if not snapshotter.shared:
+            # Forget promoted objects that no longer exist so that the dict does not
+            # grow for the whole session.
+            for key in promoted.keys() - result.segments.keys():
+                del promoted[key]
+            return result
+        for key, shared in snapshotter.shared.items():
+            # Checks that the object can be restored from its own segment.
+            _state_of(shared)
+            promoted[key] = type(shared)
+    raise NotSegmentableError(f"Shared objects not resolved after {MAX_PASSES} passes")
+
+
+def _build(obj: Any, state: Any) -> None:
+    """Restores the state of obj the same way that pickle's BUILD opcode does."""
+    obj_type = type(obj)
+    if obj_type is list:
+        obj.extend(state)
+        return
+    if obj_type is dict or obj_type is set:
+        obj.update(state)
+        return
+    if state is None:
+        return
+    setstate = getattr(obj, "__setstate__", None)
+    if setstate is not None:
+        setstate(state)
+        return
+    slot_state = None
+    if isinstance(state, tuple) and len(state) == 2:
+        state, slot_state = state
+    if state:
+        obj_dict = obj.__dict__
+        for name, value in state.items():
+            if type(name) is str:
+                obj_dict[sys.intern(name)] = value
+            else:
+                obj_dict[name] = value
+    if slot_state:
+        for name, value in slot_state.items():
+            setattr(obj, name, value)
+
+
+class _SegmentUnpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, loader: SegmentLoader) -> None:
+        super().__init__(file)
+        self.loader = loader
+
+    def persistent_load(self, pid: Any) -> Any:
+        return self.loader.object_for(pid)
+
+
+class SegmentLoader:
+    """Restores the object graph of a segmented snapshot."""
+
+    def __init__(
+        self, segment_types: Mapping[int, type], read: Callable[[int], bytes]
+    ) -> None:
+        self.segment_types = segment_types
+        self.read = read
+        self.objects: dict[int, Any] = {}
+
+    def object_for(self, key: int) -> Any:
+        try:
+            return self.objects[key]
+        except KeyError:
+            pass
+        obj_type: Any = self.segment_types[key]
+        obj = obj_type.__new__(obj_type)
+        self.objects[key] = obj
+        state = _SegmentUnpickler(io.BytesIO(self.read(key)), self).load()
+        _build(obj, state)
+        return obj
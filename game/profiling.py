@@ -7,7 +7,7 @@
 from dataclasses import dataclass
 from datetime import timedelta
 from types import TracebackType
-from typing import Iterator, Optional, Type
+from typing import Any, Iterator, Optional, Type
 
 
 @contextmanager
@@ -32,6 +32,116 @@ def average(self) -> timedelta:
         return self.duration / self.count
 
 
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    def record_hit(self) -> None:
+        self.hits += 1
+
+    def record_miss(self) -> None:
+        self.misses += 1
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        if not self.lookups:
+            return 0.0
+        return self.hits / self.lookups
+
+    def reset(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+
+_cache_stats: dict[str, CacheStats] = defaultdict(CacheStats)
+
+
+def cache_stats(name: str) -> CacheStats:
+    """Returns the hit and miss counters for the named cache.
+
+    Counters are shared by every user of the same name, so caches that are recreated
+    (such as those owned by the nav meshes, which are rebuilt whenever the threat
+    zones change) accumulate into the same counters.
+    """
+    return _cache_stats[name]
+
+
+def log_cache_stats(reset: bool = True) -> None:
+    """Logs the hit rate of every cache that has been used since the last reset."""
+    for name, stats in _cache_stats.items():
+        if not stats.lookups:
+            continue
+        logging.debug(
+            "%s: %d hits, %d misses (%.1f%% hit rate)",
+            name,
+            stats.hits,
+            stats.misses,
+            stats.hit_rate * 100,
+        )
+        if reset:
+            stats.reset()
+
+
+class PlannerStats:
+    """Counters and timings collected by an HTN planner.
+
+    Time is attributed to the class name of the task (or, for clones, the world state)
+    that spent it. Each category only includes the time spent in that step itself, not
+    in the tasks it decomposes into, so the totals of every category can be summed
+    without double counting.
+    """
+
+    def __init__(self) -> None:
+        self.plans_found = 0
+        self.plans_failed = 0
+        self.backtracks = 0
+        self.clones: dict[str, CountedEvent] = defaultdict(CountedEvent)
+        self.preconditions: dict[str, CountedEvent] = defaultdict(CountedEvent)
+        self.preconditions_failed: dict[str, int] = defaultdict(int)
+        self.effects: dict[str, CountedEvent] = defaultdict(CountedEvent)
+        self.decompositions: dict[str, CountedEvent] = defaultdict(CountedEvent)
+        self.executions: dict[str, CountedEvent] = defaultdict(CountedEvent)
+
+    @contextmanager
+    def trace(self, events: dict[str, CountedEvent], source: object) -> Iterator[None]:
+        timer = Timer()
+        try:
+            with timer:
+                yield
+        finally:
+            # Exceptions are part of normal control flow for the planner, such as the
+            # StopIteration raised when a compound task has no methods left.
+            events[type(source).__name__].increment(timer.duration)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the stats as JSON serializable data. Durations are in seconds."""
+
+        def events_to_dict(events: dict[str, CountedEvent]) -> dict[str, Any]:
+            return {
+                name: {"count": event.count, "seconds": event.duration.total_seconds()}
+                for name, event in sorted(events.items())
+            }
+
+        preconditions = events_to_dict(self.preconditions)
+        for name, data in preconditions.items():
+            data["failed"] = self.preconditions_failed[name]
+        return {
+            "plans_found": self.plans_found,
+            "plans_failed": self.plans_failed,
+            "backtracks": self.backtracks,
+            "clones": events_to_dict(self.clones),
+            "preconditions": preconditions,
+            "effects": events_to_dict(self.effects),
+            "decompositions": events_to_dict(self.decompositions),
+            "executions": events_to_dict(self.executions),
+        }
+
+
 class MultiEventTracer:
     def __init__(self) -> None:
         self.events: dict[str, CountedEvent] = defaultdict(CountedEvent)
@@ -0,0 +1,248 @@
+"""Cache of the parsed YAML files of the game's static data.
+
+Unit, weapon, faction, campaign and theater data is stored in several hundred YAML
+files that are parsed during start up. PyYAML's parser is pure Python and parsing
+those files takes seconds, so the parsed data is pickled to a single cache file in the
+DCS saved games directory, which is read once when the first YAML file is loaded.
+
+Each entry of the cache records the modification time, size and SHA-256 hash of its
+source file. An entry is used as long as the modification time and size match. If they
+do not, the file is hashed, and it is only parsed again if the content changed. Changed
+entries are written back to the cache file when the process exits.
+
+Data derived from other resources, such as the payloads of each aircraft, is stored in
+the same file with a fingerprint of the inputs it was built from.
+"""
+
+from __future__ import annotations
+
+import atexit
+import dataclasses
+import hashlib
+import logging
+import os
+import pickle
+import threading
+from collections.abc import Iterable
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+import yaml
+
+from game.version import VERSION
+
+RESOURCE_CACHE = "Liberation/resources.p"
+
+# Increment when the layout of the cache file changes.
+CACHE_FORMAT = 2
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    mtime_ns: int
+    size: int
+    digest: bytes
+    # The parsed YAML is stored pickled rather than as objects so that each caller gets
+    # its own copy to modify.
+    data: bytes
+
+
+@dataclass(frozen=True)
+class DerivedEntry:
+    # Identifies the inputs the data was built from.
+    fingerprint: bytes
+    data: bytes
+
+
+class ResourceCache:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries: dict[str, CacheEntry] | None = None
+        self._derived: dict[str, DerivedEntry] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @property
+    def _cache_key(self) -> tuple[int, str, str]:
+        # The parsed data depends on the YAML parser as well as the source file.
+        return CACHE_FORMAT, VERSION, yaml.__version__
+
+    def load_yaml(self, path: Path) -> Any:
+        """Returns the parsed content of the YAML file at path."""
+        entry = self._cached_entry(path)
+        if entry is not None:
+            return pickle.loads(entry.data)
+        content = path.read_bytes()
+        data = yaml.safe_load(content.decode("utf-8"))
+        self._store(path, content, data)
+        return data
+
+    def load_derived(self, key: str, fingerprint: bytes, build: Callable[[], T]) -> T:
+        """Returns data derived from resources other than YAML files.
+
+        The data is built by calling build unless the cache holds data for key with the
+        same fingerprint. The fingerprint should identify every input of build, such as
+        the modification times of the files it reads.
+        """
+        with self._lock:
+            self._load_entries()
+            entry = self._derived.get(key)
+        if entry is not None and entry.fingerprint == fingerprint:
+            return pickle.loads(entry.data)
+        data = build()
+        entry = DerivedEntry(
+            fingerprint, pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+        with self._lock:
+            self._derived[key] = entry
+            self._dirty = True
+        return data
+
+    def uncached(self, paths: Iterable[Path]) -> list[Path]:
+        """Returns the paths that would need to be parsed to be loaded."""
+        return [path for path in paths if self._cached_entry(path) is None]
+
+    def preload(self, paths: Iterable[Path], executor: Executor) -> None:
+        """Parses the given files with executor and adds them to the cache.
+
+        A process pool avoids the GIL, since the parser is pure Python. The workers are
+        only sent yaml.safe_load and the text of each file.
+        """
+        paths = list(paths)
+        contents = [path.read_bytes() for path in paths]
+        parsed = executor.map(
+            yaml.safe_load, [c.decode("utf-8") for c in contents], chunksize=16
+        )
+        for path, content, data in zip(paths, contents, parsed):
+            self._store(path, content, data)
+
+    def _cached_entry(self, path: Path) -> CacheEntry | None:
+        key = str(path.resolve())
+        stat = path.stat()
+        with self._lock:
+            entry = self._load_entries().get(key)
+        if entry is None:
+            return None
+        if entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+            return entry
+
+        digest = hashlib.sha256(path.read_bytes()).digest()
+        if entry.digest != digest:
+            return None
+        # Only the modification time changed, as happens when switching branches.
+        entry = dataclasses.replace(entry, mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        with self._lock:
+            self._load_entries()[key] = entry
+            self._dirty = True
+        return entry
+
+    def _store(self, path: Path, content: bytes, data: Any) -> None:
+        stat = path.stat()
+        entry = CacheEntry(
+            stat.st_mtime_ns,
+            stat.st_size,
+            hashlib.sha256(content).digest(),
+            pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL),
+        )
+        with self._lock:
+            self._load_entries()[str(path.resolve())] = entry
+            self._dirty = True
+
+    def _load_entries(self) -> dict[str, CacheEntry]:
+        if self._entries is not None:
+            return self._entries
+
+        entries: dict[str, CacheEntry] = {}
+        if self.path.is_file():
+            try:
+                cache_key, cached_entries, derived = pickle.loads(
+                    self.path.read_bytes()
+                )
+                if cache_key == self._cache_key:
+                    entries = cached_entries
+                    self._derived = derived | self._derived
+            except Exception as e:
+                logging.exception(f"Error {e} reading resource cache. Recreating.")
+        self._entries = entries
+        return entries
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            # Drop the entries of files that have been deleted so the cache does not
+            # grow without bound.
+            entries = {
+                key: entry for key, entry in self._entries.items() if Path(key).exists()
+            }
+            derived = dict(self._derived)
+            self._dirty = False
+
+        # Write to a temporary file first so that a concurrent reader (or a crash) never
+        # sees a partially written cache.
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            with temp_path.open("wb") as cache_file:
+                pickle.dump(
+                    (self._cache_key, entries, derived),
+                    cache_file,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(temp_path, self.path)
+        except OSError:
+            logging.exception("Unable to write resource cache to %s", self.path)
+            temp_path.unlink(missing_ok=True)
+
+
+_cache: ResourceCache | None = None
+
+
+def configure(user_directory: Path) -> None:
+    """Enables the cache, stored in the given DCS saved games directory."""
+    global _cache
+    _cache = ResourceCache(user_directory / RESOURCE_CACHE)
+    atexit.register(_cache.save)
+
+
+def load_yaml(path: Path) -> Any:
+    """Returns the parsed content of the YAML file at path.
+
+    The resource cache is used once the DCS saved games directory has been configured.
+    Before that, and in tests, the file is parsed directly.
+    """
+    if _cache is None:
+        with path.open(encoding="utf-8") as yaml_file:
+            return yaml.safe_load(yaml_file)
+    return _cache.load_yaml(path)
+
+
+def uncached_yaml(paths: Iterable[Path]) -> list[Path]:
+    """Returns the paths that are not in the resource cache.
+
+    Nothing can be preloaded if the cache has not been configured, so no paths are
+    returned in that case.
+    """
+    if _cache is None:
+        return []
+    return _cache.uncached(paths)
+
+
+def preload_yaml(paths: Iterable[Path], executor: Executor) -> None:
+    """Parses the given YAML files with executor and adds them to the resource cache."""
+    if _cache is not None:
+        _cache.preload(paths, executor)
+
+
+def load_derived(key: str, fingerprint: bytes, build: Callable[[], T]) -> T:
+    """Returns data derived from resources, built by build if it is not cached.
+
+    See ResourceCache.load_derived. If the cache has not been configured the data is
+    always built.
+    """
+    if _cache is None:
+        return build()
+    return _cache.load_derived(key, fingerprint, build)
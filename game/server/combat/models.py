@@ -43,9 +43,9 @@ def for_combat(combat: FrozenCombat, theater: ConflictTheater) -> FrozenCombatJs
             return FrozenCombatJs(
                 id=combat.id,
                 flight_position=LeafletPoint.from_pydcs(combat.flight.position()),
-                target_positions=[
-                    LeafletPoint.from_pydcs(sam.position) for sam in combat.air_defenses
-                ],
+                target_positions=LeafletPoint.from_pydcs_points(
+                    [sam.position for sam in combat.air_defenses], theater
+                ),
                 footprint=None,
             )
         raise NotImplementedError(f"Unhandled FrozenCombat type: {combat.__class__}")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 from uuid import UUID
 
@@ -9,7 +10,7 @@
 
 if TYPE_CHECKING:
     from game import Game
-    from game.theater import ControlPoint
+    from game.theater import ConflictTheater, ControlPoint
 
 
 class ControlPointJs(BaseModel):
@@ -25,22 +26,44 @@ class Config:
         title = "ControlPoint"
 
     @staticmethod
-    def for_control_point(control_point: ControlPoint) -> ControlPointJs:
-        destination = None
-        if control_point.target_position is not None:
-            destination = LeafletPoint.from_pydcs(control_point.target_position)
+    def for_control_point(
+        control_point: ControlPoint,
+        position: LeafletPoint,
+        destination: LeafletPoint | None,
+    ) -> ControlPointJs:
         return ControlPointJs(
             id=control_point.id,
             name=control_point.name,
             blue=control_point.captured,
-            position=LeafletPoint.from_pydcs(control_point.position),
+            position=position,
             mobile=control_point.moveable and control_point.captured,
             destination=destination,
             sidc=str(control_point.sidc()),
         )
 
     @staticmethod
-    def all_in_game(game: Game) -> list[ControlPointJs]:
+    def for_control_points(
+        control_points: Sequence[ControlPoint], theater: ConflictTheater
+    ) -> list[ControlPointJs]:
+        """Returns the models of the control points, projecting every position and
+        destination together.
+        """
+        targets = {
+            cp: cp.target_position
+            for cp in control_points
+            if cp.target_position is not None
+        }
+        positions = LeafletPoint.from_pydcs_points(
+            [cp.position for cp in control_points] + list(targets.values()), theater
+        )
+        destinations = dict(zip(targets, positions[len(control_points) :]))
         return [
-            ControlPointJs.for_control_point(cp) for cp in game.theater.controlpoints
+            ControlPointJs.for_control_point(cp, position, destinations.get(cp))
+            for cp, position in zip(control_points, positions)
         ]
+
+    @staticmethod
+    def all_in_game(game: Game) -> list[ControlPointJs]:
+        return ControlPointJs.for_control_points(
+            game.theater.controlpoints, game.theater
+        )
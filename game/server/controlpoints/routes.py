@@ -34,7 +34,7 @@ def get_control_point(
             status.HTTP_404_NOT_FOUND,
             detail=f"Game has no control point with ID {cp_id}",
         )
-    return ControlPointJs.for_control_point(cp)
+    return ControlPointJs.for_control_points([cp], game.theater)[0]
 
 
 @router.get(
@@ -32,6 +32,17 @@ async def get(cls) -> GameUpdateEvents:
         cls._queue.task_done()
         return events
 
+    @classmethod
+    async def get_batch(cls) -> GameUpdateEvents:
+        """Waits for events and merges them with any other events already queued."""
+        # The first events may also be in use by the Qt UI, so they are merged into new
+        # events rather than modified.
+        events = GameUpdateEvents().merge(await cls.get())
+        while not cls._queue.empty() and not events.shutting_down:
+            events.merge(cls._queue.get_nowait())
+            cls._queue.task_done()
+        return events
+
     @staticmethod
     @contextmanager
     def event_context() -> Iterator[GameUpdateEvents]:
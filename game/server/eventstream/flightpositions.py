@@ -0,0 +1,113 @@
+"""Binary encoding of flight positions for the event stream.
+
+Clients that connect with ?flight_positions=binary receive flight positions as binary
+websocket messages rather than in the updated_flight_positions field of the JSON
+events. The JSON events are still sent as text messages for every other event.
+
+All integers and floats are little endian, and every field is four bytes so that the
+arrays in each message are aligned for typed array views. Each message begins with a
+header of three uint32s: the message type, the ID of the flight table, and a count.
+
+A flight table message (type 1) is followed by count flight IDs as 16 byte UUIDs. The
+position of a flight in the table is its index in position messages. A client keeps
+only the most recent table. The table is sent again whenever flights are added to it.
+
+A flight position message (type 2) is followed by count uint32 flight indices, then
+count pairs of float32 latitude and longitude. The message uses the table with the ID
+in its header, and clients ignore position messages for any other table.
+"""
+
+from __future__ import annotations
+
+import struct
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+import numpy as np
+import numpy.typing as npt
+
+from game.theater.projection import TerrainProjection
+
+if TYPE_CHECKING:
+    from dcs import Point
+    from dcs.terrain import Terrain
+
+    from game.ato import Flight
+
+FLIGHT_TABLE_MESSAGE = 1
+FLIGHT_POSITIONS_MESSAGE = 2
+
+HEADER = struct.Struct("<III")
+
+
+class FlightIndexTable:
+    """Assigns the index that identifies each flight in flight position messages.
+
+    Flights keep their index until the table is reset, which should be done when the
+    map is reset or a new turn begins so that the table does not keep growing.
+    """
+
+    def __init__(self) -> None:
+        self.table_id = 0
+        self.flights: list[UUID] = []
+        self.indices: dict[UUID, int] = {}
+        self.message = self._encode()
+
+    def reset(self) -> None:
+        self.table_id += 1
+        self.flights = []
+        self.indices = {}
+        self.message = self._encode()
+
+    def indices_for(
+        self, flight_ids: Sequence[UUID]
+    ) -> tuple[npt.NDArray[np.uint32], bool]:
+        """Returns the index of each flight and whether the table was changed.
+
+        Flights that are not yet in the table are added to it.
+        """
+        changed = False
+        for flight_id in flight_ids:
+            if flight_id not in self.indices:
+                self.indices[flight_id] = len(self.flights)
+                self.flights.append(flight_id)
+                changed = True
+        if changed:
+            self.table_id += 1
+            self.message = self._encode()
+        indices = np.fromiter(
+            (self.indices[f] for f in flight_ids), dtype="<u4", count=len(flight_ids)
+        )
+        return indices, changed
+
+    def _encode(self) -> bytes:
+        return HEADER.pack(
+            FLIGHT_TABLE_MESSAGE, self.table_id, len(self.flights)
+        ) + b"".join(f.bytes for f in self.flights)
+
+
+def encode_flight_positions(
+    positions: Sequence[tuple[Flight, Point]],
+    table: FlightIndexTable,
+    terrain: Terrain,
+) -> tuple[bytes, bool]:
+    """Encodes a flight position message.
+
+    Returns the message and whether the flight table changed. If it did, the new table
+    must be sent before the message.
+    """
+    count = len(positions)
+    indices, table_changed = table.indices_for([f.id for f, _ in positions])
+    x = np.fromiter((p.x for _, p in positions), dtype=np.float64, count=count)
+    y = np.fromiter((p.y for _, p in positions), dtype=np.float64, count=count)
+    lat, lng = TerrainProjection.for_terrain(terrain).xy_to_latlng(x, y)
+    latlng = np.empty((count, 2), dtype="<f4")
+    latlng[:, 0] = lat
+    latlng[:, 1] = lng
+    message = (
+        HEADER.pack(FLIGHT_POSITIONS_MESSAGE, table.table_id, count)
+        + indices.tobytes()
+        + latlng.tobytes()
+    )
+    return message, table_changed
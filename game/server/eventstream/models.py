@@ -56,7 +56,21 @@ def from_events(
         updated_unculled_zones = []
         updated_iads = []
         updated_front_lines = []
+        updated_flight_positions = {}
+        new_flights = []
+        updated_flights = []
+        updated_tgos = []
+        updated_control_points = []
         if game is not None:
+            positions = events.updated_flight_positions
+            updated_flight_positions = dict(
+                zip(
+                    [flight.id for flight, _ in positions],
+                    LeafletPoint.from_pydcs_points(
+                        [position for _, position in positions], game.theater
+                    ),
+                )
+            )
             new_combats = [
                 FrozenCombatJs.for_combat(c, game.theater) for c in events.new_combats
             ]
@@ -72,45 +86,46 @@ def from_events(
                 player: ThreatZonesJs.from_zones(zones, game.theater)
                 for player, zones in events.threat_zones_updated.items()
             }
-            updated_unculled_zones = UnculledZoneJs.from_game(game)
-            for node in events.updated_iads:
-                updated_iads.extend(IadsConnectionJs.connections_for_node(node))
+            if events.unculled_zones_updated:
+                updated_unculled_zones = UnculledZoneJs.from_game(game)
+            updated_iads = IadsConnectionJs.connections_for_nodes(
+                events.updated_iads, game.theater
+            )
             updated_front_lines = [
                 FrontLineJs.for_front_line(game.theater, f)
                 for f in events.updated_front_lines
             ]
+            new_flights = FlightJs.for_flights(
+                list(events.new_flights), with_waypoints=True, theater=game.theater
+            )
+            updated_flights = FlightJs.for_flights(
+                list(events.updated_flights), with_waypoints=True, theater=game.theater
+            )
+            updated_tgos = TgoJs.for_tgos(list(events.updated_tgos), game.theater)
+            updated_control_points = ControlPointJs.for_control_points(
+                list(events.updated_control_points), game.theater
+            )
 
         reset_on_map_center: LeafletPoint | None = None
         if events.reset_on_map_center is not None:
             reset_on_map_center = LeafletPoint.from_pydcs(events.reset_on_map_center)
         return GameUpdateEventsJs(
-            updated_flight_positions={
-                f[0].id: LeafletPoint.from_pydcs(f[1])
-                for f in events.updated_flight_positions
-            },
+            updated_flight_positions=updated_flight_positions,
             new_combats=new_combats,
             updated_combats=updated_combats,
             ended_combats=[c.id for c in events.ended_combats],
             navmesh_updates=updated_navmeshes,
             updated_unculled_zones=updated_unculled_zones,
             threat_zones_updated=updated_threat_zones,
-            new_flights=[
-                FlightJs.for_flight(f, with_waypoints=True) for f in events.new_flights
-            ],
-            updated_flights=[
-                FlightJs.for_flight(f, with_waypoints=True)
-                for f in events.updated_flights
-            ],
+            new_flights=new_flights,
+            updated_flights=updated_flights,
             deleted_flights=events.deleted_flights,
             selected_flight=events.selected_flight,
             deselected_flight=events.deselected_flight,
             updated_front_lines=updated_front_lines,
             deleted_front_lines=events.deleted_front_lines,
-            updated_tgos=[TgoJs.for_tgo(tgo) for tgo in events.updated_tgos],
-            updated_control_points=[
-                ControlPointJs.for_control_point(cp)
-                for cp in events.updated_control_points
-            ],
+            updated_tgos=updated_tgos,
+            updated_control_points=updated_control_points,
             updated_iads=updated_iads,
             deleted_iads=events.deleted_iads_connections,
             reset_on_map_center=reset_on_map_center,
@@ -1,54 +1,220 @@
+from __future__ import annotations
+
 import asyncio
+import json
+import logging
 from asyncio import wait, Future
+from collections import deque
+from dataclasses import dataclass, replace
+from enum import Enum
+from functools import cached_property
+from typing import TYPE_CHECKING
 
 from fastapi import APIRouter, WebSocket
 from fastapi.encoders import jsonable_encoder
 
 from .eventstream import EventStream
+from .flightpositions import FlightIndexTable, encode_flight_positions
 from .models import GameUpdateEventsJs
 from .. import GameContext
+from ..settings import ServerSettings
+
+if TYPE_CHECKING:
+    from game import Game
+    from game.sim import GameUpdateEvents
 
 router: APIRouter = APIRouter()
 
 
+class FlightPositionEncoding(Enum):
+    JSON = "json"
+    BINARY = "binary"
+
+
+@dataclass(frozen=True)
+class Message:
+    data: str | bytes
+    has_flight_positions: bool
+    only_flight_positions: bool
+
+
+class EventFrame:
+    """Events encoded once for every connection that uses the same encoding."""
+
+    def __init__(
+        self,
+        events: GameUpdateEvents,
+        game: Game | None,
+        flight_table: FlightIndexTable,
+    ) -> None:
+        self.events = events
+        self.game = game
+        self.flight_table = flight_table
+
+    def messages_for(self, encoding: FlightPositionEncoding) -> list[Message]:
+        if encoding is FlightPositionEncoding.BINARY:
+            return self.binary_messages
+        return self.json_messages
+
+    @cached_property
+    def json_messages(self) -> list[Message]:
+        return [
+            Message(
+                self._encode_json(self.events),
+                has_flight_positions=bool(self.events.updated_flight_positions),
+                only_flight_positions=self.events.only_flight_positions,
+            )
+        ]
+
+    @cached_property
+    def binary_messages(self) -> list[Message]:
+        messages = []
+        positions = self.events.updated_flight_positions
+        if positions and self.game is not None:
+            data, table_changed = encode_flight_positions(
+                positions, self.flight_table, self.game.theater.terrain
+            )
+            if table_changed:
+                messages.append(Message(self.flight_table.message, False, False))
+            messages.append(Message(data, True, True))
+        if not self.events.only_flight_positions:
+            messages.append(
+                Message(
+                    self._encode_json(
+                        replace(self.events, updated_flight_positions=[])
+                    ),
+                    has_flight_positions=False,
+                    only_flight_positions=False,
+                )
+            )
+        return messages
+
+    def _encode_json(self, events: GameUpdateEvents) -> str:
+        # Encoded the same way as WebSocket.send_json.
+        return json.dumps(
+            jsonable_encoder(GameUpdateEventsJs.from_events(events, self.game)),
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+
+
+class Connection:
+    """A websocket connected to the event stream and the messages waiting to be sent.
+
+    Each connection is sent messages by its own task so that a slow client does not
+    delay the others. If a client falls behind, messages that only update flight
+    positions are dropped when a newer message with flight positions is queued, since
+    the map only needs the latest positions. Other messages are never dropped.
+    """
+
+    def __init__(self, websocket: WebSocket, encoding: FlightPositionEncoding) -> None:
+        self.websocket = websocket
+        self.encoding = encoding
+        self.messages: deque[Message] = deque()
+        self.messages_queued = asyncio.Event()
+        self.closed = False
+
+    def queue(self, message: Message) -> None:
+        if message.has_flight_positions:
+            self.messages = deque(
+                m for m in self.messages if not m.only_flight_positions
+            )
+        self.messages.append(message)
+        self.messages_queued.set()
+
+    def queue_frame(self, frame: EventFrame) -> None:
+        for message in frame.messages_for(self.encoding):
+            self.queue(message)
+
+    async def send_messages(self) -> None:
+        while not self.closed:
+            await self.messages_queued.wait()
+            self.messages_queued.clear()
+            while self.messages and not self.closed:
+                data = self.messages.popleft().data
+                if isinstance(data, bytes):
+                    await self.websocket.send_bytes(data)
+                else:
+                    await self.websocket.send_text(data)
+
+    async def close(self) -> None:
+        self.closed = True
+        self.messages_queued.set()
+        await self.websocket.close()
+
+
 class ConnectionManager:
     def __init__(self) -> None:
-        self.active_connections: list[WebSocket] = []
+        self.active_connections: list[Connection] = []
+        self.flight_table = FlightIndexTable()
+        self._broadcaster: asyncio.Task[None] | None = None
 
     async def shutdown(self) -> None:
         futures: list[Future[None]] = []
         for connection in self.active_connections:
             futures.append(asyncio.create_task(connection.close()))
-        await wait(futures)
+        if futures:
+            await wait(futures)
 
-    async def connect(self, websocket: WebSocket) -> None:
+    async def connect(
+        self, websocket: WebSocket, encoding: FlightPositionEncoding
+    ) -> Connection:
         await websocket.accept()
-        self.active_connections.append(websocket)
+        connection = Connection(websocket, encoding)
+        if encoding is FlightPositionEncoding.BINARY:
+            connection.queue(Message(self.flight_table.message, False, False))
+        self.active_connections.append(connection)
+        if self._broadcaster is None:
+            self._broadcaster = asyncio.create_task(self.broadcast_events())
+        return connection
 
-    def disconnect(self, websocket: WebSocket) -> None:
-        self.active_connections.remove(websocket)
+    def disconnect(self, connection: Connection) -> None:
+        self.active_connections.remove(connection)
 
-    async def broadcast(self, events: GameUpdateEventsJs) -> None:
-        futures = []
+    def broadcast(self, frame: EventFrame) -> None:
         for connection in self.active_connections:
-            futures.append(
-                asyncio.create_task(connection.send_json(jsonable_encoder(events)))
-            )
-        await wait(futures)
+            connection.queue_frame(frame)
+
+    async def broadcast_events(self) -> None:
+        """Sends the queued events to every connection until the server shuts down.
+
+        Events are encoded once for all connections. At most one frame is sent per
+        ServerSettings.event_stream_max_frame_rate interval, and events that are queued
+        while waiting for the next frame are merged into it.
+        """
+        frame_interval = 1 / ServerSettings.get().event_stream_max_frame_rate
+        loop = asyncio.get_running_loop()
+        while True:
+            events = await EventStream.get_batch()
+            if events.shutting_down:
+                await self.shutdown()
+                return
+            if events.empty:
+                continue
+            if events.resets_map or events.new_turn:
+                self.flight_table.reset()
+
+            frame_start = loop.time()
+            try:
+                self.broadcast(EventFrame(events, GameContext.get(), self.flight_table))
+            except Exception:
+                # Keep streaming later events rather than ending the stream for every
+                # connection.
+                logging.exception("Failed to encode game update events")
+                continue
+            await asyncio.sleep(frame_start + frame_interval - loop.time())
 
 
 manager = ConnectionManager()
 
 
 @router.websocket("/eventstream")
-async def event_stream(websocket: WebSocket) -> None:
-    await manager.connect(websocket)
-    while True:
-        if not (events := await EventStream.get()).empty:
-            if events.shutting_down:
-                await manager.shutdown()
-                return
-
-            await manager.broadcast(
-                GameUpdateEventsJs.from_events(events, GameContext.get())
-            )
+async def event_stream(
+    websocket: WebSocket,
+    flight_positions: FlightPositionEncoding = FlightPositionEncoding.JSON,
+) -> None:
+    connection = await manager.connect(websocket, flight_positions)
+    try:
+        await connection.send_messages()
+    finally:
+        manager.disconnect(connection)
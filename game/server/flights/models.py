@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 from uuid import UUID
 
@@ -9,11 +10,12 @@
 from game.ato.flightstate.killed import Killed
 from game.server.leaflet import LeafletPoint
 from game.server.waypoints.models import FlightWaypointJs
-from game.server.waypoints.routes import waypoints_for_flight
+from game.server.waypoints.routes import waypoints_for_flights
 
 if TYPE_CHECKING:
     from game import Game
     from game.ato import Flight
+    from game.theater import ConflictTheater
 
 
 class FlightJs(BaseModel):
@@ -27,7 +29,16 @@ class Config:
         title = "Flight"
 
     @staticmethod
-    def for_flight(flight: Flight, with_waypoints: bool) -> FlightJs:
+    def for_flight(
+        flight: Flight, with_waypoints: bool, theater: ConflictTheater
+    ) -> FlightJs:
+        return FlightJs.for_flights([flight], with_waypoints, theater)[0]
+
+    @staticmethod
+    def for_flights(
+        flights: Sequence[Flight], with_waypoints: bool, theater: ConflictTheater
+    ) -> list[FlightJs]:
+        """Returns the models of the flights, projecting every position together."""
         # Don't provide a location for aircraft that aren't in the air. Later we can
         # expand the model to include the state data for the UI so that it can make its
         # own decisions about whether to draw the aircraft, but for now we'll filter
@@ -35,25 +46,37 @@ def for_flight(flight: Flight, with_waypoints: bool) -> FlightJs:
         #
         # We also draw dead aircraft so the player has some feedback about what's being
         # lost.
-        position = None
-        if isinstance(flight.state, InFlight) or isinstance(flight.state, Killed):
-            position = LeafletPoint.from_pydcs(flight.position())
-        waypoints = None
-        if with_waypoints:
-            waypoints = waypoints_for_flight(flight)
-        return FlightJs(
-            id=flight.id,
-            blue=flight.blue,
-            position=position,
-            sidc=str(flight.sidc()),
-            waypoints=waypoints,
+        located = [
+            flight
+            for flight in flights
+            if isinstance(flight.state, InFlight) or isinstance(flight.state, Killed)
+        ]
+        positions = dict(
+            zip(
+                located,
+                LeafletPoint.from_pydcs_points(
+                    [flight.position() for flight in located], theater
+                ),
+            )
         )
+        waypoints: list[list[FlightWaypointJs] | None] = [None] * len(flights)
+        if with_waypoints:
+            waypoints = list(waypoints_for_flights(flights, theater))
+        return [
+            FlightJs(
+                id=flight.id,
+                blue=flight.blue,
+                position=positions.get(flight),
+                sidc=str(flight.sidc()),
+                waypoints=flight_waypoints,
+            )
+            for flight, flight_waypoints in zip(flights, waypoints)
+        ]
 
     @staticmethod
     def all_in_game(game: Game, with_waypoints: bool) -> list[FlightJs]:
         flights = []
         for coalition in game.coalitions:
             for package in coalition.ato.packages:
-                for flight in package.flights:
-                    flights.append(FlightJs.for_flight(flight, with_waypoints))
-        return flights
+                flights.extend(package.flights)
+        return FlightJs.for_flights(flights, with_waypoints, game.theater)
@@ -26,7 +26,7 @@ def get_flight(
     game: Game = Depends(GameContext.require),
 ) -> FlightJs:
     flight = game.db.flights.get(flight_id)
-    return FlightJs.for_flight(flight, with_waypoints)
+    return FlightJs.for_flight(flight, with_waypoints, game.theater)
 
 
 @router.get(
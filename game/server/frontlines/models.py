@@ -27,10 +27,9 @@ def for_front_line(theater: ConflictTheater, front_line: FrontLine) -> FrontLine
         bounds = FrontLineConflictDescription.frontline_bounds(front_line, theater)
         return FrontLineJs(
             id=front_line.id,
-            extents=[
-                LeafletPoint.from_pydcs(bounds.left_position),
-                LeafletPoint.from_pydcs(bounds.right_position),
-            ],
+            extents=LeafletPoint.from_pydcs_points(
+                [bounds.left_position, bounds.right_position], theater
+            ),
         )
 
     @staticmethod
@@ -10,7 +10,6 @@
 from game.server.iadsnetwork.models import IadsNetworkJs
 from game.server.leaflet import LeafletPoint
 from game.server.mapzones.models import ThreatZoneContainerJs, UnculledZoneJs
-from game.server.navmesh.models import NavMeshesJs
 from game.server.supplyroutes.models import SupplyRouteJs
 from game.server.tgos.models import TgoJs
 
@@ -26,7 +25,6 @@ class GameJs(BaseModel):
     flights: list[FlightJs]
     iads_network: IadsNetworkJs
     threat_zones: ThreatZoneContainerJs
-    navmeshes: NavMeshesJs
     map_center: LeafletPoint | None
     unculled_zones: list[UnculledZoneJs]
 
@@ -41,9 +39,10 @@ def from_game(game: Game) -> GameJs:
             supply_routes=SupplyRouteJs.all_in_game(game),
             front_lines=FrontLineJs.all_in_game(game),
             flights=FlightJs.all_in_game(game, with_waypoints=True),
-            iads_network=IadsNetworkJs.from_network(game.theater.iads_network),
+            iads_network=IadsNetworkJs.from_network(
+                game.theater.iads_network, game.theater
+            ),
             threat_zones=ThreatZoneContainerJs.for_game(game),
-            navmeshes=NavMeshesJs.from_game(game),
             map_center=LeafletPoint.from_pydcs(
                 game.theater.terrain.map_view_default.position
             ),
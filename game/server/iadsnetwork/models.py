@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
 from uuid import UUID
 
 from pydantic import BaseModel
@@ -7,6 +9,9 @@
 from game.server.leaflet import LeafletPoint
 from game.theater.iadsnetwork.iadsnetwork import IadsNetworkNode, IadsNetwork
 
+if TYPE_CHECKING:
+    from game.theater import ConflictTheater
+
 
 class IadsConnectionJs(BaseModel):
     id: UUID
@@ -22,32 +27,56 @@ class Config:
 
     @staticmethod
     def connections_for_tgo(
-        tgo_id: UUID, network: IadsNetwork
+        tgo_id: UUID, network: IadsNetwork, theater: ConflictTheater
     ) -> list[IadsConnectionJs]:
         for node in network.nodes:
             if node.group.ground_object.id == tgo_id:
-                return IadsConnectionJs.connections_for_node(node)
+                return IadsConnectionJs.connections_for_node(node, theater)
         return []
 
     @staticmethod
-    def connections_for_node(network_node: IadsNetworkNode) -> list[IadsConnectionJs]:
+    def connections_for_node(
+        network_node: IadsNetworkNode, theater: ConflictTheater
+    ) -> list[IadsConnectionJs]:
+        return IadsConnectionJs.connections_for_nodes([network_node], theater)
+
+    @staticmethod
+    def connections_for_nodes(
+        network_nodes: Iterable[IadsNetworkNode], theater: ConflictTheater
+    ) -> list[IadsConnectionJs]:
+        connections = []
+        for network_node in network_nodes:
+            tgo = network_node.group.ground_object
+            for id, connection in network_node.connections.items():
+                if (
+                    not connection.iads_role.is_secondary_node
+                    or connection.ground_object.is_friendly(True)
+                    != tgo.is_friendly(True)
+                ):
+                    # Skip connections to non secondary nodes (for example PD)
+                    # and connections which are not from same coalition
+                    continue
+                connections.append((network_node, id, connection))
+
+        # The ends of every connection are projected together.
+        points = LeafletPoint.from_pydcs_points(
+            [
+                position
+                for network_node, _, connection in connections
+                for position in (
+                    network_node.group.ground_object.position,
+                    connection.ground_object.position,
+                )
+            ],
+            theater,
+        )
         iads_connections = []
-        tgo = network_node.group.ground_object
-        for id, connection in network_node.connections.items():
-            if (
-                not connection.iads_role.is_secondary_node
-                or connection.ground_object.is_friendly(True) != tgo.is_friendly(True)
-            ):
-                # Skip connections to non secondary nodes (for example PD)
-                # and connections which are not from same coalition
-                continue
+        for index, (network_node, id, connection) in enumerate(connections):
+            tgo = network_node.group.ground_object
             iads_connections.append(
                 IadsConnectionJs(
                     id=id,
-                    points=[
-                        LeafletPoint.from_pydcs(tgo.position),
-                        LeafletPoint.from_pydcs(connection.ground_object.position),
-                    ],
+                    points=points[2 * index : 2 * index + 2],
                     node=tgo.id,
                     connected=connection.ground_object.id,
                     active=(
@@ -70,10 +99,8 @@ class Config:
         title = "IadsNetwork"
 
     @staticmethod
-    def from_network(network: IadsNetwork) -> IadsNetworkJs:
-        iads_connections = []
-        for primary_node in network.nodes:
-            iads_connections.extend(IadsConnectionJs.connections_for_node(primary_node))
+    def from_network(network: IadsNetwork, theater: ConflictTheater) -> IadsNetworkJs:
         return IadsNetworkJs(
-            advanced=network.advanced_iads, connections=iads_connections
+            advanced=network.advanced_iads,
+            connections=IadsConnectionJs.connections_for_nodes(network.nodes, theater),
         )
@@ -12,7 +12,7 @@
 def get_iads_network(
     game: Game = Depends(GameContext.require),
 ) -> IadsNetworkJs:
-    return IadsNetworkJs.from_network(game.theater.iads_network)
+    return IadsNetworkJs.from_network(game.theater.iads_network, game.theater)
 
 
 @router.get(
@@ -23,4 +23,6 @@ def get_iads_network(
 def get_iads_connections_for_tgo(
     tgo_id: UUID, game: Game = Depends(GameContext.require)
 ) -> list[IadsConnectionJs]:
-    return IadsConnectionJs.connections_for_tgo(tgo_id, game.theater.iads_network)
+    return IadsConnectionJs.connections_for_tgo(
+        tgo_id, game.theater.iads_network, game.theater
+    )
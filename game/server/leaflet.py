@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Union
 
+import numpy as np
+import numpy.typing as npt
+import shapely
 from dcs import Point
 from dcs.mapping import LatLng
 from pydantic import BaseModel
 from shapely.geometry import LineString, MultiLineString, MultiPolygon, Polygon
 
 from game.theater import ConflictTheater
+from game.theater.projection import TerrainProjection
 
 
 class LeafletPoint(BaseModel):
@@ -24,6 +29,27 @@ def from_pydcs(point: Point) -> LeafletPoint:
         latlng = point.latlng()
         return LeafletPoint(lat=latlng.lat, lng=latlng.lng)
 
+    @staticmethod
+    def from_pydcs_points(
+        points: Sequence[Point], theater: ConflictTheater
+    ) -> list[LeafletPoint]:
+        """Converts the points with one projection rather than one per point."""
+        return LeafletPoint.from_xy(
+            [p.x for p in points], [p.y for p in points], theater
+        )
+
+    @staticmethod
+    def from_xy(
+        x: npt.ArrayLike, y: npt.ArrayLike, theater: ConflictTheater
+    ) -> list[LeafletPoint]:
+        if not np.size(x):
+            return []
+        lat, lng = TerrainProjection.for_terrain(theater.terrain).xy_to_latlng(x, y)
+        return [
+            LeafletPoint(lat=point_lat, lng=point_lng)
+            for point_lat, point_lng in zip(lat.tolist(), lng.tolist())
+        ]
+
 
 LeafletLine = list[LeafletPoint]
 
@@ -41,15 +67,18 @@ class ShapelyUtil:
     def latlng_to_leaflet(latlng: LatLng) -> LeafletPoint:
         return LeafletPoint(lat=latlng.lat, lng=latlng.lng)
 
-    @classmethod
-    def poly_to_leaflet(cls, poly: Polygon, theater: ConflictTheater) -> LeafletPoly:
+    @staticmethod
+    def _rings(poly: Polygon) -> list[LineString]:
         if poly.is_empty:
             return []
         try:
-            lines = poly.boundary.geoms
+            return list(poly.boundary.geoms)
         except AttributeError:
-            lines = [poly.boundary]
-        return cls.lines_to_leaflet(MultiLineString(lines), theater)
+            return [poly.boundary]
+
+    @classmethod
+    def poly_to_leaflet(cls, poly: Polygon, theater: ConflictTheater) -> LeafletPoly:
+        return cls._lines_to_leaflet(cls._rings(poly), theater)
 
     @classmethod
     def polys_to_leaflet(
@@ -59,14 +88,21 @@ def polys_to_leaflet(
             polys = poly.geoms
         else:
             polys = [poly]
-        return [cls.poly_to_leaflet(poly, theater) for poly in polys]
+        # The rings of every polygon are projected together.
+        rings = [cls._rings(p) for p in polys]
+        lines = cls._lines_to_leaflet(
+            [r for poly_rings in rings for r in poly_rings], theater
+        )
+        leaflet_polys = []
+        start = 0
+        for poly_rings in rings:
+            leaflet_polys.append(lines[start : start + len(poly_rings)])
+            start += len(poly_rings)
+        return leaflet_polys
 
     @classmethod
     def line_to_leaflet(cls, line: LineString, theater: ConflictTheater) -> LeafletLine:
-        return [
-            cls.latlng_to_leaflet(Point(x, y, theater.terrain).latlng())
-            for x, y in line.coords
-        ]
+        return cls._lines_to_leaflet([line], theater)[0]
 
     @classmethod
     def lines_to_leaflet(
@@ -76,4 +112,25 @@ def lines_to_leaflet(
             lines = line_string.geoms
         else:
             lines = [line_string]
-        return [cls.line_to_leaflet(line, theater) for line in lines]
+        return cls._lines_to_leaflet(lines, theater)
+
+    @staticmethod
+    def _lines_to_leaflet(
+        lines: Sequence[LineString], theater: ConflictTheater
+    ) -> list[LeafletLine]:
+        """Converts the lines with one projection of all of their coordinates.
+
+        Threat zones and navmeshes have tens of thousands of coordinates, so projecting
+        each one separately is the most expensive part of sending them to the map.
+        """
+        coords = [shapely.get_coordinates(line) for line in lines]
+        if not coords:
+            return []
+        all_coords = np.concatenate(coords)
+        points = LeafletPoint.from_xy(all_coords[:, 0], all_coords[:, 1], theater)
+        leaflet_lines = []
+        start = 0
+        for line_coords in coords:
+            leaflet_lines.append(points[start : start + len(line_coords)])
+            start += len(line_coords)
+        return leaflet_lines
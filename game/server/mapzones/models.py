@@ -36,10 +36,12 @@ class Config:
     def from_game(game: Game) -> list[UnculledZoneJs]:
         return [
             UnculledZoneJs(
-                position=LeafletPoint.from_pydcs(zone),
+                position=position,
                 radius=game.settings.perf_culling_distance * 1000,
             )
-            for zone in game.get_culling_zones()
+            for position in LeafletPoint.from_pydcs_points(
+                game.get_culling_zones(), game.theater
+            )
         ]
 
 
@@ -36,18 +36,3 @@ def from_navmesh(navmesh: NavMesh, game: Game) -> NavMeshJs:
                 for p in navmesh.polys
             ]
         )
-
-
-class NavMeshesJs(BaseModel):
-    blue: NavMeshJs
-    red: NavMeshJs
-
-    class Config:
-        title = "NavMeshes"
-
-    @staticmethod
-    def from_game(game: Game) -> NavMeshesJs:
-        return NavMeshesJs(
-            blue=NavMeshJs.from_navmesh(game.blue.nav_mesh, game),
-            red=NavMeshJs.from_navmesh(game.red.nav_mesh, game),
-        )
@@ -22,6 +22,10 @@ class ServerSettings(BaseSettings):
     # This (and the address) will be passed the the front end as a query parameter.
     server_port: int = 16880
 
+    # The maximum number of updates per second sent to the map. Events that happen
+    # between updates are merged and sent together.
+    event_stream_max_frame_rate: float = 30
+
     # Enable to allow cross-origin requests from http://localhost:3000.
     cors_allow_debug_server: bool = False
 
@@ -92,7 +92,7 @@ def for_link(
             # https://reactjs.org/docs/lists-and-keys.html#keys
             # https://github.com/dcs-liberation/dcs_liberation/issues/2167
             id=uuid.uuid4(),
-            points=[LeafletPoint.from_pydcs(p) for p in points],
+            points=LeafletPoint.from_pydcs_points(points, game.theater),
             front_active=not sea and a.front_is_active(b),
             is_sea=sea,
             blue=a.captured,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 from uuid import UUID
 
@@ -9,7 +10,7 @@
 
 if TYPE_CHECKING:
     from game import Game
-    from game.theater import TheaterGroundObject
+    from game.theater import ConflictTheater, TheaterGroundObject
 
 
 class TgoJs(BaseModel):
@@ -29,7 +30,7 @@ class Config:
         title = "Tgo"
 
     @staticmethod
-    def for_tgo(tgo: TheaterGroundObject) -> TgoJs:
+    def for_tgo(tgo: TheaterGroundObject, position: LeafletPoint) -> TgoJs:
         threat_ranges = [group.max_threat_range().meters for group in tgo.groups]
         detection_ranges = [group.max_detection_range().meters for group in tgo.groups]
         return TgoJs(
@@ -38,7 +39,7 @@ def for_tgo(tgo: TheaterGroundObject) -> TgoJs:
             control_point_name=tgo.control_point.name,
             category=tgo.category,
             blue=tgo.control_point.captured,
-            position=LeafletPoint.from_pydcs(tgo.position),
+            position=position,
             units=[unit.display_name for unit in tgo.units],
             threat_ranges=threat_ranges,
             detection_ranges=detection_ranges,
@@ -46,11 +47,19 @@ def for_tgo(tgo: TheaterGroundObject) -> TgoJs:
             sidc=str(tgo.sidc()),
         )
 
+    @staticmethod
+    def for_tgos(
+        tgos: Sequence[TheaterGroundObject], theater: ConflictTheater
+    ) -> list[TgoJs]:
+        """Returns the models of the TGOs, projecting every position together."""
+        positions = LeafletPoint.from_pydcs_points([t.position for t in tgos], theater)
+        return [TgoJs.for_tgo(tgo, p) for tgo, p in zip(tgos, positions)]
+
     @staticmethod
     def all_in_game(game: Game) -> list[TgoJs]:
         tgos = []
         for control_point in game.theater.controlpoints:
             for tgo in control_point.connected_objectives:
                 if not tgo.is_control_point:
-                    tgos.append(TgoJs.for_tgo(tgo))
-        return tgos
+                    tgos.append(tgo)
+        return TgoJs.for_tgos(tgos, game.theater)
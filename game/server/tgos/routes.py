@@ -16,4 +16,4 @@ def list_tgos(game: Game = Depends(GameContext.require)) -> list[TgoJs]:
 
 @router.get("/{tgo_id}", operation_id="get_tgo_by_id", response_model=TgoJs)
 def get_tgo(tgo_id: UUID, game: Game = Depends(GameContext.require)) -> TgoJs:
-    return TgoJs.for_tgo(game.db.tgos.get(tgo_id))
+    return TgoJs.for_tgos([game.db.tgos.get(tgo_id)], game.theater)[0]
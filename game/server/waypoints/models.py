@@ -37,7 +37,10 @@ class Config:
 
     @staticmethod
     def for_waypoint(
-        waypoint: FlightWaypoint, flight: Flight, waypoint_idx: int
+        waypoint: FlightWaypoint,
+        flight: Flight,
+        waypoint_idx: int,
+        position: LeafletPoint,
     ) -> FlightWaypointJs:
         # Target *points* are the exact location of a unit, whereas the target area is
         # only the center of the objective. Allow moving the latter since its exact
@@ -82,7 +85,7 @@ def for_waypoint(
 
         return FlightWaypointJs(
             name=waypoint.name,
-            position=LeafletPoint.from_pydcs(waypoint.position),
+            position=position,
             altitude_ft=waypoint.alt.feet,
             altitude_reference=waypoint.alt_type,
             is_movable=is_movable,
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from uuid import UUID
 
 from dcs.mapping import LatLng, Point
@@ -10,14 +11,33 @@
 from game.server.leaflet import LeafletPoint
 from game.server.waypoints.models import FlightWaypointJs
 from game.sim import GameUpdateEvents
+from game.theater import ConflictTheater
 
 router: APIRouter = APIRouter(prefix="/waypoints")
 
 
-def waypoints_for_flight(flight: Flight) -> list[FlightWaypointJs]:
+def waypoints_for_flight(
+    flight: Flight, theater: ConflictTheater
+) -> list[FlightWaypointJs]:
+    return waypoints_for_flights([flight], theater)[0]
+
+
+def waypoints_for_flights(
+    flights: Sequence[Flight], theater: ConflictTheater
+) -> list[list[FlightWaypointJs]]:
+    """Returns the waypoints of each flight, projecting every position together."""
+    flight_waypoints = [flight.flight_plan.waypoints for flight in flights]
+    positions = iter(
+        LeafletPoint.from_pydcs_points(
+            [w.position for waypoints in flight_waypoints for w in waypoints], theater
+        )
+    )
     return [
-        FlightWaypointJs.for_waypoint(w, flight, i)
-        for i, w in enumerate(flight.flight_plan.waypoints, 1)
+        [
+            FlightWaypointJs.for_waypoint(w, flight, i, next(positions))
+            for i, w in enumerate(waypoints, 1)
+        ]
+        for flight, waypoints in zip(flights, flight_waypoints)
     ]
 
 
@@ -29,7 +49,7 @@ def waypoints_for_flight(flight: Flight) -> list[FlightWaypointJs]:
 def all_waypoints_for_flight(
     flight_id: UUID, game: Game = Depends(GameContext.require)
 ) -> list[FlightWaypointJs]:
-    return waypoints_for_flight(game.db.flights.get(flight_id))
+    return waypoints_for_flight(game.db.flights.get(flight_id), game.theater)
 
 
 @router.post(
@@ -54,6 +74,7 @@ def set_position(
     waypoint.position = Point.from_latlng(
         LatLng(position.lat, position.lng), game.theater.terrain
     )
+    flight.flight_plan.invalidate_leg_table()
     package_model = (
         GameContext.get_model()
         .ato_model_for(flight.blue)
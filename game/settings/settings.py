@@ -18,6 +18,7 @@
 from .skilloption import skill_option
 from ..ato.starttype import StartType
 from ..persistence.paths import liberation_user_dir
+from ..persistence.savecompression import SaveCompression
 
 
 @unique
@@ -190,6 +191,37 @@ class Settings:
             "extremely incomplete so does not affect all weapons."
         ),
     )
+    fast_flight_routing: bool = boolean_option(
+        "Fast flight routing around threats (WIP)",
+        page=CAMPAIGN_MANAGEMENT_PAGE,
+        section=GENERAL_SECTION,
+        default=False,
+        detail=(
+            "Uses a faster search to route flights around enemy threat zones. Routes "
+            "are straightened through the safe area rather than following the edges "
+            "of the navigation mesh, and are occasionally longer than those of the "
+            "original router. Takes effect the next time threat zones are updated."
+        ),
+    )
+    save_compression: SaveCompression = choices_option(
+        "Save game compression",
+        page=CAMPAIGN_MANAGEMENT_PAGE,
+        section=GENERAL_SECTION,
+        default=SaveCompression.DEFLATE,
+        choices={
+            "Fast": SaveCompression.DEFLATE,
+            "Smallest (slow)": SaveCompression.LZMA,
+            "None": SaveCompression.NONE,
+        },
+        detail=(
+            "Determines how the game is compressed when saving, including the "
+            "automatic saves made at each turn and before take off. Fast: quick to "
+            "save with moderately sized files. Smallest: the compression used by "
+            "earlier versions, which can take several seconds for large campaigns. "
+            "None: fastest, but saves are several times larger. Saves made with any "
+            "option can be loaded."
+        ),
+    )
     # Pilots and Squadrons
     ai_pilot_levelling: bool = boolean_option(
         "Allow AI pilot leveling",
@@ -395,6 +427,17 @@ class Settings:
             "Skipping combat: skip combat as if it did not occur."
         ),
     )
+    fast_forward_to_next_event: bool = boolean_option(
+        "Skip directly to the next event when fast forwarding (WIP)",
+        page=MISSION_GENERATOR_PAGE,
+        section=GAMEPLAY_SECTION,
+        default=False,
+        detail=(
+            "Fast forwards from one flight state change, combat, or contact to the "
+            "next instead of simulating every second in between. Fast forwarding is "
+            "much faster, but the results have not yet been verified to match."
+        ),
+    )
     supercarrier: bool = boolean_option(
         "Use supercarrier module",
         MISSION_GENERATOR_PAGE,
@@ -5,13 +5,16 @@
 from collections.abc import Iterator
 from datetime import datetime, timedelta
 
+from typing import Optional
+
 from typing_extensions import TYPE_CHECKING
 
 from game.ato.flightstate import (
     Uninitialized,
 )
 from game.settings.settings import FastForwardStopCondition, CombatResolutionMethod
-from .combat import CombatInitiator, FrozenCombat
+from .combat import CombatInitiator, EngagementZones, FrozenCombat
+from .flightkinematics import FlightKinematics
 from .gameupdateevents import GameUpdateEvents
 from .simulationresults import SimulationResults
 
@@ -24,6 +27,8 @@ class AircraftSimulation:
     def __init__(self, game: Game) -> None:
         self.game = game
         self.combats: list[FrozenCombat] = []
+        self.engagement_zones = EngagementZones()
+        self.kinematics = FlightKinematics()
         self.results = SimulationResults()
 
     def begin_simulation(self) -> None:
@@ -55,12 +60,13 @@ def on_game_tick(
                 still_active.append(combat)
         self.combats = still_active
 
-        for flight in self.iter_flights():
-            flight.on_game_tick(events, time, duration)
+        self.kinematics.tick(self.iter_flights(), events, time, duration)
 
         # Finish updating all flights before checking for combat so that the new
         # positions are used.
-        CombatInitiator(self.game, self.combats, events).update_active_combats()
+        CombatInitiator(
+            self.game, self.combats, events, self.engagement_zones
+        ).update_active_combats()
 
         # After updating all combat states, check for halts.
         for flight in self.iter_flights():
@@ -71,6 +77,30 @@ def on_game_tick(
         if not self._auto_resolve_combat() and self.combats:
             events.complete_simulation()
 
+    def next_event_time(
+        self, events: GameUpdateEvents, time: datetime
+    ) -> Optional[datetime]:
+        """Returns the earliest time at which a tick may do more than advance time.
+
+        Flight state changes, combat resolution, and first contact are estimated to
+        only happen on ticks at or after the returned time. Contact times are
+        conservative bounds rather than exact, so the returned time may be earlier
+        than the next real event, but it should never be later. None is returned if no
+        event is pending.
+        """
+        event_times = [
+            event_time
+            for flight in self.iter_flights()
+            if (event_time := flight.state.next_event_time(time)) is not None
+        ]
+        event_times.extend(combat.next_event_time(time) for combat in self.combats)
+        contact_time = CombatInitiator(
+            self.game, self.combats, events, self.engagement_zones
+        ).next_contact_time(time)
+        if contact_time is not None:
+            event_times.append(contact_time)
+        return min(event_times, default=None)
+
     def set_initial_flight_states(self) -> None:
         now = self.game.conditions.start_time
         for flight in self.iter_flights():
@@ -80,6 +110,8 @@ def reset(self) -> None:
         for flight in self.iter_flights():
             flight.set_state(Uninitialized(flight, self.game.settings))
         self.combats = []
+        self.engagement_zones = EngagementZones()
+        self.kinematics = FlightKinematics()
 
     def iter_flights(self) -> Iterator[Flight]:
         packages = itertools.chain(
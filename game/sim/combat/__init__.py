@@ -1,2 +1,3 @@
 from .combatinitiator import CombatInitiator
+from .engagementzones import EngagementZones
 from .frozencombat import FrozenCombat
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
+from datetime import timedelta
 from typing import Optional, TYPE_CHECKING
 
 from dcs import Point
-from shapely.ops import unary_union
+from shapely.geometry import LineString
+from shapely.geometry.base import BaseGeometry
+from shapely.strtree import STRtree
 
-from game.utils import dcs_to_shapely_point
+from game.ato.flightstate import InFlight
+from game.utils import Speed, dcs_to_shapely_point
+from .zonecontact import distance_to_first_contact
 
 if TYPE_CHECKING:
     from game.ato import Flight
@@ -18,48 +23,99 @@
 class AircraftEngagementZones:
     def __init__(self, individual_zones: dict[Flight, ThreatPoly]) -> None:
         self.individual_zones = individual_zones
-        self.threat_zones = self._make_combined_zone()
+        self._indexed_flights: list[Flight] = []
+        self._index: Optional[STRtree] = None
+
+    def update_from_ato(self, ato: AirTaskingOrder) -> None:
+        """Updates the zones to match the current commit regions of the ATO.
+
+        Commit regions are created when a flight enters a new state, so the zones are
+        only re-indexed if a flight has entered or left a state with a commit region
+        since the last update.
+        """
+        zones = self.commit_regions(ato)
+        if zones.keys() != self.individual_zones.keys() or any(
+            zone is not self.individual_zones[flight] for flight, zone in zones.items()
+        ):
+            self.individual_zones = zones
+            self._index = None
 
     def update_for_combat(self, combat: FrozenCombat) -> None:
         for flight in combat.iter_flights():
-            try:
-                del self.individual_zones[flight]
-            except KeyError:
-                pass
-        self.threat_zones = self._make_combined_zone()
+            self.remove_flight(flight)
 
     def remove_flight(self, flight: Flight) -> None:
+        # Removed flights are filtered out of the index queries, so the index does not
+        # need to be rebuilt.
         try:
             del self.individual_zones[flight]
         except KeyError:
             pass
-        self.threat_zones = self._make_combined_zone()
-
-    def _make_combined_zone(self) -> ThreatPoly:
-        zones = []
-        for zone in self.individual_zones.values():
-            try:
-                zones.extend(zone.geoms)
-            except AttributeError:
-                zones.append(zone)
-        return unary_union(zones)
 
     def covers(self, position: Point) -> bool:
-        return self.threat_zones.intersects(dcs_to_shapely_point(position))
+        return next(self.iter_intercepting_flights(position), None) is not None
 
     def iter_intercepting_flights(self, position: Point) -> Iterator[Flight]:
+        for flight, _ in self._iter_zones_touching(dcs_to_shapely_point(position)):
+            yield flight
+
+    def distance_to_contact(self, start: Point, end: Point) -> Optional[float]:
+        """Returns the distance from start to the first zone along the path to end.
+
+        None is returned if the path does not touch any zone.
+        """
+        path = LineString([dcs_to_shapely_point(start), dcs_to_shapely_point(end)])
+        return distance_to_first_contact(
+            path, (zone for _, zone in self._iter_zones_touching(path))
+        )
+
+    def time_to_reach(self, position: Point, speed: Speed) -> Optional[timedelta]:
+        """Returns the shortest time in which any zone could reach the position.
+
+        Each zone moves with the flight that owns it, so the zones may reach a flight
+        that does not fly into them. This assumes that a flight flying at the given
+        speed and the owner of each zone fly directly toward each other, so contact
+        cannot happen any sooner. None is returned if there are no zones.
+        """
+        target = dcs_to_shapely_point(position)
+        closest: Optional[timedelta] = None
         for flight, zone in self.individual_zones.items():
-            if zone.intersects(dcs_to_shapely_point(position)):
-                yield flight
+            closing_speed = speed.meters_per_second
+            if isinstance(flight.state, InFlight):
+                closing_speed += flight.state.estimate_speed().meters_per_second
+            distance = zone.distance(target)
+            if not distance:
+                return timedelta()
+            if closing_speed <= 0:
+                continue
+            time = timedelta(seconds=distance / closing_speed)
+            if closest is None or time < closest:
+                closest = time
+        return closest
+
+    def _iter_zones_touching(
+        self, geometry: BaseGeometry
+    ) -> Iterator[tuple[Flight, ThreatPoly]]:
+        if self._index is None:
+            self._indexed_flights = list(self.individual_zones)
+            self._index = STRtree(list(self.individual_zones.values()))
+        for index in sorted(self._index.query(geometry, predicate="intersects")):
+            flight = self._indexed_flights[index]
+            if (zone := self.individual_zones.get(flight)) is not None:
+                yield flight, zone
 
     @classmethod
     def from_ato(cls, ato: AirTaskingOrder) -> AircraftEngagementZones:
+        return AircraftEngagementZones(cls.commit_regions(ato))
+
+    @classmethod
+    def commit_regions(cls, ato: AirTaskingOrder) -> dict[Flight, ThreatPoly]:
         zones = {}
         for package in ato.packages:
             for flight in package.flights:
                 if (region := cls.commit_region(flight)) is not None:
                     zones[flight] = region
-        return AircraftEngagementZones(zones)
+        return zones
 
     @classmethod
     def commit_region(cls, flight: Flight) -> Optional[ThreatPoly]:
@@ -3,13 +3,15 @@
 import itertools
 import logging
 from collections.abc import Iterator
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Optional, TYPE_CHECKING
 
+from game.ato.flightstate import InFlight, Navigating
 from .aircombat import AirCombat
 from .aircraftengagementzones import AircraftEngagementZones
 from .atip import AtIp
 from .defendingsam import DefendingSam
+from .engagementzones import EngagementZones
 from .joinablecombat import JoinableCombat
 from .samengagementzones import SamEngagementZones
 from ..gameupdateevents import GameUpdateEvents
@@ -22,17 +24,19 @@
 
 class CombatInitiator:
     def __init__(
-        self, game: Game, combats: list[FrozenCombat], events: GameUpdateEvents
+        self,
+        game: Game,
+        combats: list[FrozenCombat],
+        events: GameUpdateEvents,
+        engagement_zones: EngagementZones,
     ) -> None:
         self.game = game
         self.combats = combats
         self.events = events
+        self.engagement_zones = engagement_zones
 
     def update_active_combats(self) -> None:
-        blue_a2a = AircraftEngagementZones.from_ato(self.game.blue.ato)
-        red_a2a = AircraftEngagementZones.from_ato(self.game.red.ato)
-        blue_sam = SamEngagementZones.from_theater(self.game.theater, player=True)
-        red_sam = SamEngagementZones.from_theater(self.game.theater, player=False)
+        self.engagement_zones.update(self.game)
 
         # Check each vulnerable flight to see if it has initiated combat. If any flight
         # initiates combat, a single FrozenCombat will be created for all involved
@@ -46,15 +50,13 @@ def update_active_combats(self) -> None:
             if flight.state.in_combat:
                 return
 
-            if flight.squadron.player:
-                a2a = red_a2a
-                own_a2a = blue_a2a
-                sam = red_sam
-            else:
-                a2a = blue_a2a
-                own_a2a = red_a2a
-                sam = blue_sam
-            self.check_flight_for_combat(flight, a2a, own_a2a, sam)
+            player = flight.squadron.player
+            self.check_flight_for_combat(
+                flight,
+                self.engagement_zones.a2a_for(not player),
+                self.engagement_zones.a2a_for(player),
+                self.engagement_zones.sam_for(not player),
+            )
 
     def check_flight_for_combat(
         self,
@@ -112,6 +114,82 @@ def check_flight_for_new_combat(
 
         return None
 
+    def next_contact_time(self, time: datetime) -> Optional[datetime]:
+        """Returns the earliest time at which a flight may initiate or join combat.
+
+        This assumes that no flight changes state before the returned time, so it must
+        be recomputed after any state change. Air-to-air engagement zones move with the
+        flights that own them, so they are assumed to close on each flight at the speed
+        of their owner. The current time is returned for flights that would be checked
+        for combat on every tick, such as those that are already inside an engagement
+        zone.
+        """
+        self.engagement_zones.update(self.game)
+        joinable = any(isinstance(c, JoinableCombat) for c in self.combats)
+        contact_times = [
+            contact_time
+            for flight in self.iter_flights()
+            if (contact_time := self.next_contact_time_for(flight, time, joinable))
+            is not None
+        ]
+        return min(contact_times, default=None)
+
+    def next_contact_time_for(
+        self, flight: Flight, time: datetime, combat_joinable: bool
+    ) -> Optional[datetime]:
+        state = flight.state
+        if combat_joinable and state.will_join_air_combat:
+            return time
+
+        if not isinstance(state, InFlight):
+            return None
+
+        if state.is_at_ip and not state.avoid_further_combat:
+            return time
+
+        player = flight.squadron.player
+        a2a = self.engagement_zones.a2a_for(not player)
+        zones: list[AircraftEngagementZones | SamEngagementZones] = []
+        if state.vulnerable_to_intercept:
+            zones.append(a2a)
+        if state.vulnerable_to_sam:
+            zones.append(self.engagement_zones.sam_for(not player))
+
+        position = state.estimate_position()
+        if any(zone.covers(position) for zone in zones):
+            return time
+
+        contact_times = []
+        if state.vulnerable_to_intercept:
+            # Air-to-air zones move with the flights that own them, so they may reach
+            # this flight before it reaches them.
+            if (
+                time_to_reach := a2a.time_to_reach(position, state.estimate_speed())
+            ) is not None:
+                contact_times.append(time + time_to_reach)
+
+        # Flights in any other in-flight state hold their position until their next
+        # state change.
+        if isinstance(state, Navigating):
+            end = state.next_waypoint.position
+            remaining_distance = position.distance_to_point(end)
+            distances = [
+                distance
+                for zone in zones
+                if (distance := zone.distance_to_contact(position, end)) is not None
+            ]
+            if distances and remaining_distance:
+                remaining_time = state.total_time_to_next_waypoint - state.elapsed_time
+                contact_times.append(
+                    time + remaining_time * (min(distances) / remaining_distance)
+                )
+
+        if not contact_times:
+            return None
+        # Positions are interpolated with floating point math, so stop a second early
+        # to be sure that the tick that makes contact is not skipped.
+        return min(contact_times) - timedelta(seconds=1)
+
     def iter_flights(self) -> Iterator[Flight]:
         packages = itertools.chain(
             self.game.blue.ato.packages, self.game.red.ato.packages
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .aircraftengagementzones import AircraftEngagementZones
+from .samengagementzones import SamEngagementZones
+
+if TYPE_CHECKING:
+    from game import Game
+
+
+class EngagementZones:
+    """The air-to-air and SAM engagement zones of both coalitions.
+
+    The zones are kept for the duration of the simulation rather than being rebuilt
+    each tick. Each update only re-indexes the zones of a side when its commit regions
+    or SAM threat zones have changed.
+    """
+
+    def __init__(self) -> None:
+        self.blue_a2a = AircraftEngagementZones({})
+        self.red_a2a = AircraftEngagementZones({})
+        self.blue_sam = SamEngagementZones([])
+        self.red_sam = SamEngagementZones([])
+
+    def update(self, game: Game) -> None:
+        self.blue_a2a.update_from_ato(game.blue.ato)
+        self.red_a2a.update_from_ato(game.red.ato)
+        self.blue_sam.update_from_theater(game.theater, player=True)
+        self.red_sam.update_from_theater(game.theater, player=False)
+
+    def a2a_for(self, player: bool) -> AircraftEngagementZones:
+        if player:
+            return self.blue_a2a
+        return self.red_a2a
+
+    def sam_for(self, player: bool) -> SamEngagementZones:
+        if player:
+            return self.blue_sam
+        return self.red_sam
@@ -35,6 +35,10 @@ def on_game_tick(
             return True
         return False
 
+    def next_event_time(self, time: datetime) -> datetime:
+        """Returns the time at which the combat will be resolved."""
+        return time + self.freeze_duration - self.elapsed_time
+
     @abstractmethod
     def resolve(
         self,
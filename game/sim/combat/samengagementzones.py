@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 from dcs import Point
-from shapely.ops import unary_union
+from shapely.geometry import LineString
+from shapely.geometry.base import BaseGeometry
+from shapely.strtree import STRtree
 
 from game.utils import dcs_to_shapely_point
+from .zonecontact import distance_to_first_contact
 
 if TYPE_CHECKING:
     from game.theater import ConflictTheater, TheaterGroundObject
@@ -15,28 +18,62 @@
 
 class SamEngagementZones:
     def __init__(
-        self,
-        threat_zones: ThreatPoly,
-        individual_zones: list[tuple[TheaterGroundObject, ThreatPoly]],
+        self, individual_zones: list[tuple[TheaterGroundObject, ThreatPoly]]
     ) -> None:
-        self.threat_zones = threat_zones
         self.individual_zones = individual_zones
+        self._index: Optional[STRtree] = None
+
+    def update_from_theater(self, theater: ConflictTheater, player: bool) -> None:
+        """Updates the zones to match the current threat zones of the theater.
+
+        TGOs cache their threat zone until a unit is killed or the TGO is cleared, so
+        the zones are only re-indexed if one of those threat zones has changed since
+        the last update.
+        """
+        zones = self.threat_regions(theater, player)
+        if len(zones) != len(self.individual_zones) or any(
+            tgo is not old_tgo or zone is not old_zone
+            for (tgo, zone), (old_tgo, old_zone) in zip(zones, self.individual_zones)
+        ):
+            self.individual_zones = zones
+            self._index = None
 
     def covers(self, position: Point) -> bool:
-        return self.threat_zones.intersects(dcs_to_shapely_point(position))
+        return next(self.iter_threatening_sams(position), None) is not None
 
     def iter_threatening_sams(self, position: Point) -> Iterator[TheaterGroundObject]:
-        for tgo, zone in self.individual_zones:
-            if zone.intersects(dcs_to_shapely_point(position)):
-                yield tgo
+        for tgo, _ in self._iter_zones_touching(dcs_to_shapely_point(position)):
+            yield tgo
+
+    def distance_to_contact(self, start: Point, end: Point) -> Optional[float]:
+        """Returns the distance from start to the first zone along the path to end.
+
+        None is returned if the path does not touch any zone.
+        """
+        path = LineString([dcs_to_shapely_point(start), dcs_to_shapely_point(end)])
+        return distance_to_first_contact(
+            path, (zone for _, zone in self._iter_zones_touching(path))
+        )
+
+    def _iter_zones_touching(
+        self, geometry: BaseGeometry
+    ) -> Iterator[tuple[TheaterGroundObject, ThreatPoly]]:
+        if self._index is None:
+            self._index = STRtree([zone for _, zone in self.individual_zones])
+        for index in sorted(self._index.query(geometry, predicate="intersects")):
+            yield self.individual_zones[index]
 
     @classmethod
     def from_theater(cls, theater: ConflictTheater, player: bool) -> SamEngagementZones:
-        commit_regions = []
+        return SamEngagementZones(cls.threat_regions(theater, player))
+
+    @staticmethod
+    def threat_regions(
+        theater: ConflictTheater, player: bool
+    ) -> list[tuple[TheaterGroundObject, ThreatPoly]]:
         individual_zones = []
         for cp in theater.control_points_for(player):
             for tgo in cp.connected_objectives:
                 if (region := tgo.threat_poly()) is not None:
-                    commit_regions.append(region)
                     individual_zones.append((tgo, region))
-        return SamEngagementZones(unary_union(commit_regions), individual_zones)
+        return individual_zones
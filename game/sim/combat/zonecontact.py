@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Optional, TYPE_CHECKING
+
+import shapely
+from shapely.geometry import LineString, Point as ShapelyPoint
+
+if TYPE_CHECKING:
+    from game.threatzones import ThreatPoly
+
+
+def distance_to_first_contact(
+    path: LineString, zones: Iterable[ThreatPoly]
+) -> Optional[float]:
+    """Returns the distance along the path to the first point inside any zone.
+
+    None is returned if the path does not touch any of the zones.
+    """
+    closest: Optional[float] = None
+    for zone in zones:
+        contact = path.intersection(zone)
+        if contact.is_empty:
+            continue
+        # The intersection is made of points and pieces of the path, so the first
+        # contact is the nearest of its vertices.
+        distance = min(
+            path.project(ShapelyPoint(x, y))
+            for x, y in shapely.get_coordinates(contact)
+        )
+        if closest is None or distance < closest:
+            closest = distance
+    return closest
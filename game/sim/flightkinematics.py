@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from typing import Optional, TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+from dcs import Point
+
+from game.ato.flightstate import Navigating
+
+if TYPE_CHECKING:
+    from game.ato import Flight
+    from game.ato.flightstate import FlightState
+    from .gameupdateevents import GameUpdateEvents
+
+
+def microseconds(duration: timedelta) -> int:
+    return duration // timedelta(microseconds=1)
+
+
+class FlightKinematics:
+    """Batched kinematics of the flights that are flying between waypoints.
+
+    Every flight that is navigating a leg with no pending waypoint actions is tracked
+    in one row of a set of arrays: the coordinates of the waypoints at either end of
+    the leg, the time spent on the leg, and the time needed to fly it. Those flights
+    are advanced in one batch per tick, and their flight state is only ticked directly
+    when they reach the end of the leg. All other flights are ticked normally.
+
+    Elapsed time is stored as integer microseconds, the resolution of timedelta, so the
+    batched flights reach their waypoints on exactly the same tick as they would if
+    they were ticked individually. The elapsed time of each batched flight is written
+    back to its state every tick because the combat checks and the UI read it. A flight
+    whose state was replaced or ticked by anything else since the last tick (such as
+    entering or leaving combat), or whose current leg was moved, is ticked normally and
+    then tracked again.
+    """
+
+    def __init__(self) -> None:
+        self.states: list[Optional[Navigating]] = []
+        self.rows: dict[Flight, int] = {}
+        self.free_rows: list[int] = []
+        self.origin_points: list[Optional[Point]] = []
+        self.destination_points: list[Optional[Point]] = []
+        self.written_elapsed: list[Optional[timedelta]] = []
+        self.origins: npt.NDArray[np.float64] = np.empty((0, 2))
+        self.destinations: npt.NDArray[np.float64] = np.empty((0, 2))
+        self.elapsed: npt.NDArray[np.int64] = np.empty(0, dtype=np.int64)
+        self.durations: npt.NDArray[np.int64] = np.empty(0, dtype=np.int64)
+        self.active: npt.NDArray[np.bool_] = np.empty(0, dtype=np.bool_)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @staticmethod
+    def can_track(state: FlightState) -> bool:
+        # Subclasses of Navigating may override its tick behavior, so only the exact
+        # type is handled. Waypoint actions may hold the flight in place, so flights
+        # with actions pending are ticked normally until the actions complete.
+        return type(state) is Navigating and not state.pending_actions
+
+    def tick(
+        self,
+        flights: Iterable[Flight],
+        events: GameUpdateEvents,
+        time: datetime,
+        duration: timedelta,
+    ) -> None:
+        """Ticks every flight, advancing the tracked flights in one batch."""
+        rows: list[int] = []
+        untracked = []
+        for flight in flights:
+            row = self.rows.get(flight)
+            if row is not None and self.is_current(row, flight.state):
+                rows.append(row)
+                continue
+            # The flight state was replaced or ticked outside the batch since the last
+            # tick, such as when a flight enters or leaves combat.
+            if row is not None:
+                self.untrack(flight)
+            untracked.append(flight)
+
+        if len(rows) != len(self.rows):
+            # Flights that were removed from the ATO since the last tick.
+            for row in set(self.rows.values()).difference(rows):
+                state = self.states[row]
+                assert state is not None
+                self.untrack(state.flight)
+
+        self.elapsed[self.active] += microseconds(duration)
+        arrived = (self.elapsed > self.durations).tolist()
+        elapsed = self.elapsed.tolist()
+        positions = self.positions().tolist()
+        new_positions = []
+        for row in rows:
+            state = self.states[row]
+            assert state is not None
+            if arrived[row]:
+                # The state still holds the elapsed time from before this tick, so it is
+                # ticked normally to handle the waypoint transition and the rollover.
+                self.untrack(state.flight)
+                untracked.append(state.flight)
+                continue
+            state.elapsed_time = self.written_elapsed[row] = timedelta(
+                microseconds=elapsed[row]
+            )
+            origin = self.origin_points[row]
+            assert origin is not None
+            x, y = positions[row]
+            new_positions.append((state.flight, origin.new_in_same_map(x, y)))
+        events.update_flight_positions(new_positions)
+
+        for flight in untracked:
+            flight.on_game_tick(events, time, duration)
+            if self.can_track(flight.state):
+                self.track(flight)
+
+    def is_current(self, row: int, state: FlightState) -> bool:
+        tracked = self.states[row]
+        return (
+            state is tracked
+            and tracked is not None
+            and tracked.elapsed_time is self.written_elapsed[row]
+            # Moving a waypoint replaces its position.
+            and tracked.current_waypoint.position is self.origin_points[row]
+            and tracked.next_waypoint.position is self.destination_points[row]
+        )
+
+    def positions(self) -> npt.NDArray[np.float64]:
+        """Returns the estimated position of the flight in each row.
+
+        Rows of untracked flights contain stale data.
+        """
+        # Matches Navigating.progress, which treats legs of less than a second as
+        # already complete.
+        short = self.durations < microseconds(timedelta(seconds=1))
+        progress = np.divide(
+            self.elapsed,
+            self.durations,
+            out=np.ones(len(self.elapsed)),
+            where=~short,
+        )
+        return self.origins + (self.destinations - self.origins) * progress[:, None]
+
+    def track(self, flight: Flight) -> None:
+        state = flight.state
+        assert isinstance(state, Navigating)
+        if not self.free_rows:
+            self.grow()
+        row = self.free_rows.pop()
+        self.rows[flight] = row
+        self.states[row] = state
+        origin = state.current_waypoint.position
+        destination = state.next_waypoint.position
+        self.origin_points[row] = origin
+        self.destination_points[row] = destination
+        self.origins[row] = (origin.x, origin.y)
+        self.destinations[row] = (destination.x, destination.y)
+        self.elapsed[row] = microseconds(state.elapsed_time)
+        self.written_elapsed[row] = state.elapsed_time
+        self.durations[row] = microseconds(state.total_time_to_next_waypoint)
+        self.active[row] = True
+
+    def untrack(self, flight: Flight) -> None:
+        row = self.rows.pop(flight)
+        self.states[row] = None
+        self.origin_points[row] = None
+        self.destination_points[row] = None
+        self.written_elapsed[row] = None
+        self.active[row] = False
+        self.free_rows.append(row)
+
+    def grow(self) -> None:
+        # Grow geometrically so that tracking flights one at a time stays cheap.
+        old_rows = len(self.states)
+        new_rows = max(16, old_rows)
+        self.states.extend([None] * new_rows)
+        self.origin_points.extend([None] * new_rows)
+        self.destination_points.extend([None] * new_rows)
+        self.written_elapsed.extend([None] * new_rows)
+        # Reversed so that the lowest rows are used first.
+        self.free_rows.extend(reversed(range(old_rows, old_rows + new_rows)))
+        self.origins = np.concatenate([self.origins, np.zeros((new_rows, 2))])
+        self.destinations = np.concatenate([self.destinations, np.zeros((new_rows, 2))])
+        self.elapsed = np.concatenate([self.elapsed, np.zeros(new_rows, np.int64)])
+        self.durations = np.concatenate([self.durations, np.ones(new_rows, np.int64)])
+        self.active = np.concatenate([self.active, np.zeros(new_rows, np.bool_)])
@@ -64,8 +64,9 @@ def run_to_first_contact(self) -> None:
         if not self.started:
             self.start()
         logging.info("Running sim to first contact")
+        to_next_event = self.game.settings.fast_forward_to_next_event
         while not self.completed:
-            self.tick(suppress_events=False)
+            self.tick(suppress_events=False, to_next_event=to_next_event)
 
     def pause_and_generate_miz(self, output: Path) -> None:
         self.pause()
@@ -96,11 +97,14 @@ def send_update(self, rate_limit: bool) -> None:
             self.events = GameUpdateEvents()
             self.last_update_time = now
 
-    def tick(self, suppress_events: bool = False) -> None:
+    def tick(self, suppress_events: bool = False, to_next_event: bool = False) -> None:
         if not self.started:
             raise RuntimeError("Attempted to tick game loop before initialization")
         try:
-            self.sim.tick(self.events)
+            if to_next_event:
+                self.sim.tick_to_next_event(self.events)
+            else:
+                self.sim.tick(self.events)
             self.completed = self.events.simulation_complete
             if not suppress_events:
                 self.send_update(rate_limit=True)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 from uuid import UUID
@@ -46,6 +47,62 @@ class GameUpdateEvents:
     def empty(self) -> bool:
         return self == GameUpdateEvents()
 
+    @property
+    def only_flight_positions(self) -> bool:
+        return self == GameUpdateEvents(
+            updated_flight_positions=self.updated_flight_positions
+        )
+
+    @property
+    def resets_map(self) -> bool:
+        return self.reset_on_map_center is not None or self.game_unloaded
+
+    def merge(self, later: GameUpdateEvents) -> GameUpdateEvents:
+        """Adds the events of a later update to this one.
+
+        The merged events can be sent to the map in place of both updates. Objects that
+        are updated more than once are only included once, since the map is sent their
+        state at the time the merged events are sent rather than their state at the
+        time of each update. Only the latest position of each flight is kept.
+        """
+        if later.resets_map:
+            # The map reloads the whole game, so the earlier events are irrelevant.
+            shutting_down = self.shutting_down
+            self.__dict__ = GameUpdateEvents().__dict__
+            self.shutting_down = shutting_down
+            self.reset_on_map_center = later.reset_on_map_center
+            self.game_unloaded = later.game_unloaded
+
+        self.simulation_complete |= later.simulation_complete
+        self.new_combats.extend(later.new_combats)
+        self.updated_combats.extend(later.updated_combats)
+        self.ended_combats.extend(later.ended_combats)
+        if later.updated_flight_positions:
+            positions = dict(self.updated_flight_positions)
+            positions.update(later.updated_flight_positions)
+            self.updated_flight_positions = list(positions.items())
+        self.navmesh_updates.update(later.navmesh_updates)
+        if later.unculled_zones_updated:
+            self.unculled_zones_updated = later.unculled_zones_updated
+        self.threat_zones_updated.update(later.threat_zones_updated)
+        self.new_flights.update(later.new_flights)
+        self.updated_flights.update(later.updated_flights)
+        self.deleted_flights.update(later.deleted_flights)
+        if later.deselected_flight:
+            self.deselect_flight()
+        if later.selected_flight is not None:
+            self.selected_flight = later.selected_flight
+            self.deselected_flight = False
+        self.updated_front_lines.update(later.updated_front_lines)
+        self.deleted_front_lines.update(later.deleted_front_lines)
+        self.updated_tgos.update(later.updated_tgos)
+        self.updated_control_points.update(later.updated_control_points)
+        self.updated_iads.update(later.updated_iads)
+        self.deleted_iads_connections.update(later.deleted_iads_connections)
+        self.new_turn |= later.new_turn
+        self.shutting_down |= later.shutting_down
+        return self
+
     def complete_simulation(self) -> GameUpdateEvents:
         self.simulation_complete = True
         return self
@@ -68,6 +125,12 @@ def update_flight_position(
         self.updated_flight_positions.append((flight, new_position))
         return self
 
+    def update_flight_positions(
+        self, positions: Iterable[tuple[Flight, Point]]
+    ) -> GameUpdateEvents:
+        self.updated_flight_positions.extend(positions)
+        return self
+
     def update_navmesh(self, player: bool, navmesh: NavMesh) -> GameUpdateEvents:
         self.navmesh_updates[player] = navmesh
         return self
@@ -18,6 +18,7 @@
 
 
 TICK = timedelta(seconds=1)
+MAX_EVENT_STEP = timedelta(minutes=1)
 
 
 class SimulationAlreadyCompletedError(RuntimeError):
@@ -38,10 +39,34 @@ def begin_simulation(self) -> None:
         self.aircraft_simulation.begin_simulation()
 
     def tick(self, events: GameUpdateEvents) -> GameUpdateEvents:
-        self.time += TICK
+        return self._advance(events, TICK)
+
+    def tick_to_next_event(self, events: GameUpdateEvents) -> GameUpdateEvents:
+        """Advances the simulation to the next tick on which something may happen.
+
+        All the ticks that are expected to only advance time are combined into one.
+        The results should match calling tick until that point, which the mission
+        simulation tests check against a generated game, but until that has proven
+        out this is only used when the fast_forward_to_next_event setting is enabled.
+        The jump is limited to MAX_EVENT_STEP so that the UI still sees the time
+        advance when no event is pending.
+        """
+        limit = self.time + MAX_EVENT_STEP
+        next_event = self.aircraft_simulation.next_event_time(events, self.time)
+        if next_event is None or next_event > limit:
+            next_event = limit
+        # Events happen on the first tick at or after their time. Round up to the
+        # next whole tick, and always advance by at least one tick.
+        ticks = max(1, -((self.time - next_event) // TICK))
+        return self._advance(events, ticks * TICK)
+
+    def _advance(
+        self, events: GameUpdateEvents, duration: timedelta
+    ) -> GameUpdateEvents:
+        self.time += duration
         if self.completed:
             raise RuntimeError("Simulation already completed")
-        self.aircraft_simulation.on_game_tick(events, self.time, TICK)
+        self.aircraft_simulation.on_game_tick(events, self.time, duration)
         self.completed = events.simulation_complete
         return events
 
@@ -2,7 +2,7 @@
 
 import itertools
 from collections import defaultdict
-from typing import Iterator, Optional, Sequence, TYPE_CHECKING
+from typing import Any, Iterator, Optional, Sequence, TYPE_CHECKING
 
 from game.ato.closestairfields import ObjectiveDistanceCache
 from game.dcs.aircrafttype import AircraftType
@@ -24,6 +24,16 @@ def __init__(self, player: bool, game: Game, faction: Faction) -> None:
         self.squadron_defs = SquadronDefLoader(game, faction).load()
         self.squadron_def_generator = SquadronDefGenerator(faction)
         self.settings = game.settings
+        self._auto_assignable_index: dict[FlightType, list[Squadron]] | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_auto_assignable_index"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        state["_auto_assignable_index"] = None
+        self.__dict__.update(state)
 
     def unclaim_squadron_def(self, squadron: Squadron) -> None:
         if squadron.aircraft in self.squadron_defs:
@@ -33,6 +43,32 @@ def unclaim_squadron_def(self, squadron: Squadron) -> None:
 
     def add_squadron(self, squadron: Squadron) -> None:
         self.squadrons[squadron.aircraft].append(squadron)
+        self.invalidate_auto_assignable_index()
+
+    def invalidate_auto_assignable_index(self) -> None:
+        """Discards the index of squadrons by auto-assignable mission type.
+
+        The index is rebuilt when it is next needed. It must be invalidated whenever
+        squadrons are added or removed, or their auto-assignable mission types change.
+        """
+        self._auto_assignable_index = None
+
+    def _auto_assignable_by_priority(self, task: FlightType) -> list[Squadron]:
+        """Returns the squadrons that may be automatically assigned the task.
+
+        Squadrons are ordered by the priority of their aircraft for the task, then by
+        their order in the air wing.
+        """
+        if self._auto_assignable_index is None:
+            index: dict[FlightType, list[Squadron]] = defaultdict(list)
+            for squadron in self.iter_squadrons():
+                for mission_type in squadron.auto_assignable_mission_types:
+                    index[mission_type].append(squadron)
+            for mission_type, squadrons in index.items():
+                ranks = AircraftType.priority_ranks_for_task(mission_type)
+                squadrons.sort(key=lambda s: ranks.get(s.aircraft, len(ranks)))
+            self._auto_assignable_index = dict(index)
+        return self._auto_assignable_index.get(task, [])
 
     def squadrons_for(self, aircraft: AircraftType) -> Sequence[Squadron]:
         return self.squadrons[aircraft]
@@ -48,35 +84,27 @@ def best_squadrons_for(
         self, location: MissionTarget, task: FlightType, size: int, this_turn: bool
     ) -> list[Squadron]:
         airfield_cache = ObjectiveDistanceCache.get_closest_airfields(location)
-        best_aircraft = AircraftType.priority_list_for_task(task)
-        ordered: list[Squadron] = []
-        for control_point in airfield_cache.operational_airfields:
+        capable: list[Squadron] = []
+        for squadron in self._auto_assignable_by_priority(task):
+            control_point = squadron.location
             if control_point.captured != self.player:
                 continue
             if control_point.ferry_only:
                 continue
-            capable_at_base = []
-            for squadron in control_point.squadrons:
-                if squadron.can_auto_assign_mission(location, task, size, this_turn):
-                    capable_at_base.append(squadron)
-                    if squadron.aircraft not in best_aircraft:
-                        # If it is not already in the list it should be the last one
-                        best_aircraft.append(squadron.aircraft)
-
-            ordered.extend(
-                sorted(
-                    capable_at_base,
-                    key=lambda s: best_aircraft.index(s.aircraft),
-                )
-            )
+            if not control_point.runway_is_operational():
+                continue
+            if squadron.can_auto_assign_mission(location, task, size, this_turn):
+                capable.append(squadron)
 
+        # The squadrons are already in order of aircraft priority, and the sort is
+        # stable, so squadrons at the same airfield remain in that order.
         return sorted(
-            ordered,
+            capable,
             key=lambda s: (
                 # This looks like the opposite of what we want because False sorts
                 # before True.
                 s.primary_task != task,
-                s.location.distance_to(location),
+                airfield_cache.distance_rank(s.location),
             ),
         )
 
@@ -90,21 +118,17 @@ def best_squadron_for(
     def best_available_aircrafts_for(self, task: FlightType) -> list[AircraftType]:
         """Returns an ordered list of available aircrafts for the given task"""
         aircrafts = []
-        best_aircraft_for_task = AircraftType.priority_list_for_task(task)
+        ranks = AircraftType.priority_ranks_for_task(task)
         for aircraft, squadrons in self.squadrons.items():
             for squadron in squadrons:
                 if squadron.location.ferry_only:
                     continue
                 if squadron.untasked_aircraft and squadron.capable_of(task):
                     aircrafts.append(aircraft)
-                    if aircraft not in best_aircraft_for_task:
-                        best_aircraft_for_task.append(aircraft)
                     break
-        # Sort the list ordered by the best capability
-        return sorted(
-            aircrafts,
-            key=lambda ac: best_aircraft_for_task.index(ac),
-        )
+        # Sort the list ordered by the best capability. Aircraft without a priority for
+        # the task are last.
+        return sorted(aircrafts, key=lambda ac: ranks.get(ac, len(ranks)))
 
     def auto_assignable_for_task(self, task: FlightType) -> Iterator[Squadron]:
         for squadron in self.iter_squadrons():
@@ -136,6 +160,7 @@ def end_turn(self) -> None:
             squadron.end_turn()
 
     def reset(self) -> None:
+        self.invalidate_auto_assignable_index()
         for squadron in self.iter_squadrons():
             squadron.return_all_pilots_and_aircraft()
 
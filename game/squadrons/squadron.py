@@ -95,6 +95,7 @@ def set_auto_assignable_mission_types(
         self.auto_assignable_mission_types = {
             t for t in mission_types if self.capable_of(t)
         }
+        self.coalition.air_wing.invalidate_auto_assignable_index()
 
     def claim_new_pilot_if_allowed(self) -> Optional[Pilot]:
         if self.pilot_limits_enabled:
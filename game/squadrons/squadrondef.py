@@ -4,9 +4,8 @@
 from pathlib import Path
 from typing import Optional, TYPE_CHECKING
 
-import yaml
-
 from game.dcs.aircrafttype import AircraftType
+from game.resourcecache import load_yaml
 from game.squadrons.operatingbases import OperatingBases
 from game.squadrons.pilot import Pilot
 
@@ -54,8 +53,7 @@ def operates_from(self, control_point: ControlPoint) -> bool:
 
     @classmethod
     def from_yaml(cls, path: Path) -> SquadronDef:
-        with path.open(encoding="utf8") as squadron_file:
-            data = yaml.safe_load(squadron_file)
+        data = load_yaml(path)
 
         name = data["aircraft"]
         try:
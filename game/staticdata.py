@@ -0,0 +1,94 @@
+"""Start up loading of the game's static databases.
+
+The unit, weapon, faction and campaign databases are independent of each other, and
+most of the time spent loading them when they are not yet cached is spent parsing
+their data files, as is the time spent importing the layouts from the layout miz files.
+Both parsers are pure Python, so the parsing is done in a process pool while the main
+thread builds the registries from the parsed data. When the data is already cached
+there is no parsing to be done and no pool is created.
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from game.campaignloader.campaign import Campaign
+from game.data.weapons import WeaponGroup
+from game.dcs.aircrafttype import AircraftType
+from game.dcs.groundunittype import GroundUnitType
+from game.dcs.shipunittype import ShipUnitType
+from game.factions.factions import Factions
+from game.layout import LAYOUTS
+from game.profiling import logged_duration
+from game.resourcecache import preload_yaml, uncached_yaml
+
+# Starting worker processes has a cost of its own, so a handful of changed files are
+# parsed on demand instead.
+MIN_FILES_TO_PARSE_IN_PARALLEL = 50
+
+STATIC_DATA_DIRECTORIES = [
+    Path("resources/doctrines"),
+    Path("resources/groups"),
+    Path("resources/squadrons"),
+    Path("resources/theaters"),
+    Path("resources/units"),
+    Path("resources/weapons"),
+    Path("resources/weather"),
+]
+
+
+def static_data_yaml_paths() -> Iterator[Path]:
+    for directory in STATIC_DATA_DIRECTORIES:
+        yield from directory.glob("**/*.yaml")
+    for path in itertools.chain(
+        Factions.iter_faction_files(), Campaign.iter_campaign_defs()
+    ):
+        if path.suffix == ".yaml":
+            yield path
+
+
+def load_registries() -> None:
+    with logged_duration("Loading weapons"):
+        WeaponGroup.load_all()
+    with logged_duration("Loading aircraft"):
+        AircraftType.load_all()
+    with logged_duration("Loading ground units"):
+        GroundUnitType.load_all()
+    with logged_duration("Loading ships"):
+        ShipUnitType.load_all()
+
+
+def load_static_data() -> None:
+    """Loads the static game databases, parsing any uncached data in parallel.
+
+    The parsed data is added to the resource cache, and the unit and weapon registries
+    are populated from it. Factions and campaigns are not kept in a registry, so only
+    their files are parsed. Must be called after the DCS saved games directory has
+    been configured.
+    """
+    with logged_duration("Loading static game data"):
+        with logged_duration("Checking resource cache"):
+            uncached = uncached_yaml(static_data_yaml_paths())
+            import_layouts = not LAYOUTS.load_dump()
+
+        if len(uncached) < MIN_FILES_TO_PARSE_IN_PARALLEL and not import_layouts:
+            load_registries()
+            return
+
+        with ProcessPoolExecutor() as pool, ThreadPoolExecutor(1) as background:
+            layouts: Optional[Future[None]] = None
+            if import_layouts:
+                # Imported in the background so that the layout miz files are parsed at
+                # the same time as the YAML.
+                layouts = background.submit(LAYOUTS.import_templates, pool)
+            if len(uncached) >= MIN_FILES_TO_PARSE_IN_PARALLEL:
+                with logged_duration(f"Parsing {len(uncached)} data files"):
+                    preload_yaml(uncached, pool)
+            load_registries()
+            if layouts is not None:
+                with logged_duration("Waiting for layout import"):
+                    layouts.result()
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-import math
 from datetime import timezone
-from typing import Iterator, List, Optional, TYPE_CHECKING, Tuple
+from typing import Any, Iterator, List, Optional, TYPE_CHECKING, Tuple
 from uuid import UUID
 
 from dcs.mapping import Point
@@ -14,6 +13,7 @@
 from .iadsnetwork.iadsnetwork import IadsNetwork
 from .landmap import Landmap, poly_contains
 from .seasonalconditions import SeasonalConditions
+from .spatialindex import TheaterSpatialIndex
 from ..utils import Heading
 
 if TYPE_CHECKING:
@@ -38,9 +38,34 @@ def __init__(
         self.seasonal_conditions = seasonal_conditions
         self.daytime_map = daytime_map
         self.controlpoints: list[ControlPoint] = []
+        self._spatial_index: TheaterSpatialIndex | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_spatial_index"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        state["_spatial_index"] = None
+        self.__dict__.update(state)
+
+    @property
+    def spatial_index(self) -> TheaterSpatialIndex:
+        if self._spatial_index is None:
+            self._spatial_index = TheaterSpatialIndex(self)
+        return self._spatial_index
+
+    def invalidate_spatial_index(self) -> None:
+        """Discards the spatial index so that it is rebuilt when next used.
+
+        Must be called after control points or ground objects are added or removed,
+        and after a fleet moves.
+        """
+        self._spatial_index = None
 
     def add_controlpoint(self, point: ControlPoint) -> None:
         self.controlpoints.append(point)
+        self.invalidate_spatial_index()
 
     @property
     def ground_objects(self) -> Iterator[TheaterGroundObject]:
@@ -138,30 +163,21 @@ def enemy_points(self) -> List[ControlPoint]:
     def closest_control_point(
         self, point: Point, allow_naval: bool = False
     ) -> ControlPoint:
-        closest = self.controlpoints[0]
-        closest_distance = point.distance_to_point(closest.position)
-        for control_point in self.controlpoints[1:]:
-            if control_point.is_fleet and not allow_naval:
-                continue
-            distance = point.distance_to_point(control_point.position)
-            if distance < closest_distance:
-                closest = control_point
-                closest_distance = distance
+        closest = self.spatial_index.closest_control_point(point, allow_naval)
+        if closest is None:
+            # Every control point is a fleet.
+            return self.controlpoints[0]
         return closest
 
     def closest_target(self, point: Point) -> MissionTarget:
-        closest: MissionTarget = self.controlpoints[0]
+        closest: MissionTarget = self.closest_control_point(point, allow_naval=True)
         closest_distance = point.distance_to_point(closest.position)
-        for control_point in self.controlpoints[1:]:
-            distance = point.distance_to_point(control_point.position)
+        closest_ground_object = self.spatial_index.closest_ground_object(point)
+        if closest_ground_object is not None:
+            tgo, distance = closest_ground_object
             if distance < closest_distance:
-                closest = control_point
+                closest = tgo
                 closest_distance = distance
-            for tgo in control_point.ground_objects:
-                distance = point.distance_to_point(tgo.position)
-                if distance < closest_distance:
-                    closest = tgo
-                    closest_distance = distance
         for conflict in self.conflicts():
             distance = conflict.position.distance_to_point(point)
             if distance < closest_distance:
@@ -174,26 +190,9 @@ def closest_opposing_control_points(self) -> Tuple[ControlPoint, ControlPoint]:
         Returns a tuple of the two nearest opposing ControlPoints in theater.
         (player_cp, enemy_cp)
         """
-        seen = set()
-        min_distance = math.inf
-        closest_blue = None
-        closest_red = None
-        for blue_cp in self.player_points():
-            for red_cp in self.enemy_points():
-                if (blue_cp, red_cp) in seen:
-                    continue
-                seen.add((blue_cp, red_cp))
-                seen.add((red_cp, blue_cp))
-
-                dist = red_cp.position.distance_to_point(blue_cp.position)
-                if dist < min_distance:
-                    closest_red = red_cp
-                    closest_blue = blue_cp
-                    min_distance = dist
-
-        assert closest_blue is not None
-        assert closest_red is not None
-        return closest_blue, closest_red
+        closest = self.spatial_index.closest_opposing_control_points()
+        assert closest is not None
+        return closest
 
     def find_control_point_by_id(self, cp_id: UUID) -> ControlPoint:
         for i in self.controlpoints:
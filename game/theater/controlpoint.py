@@ -849,6 +849,7 @@ def capture(self, game: Game, events: GameUpdateEvents, for_player: bool) -> Non
         self.retreat_air_units(game)
         self.depopulate_uncapturable_tgos()
         self._coalition = new_coalition
+        game.theater.invalidate_spatial_index()
         self.base.set_strength_to_minimum()
         self._clear_front_lines(events)
         self._create_missing_front_lines(game.laser_code_registry, events)
@@ -942,6 +943,7 @@ def process_turn(self, game: Game) -> None:
             delta = self.target_position - self.position
             self.position = self.target_position
             self.target_position = None
+            game.theater.invalidate_spatial_index()
 
             # Move the linked unit groups
             for ground_object in self.ground_objects:
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import ClassVar
+
+import numpy as np
+import numpy.typing as npt
+from dcs.terrain import Terrain
+from pyproj import CRS, Transformer
+
+
+class TerrainProjection:
+    """Converts arrays of coordinates between a terrain's X/Y and lat/lng.
+
+    Point.latlng() and Point.from_latlng() project one point per call to pyproj, and
+    the overhead of each call is much larger than the cost of the projection itself.
+    Passing arrays of coordinates to the transformer projects them in one call with the
+    same results.
+
+    Projections are cached by terrain name, since the projection of a terrain does not
+    change.
+    """
+
+    _by_terrain: ClassVar[dict[str, TerrainProjection]] = {}
+
+    def __init__(self, terrain: Terrain) -> None:
+        crs = terrain.projection_parameters.to_crs()
+        self._xy_to_latlng = Transformer.from_crs(crs, CRS("WGS84"))
+        self._latlng_to_xy = Transformer.from_crs(CRS("WGS84"), crs)
+
+    @classmethod
+    def for_terrain(cls, terrain: Terrain) -> TerrainProjection:
+        try:
+            return cls._by_terrain[terrain.name]
+        except KeyError:
+            projection = cls(terrain)
+            cls._by_terrain[terrain.name] = projection
+            return projection
+
+    def xy_to_latlng(
+        self, x: npt.ArrayLike, y: npt.ArrayLike
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Returns the latitudes and longitudes of the given X/Y coordinates."""
+        lat, lng = self._xy_to_latlng.transform(
+            np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+        )
+        return lat, lng
+
+    def latlng_to_xy(
+        self, lat: npt.ArrayLike, lng: npt.ArrayLike
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Returns the X/Y coordinates of the given latitudes and longitudes."""
+        x, y = self._latlng_to_xy.transform(
+            np.asarray(lat, dtype=np.float64), np.asarray(lng, dtype=np.float64)
+        )
+        return x, y
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+import numpy.typing as npt
+from dcs.mapping import Point
+from shapely.geometry import Point as ShapelyPoint
+from shapely.strtree import STRtree
+
+if TYPE_CHECKING:
+    from .conflicttheater import ConflictTheater
+    from .controlpoint import ControlPoint
+    from .missiontarget import MissionTarget
+    from .theatergroundobject import TheaterGroundObject
+
+
+def positions_of(targets: Sequence[MissionTarget]) -> npt.NDArray[np.float64]:
+    """Returns the X/Y coordinates of the targets as an array of shape (n, 2)."""
+    return np.array(
+        [(t.position.x, t.position.y) for t in targets], dtype=np.float64
+    ).reshape(-1, 2)
+
+
+def distances_between(
+    a: npt.NDArray[np.float64], b: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """Returns the distance between every point in a and every point in b."""
+    return np.hypot(a[:, np.newaxis, 0] - b[:, 0], a[:, np.newaxis, 1] - b[:, 1])
+
+
+class TheaterSpatialIndex:
+    """Positions of the control points and ground objects of a theater.
+
+    Answers the distance queries of the planners and the campaign loader with NumPy
+    rather than by looping over every control point or ground object. Includes the
+    distance between every pair of control points and an STRtree of the ground
+    objects.
+
+    The index is built by ConflictTheater.spatial_index when it is first needed. It is
+    rebuilt after ConflictTheater.invalidate_spatial_index is called, which must happen
+    whenever control points or ground objects are added or removed, or a fleet moves.
+    The ownership of control points is not indexed, so it is always current.
+    """
+
+    def __init__(self, theater: ConflictTheater) -> None:
+        self.control_points = list(theater.controlpoints)
+        self._control_point_indices: dict[MissionTarget, int] = {
+            cp: i for i, cp in enumerate(self.control_points)
+        }
+        self.control_point_positions = positions_of(self.control_points)
+        self.is_fleet = np.array(
+            [cp.is_fleet for cp in self.control_points], dtype=bool
+        )
+        self.control_point_distances = distances_between(
+            self.control_point_positions, self.control_point_positions
+        )
+
+        self.ground_objects = list(theater.ground_objects)
+        self._ground_object_tree = STRtree(
+            [ShapelyPoint(g.position.x, g.position.y) for g in self.ground_objects]
+        )
+
+    def player_owned(self) -> npt.NDArray[np.bool_]:
+        """Returns whether each control point is owned by the player.
+
+        Ownership is read when queried rather than when the index is built because the
+        campaign loader uses the index before the coalitions of the control points are
+        set.
+        """
+        return np.array([cp.captured for cp in self.control_points], dtype=bool)
+
+    def distances_to_control_points(self, point: Point) -> npt.NDArray[np.float64]:
+        return np.hypot(
+            self.control_point_positions[:, 0] - point.x,
+            self.control_point_positions[:, 1] - point.y,
+        )
+
+    def control_points_by_distance(self, target: MissionTarget) -> list[ControlPoint]:
+        """Returns every control point, ordered by distance from the target.
+
+        Control points at the same distance are in the order of the theater.
+        """
+        index = self._control_point_indices.get(target)
+        if index is None:
+            distances = self.distances_to_control_points(target.position)
+        else:
+            distances = self.control_point_distances[index]
+        return [self.control_points[i] for i in np.argsort(distances, kind="stable")]
+
+    def distances_to_closest_control_point(
+        self, targets: Sequence[MissionTarget], player: bool
+    ) -> npt.NDArray[np.float64]:
+        """Returns the distance from each target to the closest control point owned
+        by the given coalition.
+        """
+        owned = self.control_point_positions[self.player_owned() == player]
+        if not len(targets) or not len(owned):
+            return np.full(len(targets), np.inf)
+        return distances_between(positions_of(targets), owned).min(axis=1)
+
+    def closest_control_point(
+        self, point: Point, allow_naval: bool = False
+    ) -> Optional[ControlPoint]:
+        distances = self.distances_to_control_points(point)
+        if not allow_naval:
+            distances[self.is_fleet] = np.inf
+        if not np.isfinite(distances).any():
+            return None
+        # argmin returns the first of equally distant control points.
+        return self.control_points[int(np.argmin(distances))]
+
+    def closest_ground_object(
+        self, point: Point
+    ) -> Optional[tuple[TheaterGroundObject, float]]:
+        """Returns the closest ground object to the point and its distance."""
+        if not self.ground_objects:
+            return None
+        indices = self._ground_object_tree.query_nearest(ShapelyPoint(point.x, point.y))
+        # All ground objects at the nearest distance are returned. Prefer the first in
+        # the order of the theater.
+        ground_object = self.ground_objects[int(indices.min())]
+        return ground_object, point.distance_to_point(ground_object.position)
+
+    def closest_opposing_control_points(
+        self,
+    ) -> Optional[tuple[ControlPoint, ControlPoint]]:
+        """Returns the closest pair of player and enemy control points."""
+        player_owned = self.player_owned()
+        (player,) = np.nonzero(player_owned)
+        (enemy,) = np.nonzero(~player_owned)
+        if not len(player) or not len(enemy):
+            return None
+        distances = self.control_point_distances[np.ix_(player, enemy)]
+        player_index, enemy_index = np.unravel_index(
+            np.argmin(distances), distances.shape
+        )
+        return (
+            self.control_points[player[player_index]],
+            self.control_points[enemy[enemy_index]],
+        )
@@ -169,6 +169,7 @@ def prepare_theater(self) -> None:
         # do remove
         for cp in to_remove:
             self.theater.controlpoints.remove(cp)
+        self.theater.invalidate_spatial_index()
 
 
 class ControlPointGroundObjectGenerator:
@@ -507,6 +508,7 @@ def generate(self) -> None:
         for control_point in control_points:
             if not self.generate_for_control_point(control_point):
                 self.game.theater.controlpoints.remove(control_point)
+        self.game.theater.invalidate_spatial_index()
 
     def generate_for_control_point(self, control_point: ControlPoint) -> bool:
         generator: ControlPointGroundObjectGenerator
@@ -3,6 +3,7 @@
 import itertools
 import uuid
 from abc import ABC
+from dataclasses import dataclass
 from typing import Any, Iterator, List, Optional, TYPE_CHECKING
 
 from dcs.mapping import Point
@@ -55,6 +56,13 @@
 }
 
 
+@dataclass(frozen=True)
+class ThreatRanges:
+    threat: Distance
+    radar_threat: Distance
+    detection: Distance
+
+
 class TheaterGroundObject(MissionTarget, SidcDescribable, ABC):
     def __init__(
         self,
@@ -72,14 +80,17 @@ def __init__(
         self.sea_object = sea_object
         self.groups: List[TheaterGroup] = []
         self.original_name = location.original_name
+        self._threat_ranges: ThreatRanges | None = None
         self._threat_poly: ThreatPoly | None = None
 
     def __getstate__(self) -> dict[str, Any]:
         state = self.__dict__.copy()
+        del state["_threat_ranges"]
         del state["_threat_poly"]
         return state
 
     def __setstate__(self, state: dict[str, Any]) -> None:
+        state["_threat_ranges"] = None
         state["_threat_poly"] = None
         self.__dict__.update(state)
 
@@ -184,22 +195,54 @@ def has_aa(self) -> bool:
     @property
     def has_live_radar_sam(self) -> bool:
         """Returns True if the ground object contains a unit with working radar SAM."""
-        return any(g.max_threat_range(radar_only=True) for g in self.groups)
+        return bool(self.threat_ranges.radar_threat)
 
     def max_detection_range(self) -> Distance:
         """Calculate the maximum detection range of the ground object"""
-        return max((g.max_detection_range() for g in self.groups), default=meters(0))
+        return self.threat_ranges.detection
 
     def max_threat_range(self) -> Distance:
         """Calculate the maximum threat range of the ground object"""
-        return max((g.max_threat_range() for g in self.groups), default=meters(0))
+        return self.threat_ranges.threat
+
+    def max_radar_threat_range(self) -> Distance:
+        """Calculate the maximum threat range of the radar SAMs of the ground object"""
+        return self.threat_ranges.radar_threat
+
+    @property
+    def threat_ranges(self) -> ThreatRanges:
+        """The ranges of the ground object's air defenses.
+
+        The ranges of each group are computed by pairing launchers with their track
+        radars, so they are cached until invalidate_threat_ranges is called.
+        """
+        if self._threat_ranges is None:
+            self._threat_ranges = ThreatRanges(
+                threat=max(
+                    (g.max_threat_range() for g in self.groups), default=meters(0)
+                ),
+                radar_threat=max(
+                    (g.max_threat_range(radar_only=True) for g in self.groups),
+                    default=meters(0),
+                ),
+                detection=max(
+                    (g.max_detection_range() for g in self.groups), default=meters(0)
+                ),
+            )
+        return self._threat_ranges
 
     def threat_poly(self) -> ThreatPoly | None:
         if self._threat_poly is None:
             self._threat_poly = self._make_threat_poly()
         return self._threat_poly
 
-    def invalidate_threat_poly(self) -> None:
+    def invalidate_threat_ranges(self) -> None:
+        """Clears the cached threat ranges and threat poly of the ground object.
+
+        Must be called whenever units of the ground object are killed, repaired, added
+        or removed.
+        """
+        self._threat_ranges = None
         self._threat_poly = None
 
     def _make_threat_poly(self) -> ThreatPoly | None:
@@ -232,7 +275,7 @@ def mark_locations(self) -> Iterator[Point]:
         yield self.position
 
     def clear(self) -> None:
-        self.invalidate_threat_poly()
+        self.invalidate_threat_ranges()
         self.groups = []
 
     @property
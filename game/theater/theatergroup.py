@@ -67,7 +67,7 @@ def unit_type(self) -> Optional[UnitType[Any]]:
 
     def kill(self, events: GameUpdateEvents) -> None:
         self.alive = False
-        self.ground_object.invalidate_threat_poly()
+        self.ground_object.invalidate_threat_ranges()
         events.update_tgo(self.ground_object)
 
     @property
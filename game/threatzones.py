@@ -1,10 +1,17 @@
 from __future__ import annotations
 
-from functools import singledispatchmethod
-from typing import Iterable, Optional, TYPE_CHECKING, Union
-
+import math
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass
+from functools import cached_property, singledispatchmethod
+from typing import Iterable, Optional, Sequence, TYPE_CHECKING, Union
+
+import numpy as np
+import numpy.typing as npt
+import shapely
 from dcs.mapping import Point as DcsPoint
 from shapely.geometry import (
+    GeometryCollection,
     LineString,
     MultiPolygon,
     Point as ShapelyPoint,
@@ -12,6 +19,7 @@
 )
 from shapely.geometry.base import BaseGeometry
 from shapely.ops import nearest_points, unary_union
+from shapely.strtree import STRtree
 
 from game.ato import Flight, FlightWaypoint
 from game.ato.closestairfields import ObjectiveDistanceCache
@@ -31,19 +39,293 @@
 ThreatPoly = Union[MultiPolygon, Polygon]
 
 
+@dataclass(frozen=True)
+class ThreatCircle:
+    x: float
+    y: float
+    radius: float
+
+    def to_polygon(self) -> Polygon:
+        return ShapelyPoint(self.x, self.y).buffer(self.radius)
+
+    def overlaps(self, other: ThreatCircle) -> bool:
+        distance = math.hypot(self.x - other.x, self.y - other.y)
+        return distance <= self.radius + other.radius
+
+
+@dataclass(frozen=True, eq=False)
+class ThreatCluster:
+    """A set of transitively overlapping threat circles and their union."""
+
+    sources: frozenset[Hashable]
+    geometry: BaseGeometry
+
+
+class ThreatLayer:
+    """The union of a set of threat circles that can be updated one source at a time.
+
+    Each source (a control point or TGO) projects at most one circle per layer. The
+    circles are grouped into clusters of circles that transitively overlap. Clusters
+    are disjoint, so the union of the layer is just the collection of the cluster
+    unions, and adding, removing, or changing a source only needs to re-union the
+    clusters that source touches.
+
+    Layers are immutable. Updates return a new layer that shares the unaffected
+    clusters with the original, so copies of the planner's theater state can diverge
+    without copying or recomputing the whole layer.
+    """
+
+    # Clusters with at most this many members are rebuilt from scratch when a member
+    # is removed.
+    REGROUP_LIMIT = 8
+
+    def __init__(
+        self,
+        circles: dict[Hashable, ThreatCircle],
+        polygons: dict[Hashable, Polygon],
+        clusters: dict[Hashable, ThreatCluster],
+    ) -> None:
+        self._circles = circles
+        self._polygons = polygons
+        # Maps each source to the cluster that contains it.
+        self._clusters = clusters
+
+    @classmethod
+    def empty(cls) -> ThreatLayer:
+        return ThreatLayer({}, {}, {})
+
+    @classmethod
+    def from_circles(cls, circles: Mapping[Hashable, ThreatCircle]) -> ThreatLayer:
+        return cls.empty().updated(circles)
+
+    @property
+    def circles(self) -> Mapping[Hashable, ThreatCircle]:
+        return self._circles
+
+    def _unique_clusters(self) -> list[ThreatCluster]:
+        return list({id(c): c for c in self._clusters.values()}.values())
+
+    @cached_property
+    def geometry(self) -> ThreatPoly:
+        clusters = self._unique_clusters()
+        if not clusters:
+            # Matches the result of unary_union([]).
+            return GeometryCollection()
+        if len(clusters) == 1:
+            geometry = clusters[0].geometry
+        else:
+            geometry = MultiPolygon(
+                [p for c in clusters for p in shapely.get_parts(c.geometry)]
+            )
+        # The layer geometry is tested against many flight paths and points, so
+        # prepare it once up front rather than re-indexing its edges on each test.
+        shapely.prepare(geometry)
+        return geometry
+
+    def without(self, source: Hashable) -> ThreatLayer:
+        if source not in self._circles:
+            return self
+        circles = dict(self._circles)
+        del circles[source]
+        return self.updated(circles)
+
+    def updated(self, circles: Mapping[Hashable, ThreatCircle]) -> ThreatLayer:
+        """Returns a layer for the given circles, reusing clusters where possible."""
+        removed = [
+            source
+            for source, circle in self._circles.items()
+            if circles.get(source) != circle
+        ]
+        added = [
+            source
+            for source, circle in circles.items()
+            if self._circles.get(source) != circle
+        ]
+        if not removed and not added:
+            return self
+
+        if len(removed) + len(added) > len(circles) // 4:
+            # Too much has changed for patching to be worthwhile.
+            polygons = {s: c.to_polygon() for s, c in circles.items()}
+            nodes = [(frozenset([s]), p) for s, p in polygons.items()]
+            clusters = {
+                source: cluster
+                for cluster in self._cluster_nodes(nodes)
+                for source in cluster.sources
+            }
+            return ThreatLayer(dict(circles), polygons, clusters)
+
+        layer = ThreatLayer(
+            dict(self._circles), dict(self._polygons), dict(self._clusters)
+        )
+        for source in removed:
+            layer._remove(source)
+        layer._add({source: circles[source] for source in added})
+        return layer
+
+    def _remove(self, source: Hashable) -> None:
+        """Removes a source from a newly created layer.
+
+        Must not be called once the layer has been returned to a caller.
+        """
+        circle = self._circles.pop(source)
+        polygon = self._polygons.pop(source)
+        cluster = self._clusters.pop(source)
+        remaining = cluster.sources - {source}
+        if not remaining:
+            return
+
+        if len(remaining) <= self.REGROUP_LIMIT:
+            # Small clusters are cheap to rebuild, and doing so lets them split if the
+            # removed circle was the only link between their members.
+            nodes = [(frozenset([s]), self._polygons[s]) for s in remaining]
+            for new_cluster in self._cluster_nodes(nodes):
+                for member in new_cluster.sources:
+                    self._clusters[member] = new_cluster
+            return
+
+        # For large clusters, cut the part of the removed circle that no other member
+        # covers out of the union. This only works with the geometry near the removed
+        # circle rather than re-unioning every member of the cluster. The cluster
+        # might no longer be connected, but it is still disjoint from every other
+        # cluster.
+        neighbors = [
+            self._polygons[s] for s in remaining if self._circles[s].overlaps(circle)
+        ]
+        uncovered = polygon.difference(unary_union(neighbors))
+        geometry = self._polygonal(cluster.geometry.difference(uncovered))
+        new_cluster = ThreatCluster(remaining, geometry)
+        for member in remaining:
+            self._clusters[member] = new_cluster
+
+    def _add(self, circles: Mapping[Hashable, ThreatCircle]) -> None:
+        """Adds sources to a newly created layer.
+
+        Must not be called once the layer has been returned to a caller.
+        """
+        if not circles:
+            return
+
+        new_polygons = {s: c.to_polygon() for s, c in circles.items()}
+        nodes: list[tuple[frozenset[Hashable], BaseGeometry]] = [
+            (frozenset([s]), p) for s, p in new_polygons.items()
+        ]
+
+        # The new circles may join existing clusters together. Existing clusters are
+        # regrouped as a single node each.
+        existing = self._unique_clusters()
+        if existing:
+            tree = STRtree([c.geometry for c in existing])
+            _, touched = tree.query(list(new_polygons.values()), predicate="intersects")
+            nodes.extend(
+                (existing[i].sources, existing[i].geometry)
+                for i in sorted(set(touched.tolist()))
+            )
+
+        self._circles.update(circles)
+        self._polygons.update(new_polygons)
+        for cluster in self._cluster_nodes(nodes):
+            for source in cluster.sources:
+                self._clusters[source] = cluster
+
+    @staticmethod
+    def _polygonal(geometry: BaseGeometry) -> BaseGeometry:
+        """Drops any degenerate lines or points left behind by an overlay operation."""
+        if isinstance(geometry, (Polygon, MultiPolygon)):
+            return geometry
+        return MultiPolygon(
+            [p for p in shapely.get_parts(geometry) if isinstance(p, Polygon)]
+        )
+
+    @staticmethod
+    def _cluster_nodes(
+        nodes: list[tuple[frozenset[Hashable], BaseGeometry]]
+    ) -> Iterable[ThreatCluster]:
+        if not nodes:
+            return []
+
+        # Union-find over the nodes, joining every pair of intersecting geometries.
+        parents = list(range(len(nodes)))
+
+        def find(i: int) -> int:
+            while parents[i] != i:
+                parents[i] = parents[parents[i]]
+                i = parents[i]
+            return i
+
+        geometries = [g for _, g in nodes]
+        tree = STRtree(geometries)
+        for a, b in zip(*tree.query(geometries, predicate="intersects").tolist()):
+            root_a = find(a)
+            root_b = find(b)
+            if root_a != root_b:
+                parents[root_a] = root_b
+
+        components: dict[int, list[int]] = {}
+        for i in range(len(nodes)):
+            components.setdefault(find(i), []).append(i)
+
+        return [
+            ThreatCluster(
+                frozenset().union(*(nodes[i][0] for i in members)),
+                (
+                    geometries[members[0]]
+                    if len(members) == 1
+                    else unary_union([geometries[i] for i in members])
+                ),
+            )
+            for members in components.values()
+        ]
+
+
 class ThreatZones:
     def __init__(
         self,
         theater: ConflictTheater,
-        airbases: ThreatPoly,
-        air_defenses: ThreatPoly,
-        radar_sam_threats: ThreatPoly,
+        airbases: ThreatLayer,
+        air_defenses: ThreatLayer,
+        radar_sam_threats: ThreatLayer,
+        all_threats: Optional[ThreatLayer] = None,
     ) -> None:
         self.theater = theater
-        self.airbases = airbases
-        self.air_defenses = air_defenses
-        self.radar_sam_threats = radar_sam_threats
-        self.all = unary_union([airbases, air_defenses])
+        self.airbase_layer = airbases
+        self.air_defense_layer = air_defenses
+        self.radar_sam_layer = radar_sam_threats
+        if all_threats is None:
+            all_threats = ThreatLayer.from_circles(
+                {**airbases.circles, **air_defenses.circles}
+            )
+        self.all_layer = all_threats
+
+    @property
+    def airbases(self) -> ThreatPoly:
+        return self.airbase_layer.geometry
+
+    @property
+    def air_defenses(self) -> ThreatPoly:
+        return self.air_defense_layer.geometry
+
+    @property
+    def radar_sam_threats(self) -> ThreatPoly:
+        return self.radar_sam_layer.geometry
+
+    @property
+    def all(self) -> ThreatPoly:
+        return self.all_layer.geometry
+
+    def without_threat(self, source: Hashable) -> ThreatZones:
+        """Returns the threat zones that remain if the given source is eliminated.
+
+        Only the clusters of threat circles that include the source are recomputed,
+        and this object is not modified.
+        """
+        return ThreatZones(
+            self.theater,
+            self.airbase_layer.without(source),
+            self.air_defense_layer.without(source),
+            self.radar_sam_layer.without(source),
+            self.all_layer.without(source),
+        )
 
     def closest_boundary(self, point: DcsPoint) -> DcsPoint:
         boundary, _ = nearest_points(
@@ -74,6 +356,35 @@ def path_threatened(self, a: DcsPoint, b: DcsPoint) -> bool:
             LineString([self.dcs_to_shapely_point(a), self.dcs_to_shapely_point(b)])
         )
 
+    def geometries_threatened(
+        self, geometries: Sequence[BaseGeometry] | npt.NDArray[np.object_]
+    ) -> npt.NDArray[np.bool_]:
+        """Tests each of the given geometries against the combined threat zone."""
+        return shapely.intersects(self.all, geometries)
+
+    def points_threatened(self, points: Sequence[DcsPoint]) -> npt.NDArray[np.bool_]:
+        """Tests each of the given points against the combined threat zone."""
+        return self.geometries_threatened(
+            shapely.points(np.array([(p.x, p.y) for p in points]).reshape(-1, 2))
+        )
+
+    def segments_threatened(
+        self, starts: Sequence[DcsPoint], ends: Sequence[DcsPoint]
+    ) -> npt.NDArray[np.bool_]:
+        """Tests each path from starts[i] to ends[i] against the combined threat zone.
+
+        This is equivalent to calling path_threatened for each pair of points, but
+        tests all paths with a single call into shapely.
+        """
+        if len(starts) != len(ends):
+            raise ValueError(
+                f"Got {len(starts)} segment start points but {len(ends)} end points"
+            )
+        coords = np.array(
+            [((a.x, a.y), (b.x, b.y)) for a, b in zip(starts, ends)]
+        ).reshape(-1, 2, 2)
+        return self.geometries_threatened(shapely.linestrings(coords))
+
     # Type checking ignored because singledispatchmethod doesn't work with required type
     # definitions. The implementation methods are all typed, so should be fine.
     @singledispatchmethod
@@ -150,6 +461,57 @@ def waypoints_threatened_by_radar_sam(
             LineString((self.dcs_to_shapely_point(p.position) for p in waypoints))
         )
 
+    def paths_threatened_by_aircraft(
+        self, paths: npt.NDArray[np.object_]
+    ) -> npt.NDArray[np.bool_]:
+        """Tests each of the given paths against the aircraft threat zone.
+
+        Paths can be created with waypoint_paths.
+        """
+        return shapely.intersects(self.airbases, paths)
+
+    def paths_threatened_by_radar_sam(
+        self, paths: npt.NDArray[np.object_]
+    ) -> npt.NDArray[np.bool_]:
+        """Tests each of the given paths against the radar SAM threat zone.
+
+        Paths can be created with waypoint_paths.
+        """
+        return shapely.intersects(self.radar_sam_threats, paths)
+
+    @staticmethod
+    def waypoint_paths(
+        paths: Iterable[Iterable[FlightWaypoint]],
+    ) -> npt.NDArray[np.object_]:
+        """Converts each sequence of waypoints to a geometry for the batch threat tests.
+
+        Paths of two or more waypoints become lines, and paths of a single waypoint
+        become points. Paths without waypoints become None, which is never threatened.
+        """
+        coords: list[tuple[float, float]] = []
+        line_indices: list[int] = []
+        line_paths: list[int] = []
+        point_coords: list[tuple[float, float]] = []
+        point_paths: list[int] = []
+        path_count = 0
+        for path_index, path in enumerate(paths):
+            path_count += 1
+            path_coords = [(w.position.x, w.position.y) for w in path]
+            if len(path_coords) == 1:
+                point_coords.extend(path_coords)
+                point_paths.append(path_index)
+            elif path_coords:
+                coords.extend(path_coords)
+                line_indices.extend([len(line_paths)] * len(path_coords))
+                line_paths.append(path_index)
+
+        geometries = np.full(path_count, None, dtype=object)
+        if line_paths:
+            geometries[line_paths] = shapely.linestrings(coords, indices=line_indices)
+        if point_paths:
+            geometries[point_paths] = shapely.points(point_coords)
+        return geometries
+
     @classmethod
     def closest_enemy_airbase(
         cls, location: ControlPoint, max_distance: Distance
@@ -187,13 +549,17 @@ def barcap_threat_range(
         return min(cap_threat_range, max_distance)
 
     @classmethod
-    def for_faction(cls, game: Game, player: bool) -> ThreatZones:
+    def for_faction(
+        cls, game: Game, player: bool, previous: Optional[ThreatZones] = None
+    ) -> ThreatZones:
         """Generates the threat zones projected by the given coalition.
 
         Args:
             game: The game to generate the threat zone for.
             player: True if the coalition projecting the threat zone belongs to
             the player.
+            previous: The previous threat zones of the coalition, if any. Only the
+            parts of the zones affected by changed threats will be recomputed.
 
         Returns:
             The threat zones projected by the given coalition. If the threat
@@ -207,7 +573,11 @@ def for_faction(cls, game: Game, player: bool) -> ThreatZones:
             air_defenses.extend([go for go in cp.ground_objects if go.has_aa])
 
         return cls.for_threats(
-            game.theater, game.faction_for(player).doctrine, air_threats, air_defenses
+            game.theater,
+            game.faction_for(player).doctrine,
+            air_threats,
+            air_defenses,
+            previous,
         )
 
     @classmethod
@@ -217,6 +587,7 @@ def for_threats(
         doctrine: Doctrine,
         barcap_locations: Iterable[ControlPoint],
         air_defenses: Iterable[TheaterGroundObject],
+        previous: Optional[ThreatZones] = None,
     ) -> ThreatZones:
         """Generates the threat zones projected by the given locations.
 
@@ -225,40 +596,54 @@ def for_threats(
             doctrine: The doctrine of the owning coalition.
             barcap_locations: The locations that will be considered for BARCAP planning.
             air_defenses: TGOs that may have air defenses.
+            previous: Threat zones to update rather than building new zones from
+            scratch. Only the parts of the zones affected by changed threats will be
+            recomputed.
 
         Returns:
             The threat zones projected by the given locations. If the threat zone
             belongs to the player, it is the zone that will be avoided by the enemy and
             vice versa.
         """
-        air_threats = []
-        air_defense_threats = []
-        radar_sam_threats = []
+        air_threats: dict[Hashable, ThreatCircle] = {}
+        air_defense_threats: dict[Hashable, ThreatCircle] = {}
+        radar_sam_threats: dict[Hashable, ThreatCircle] = {}
         for barcap in barcap_locations:
-            point = ShapelyPoint(barcap.position.x, barcap.position.y)
             cap_threat_range = cls.barcap_threat_range(doctrine, barcap)
-            air_threats.append(point.buffer(cap_threat_range.meters))
+            air_threats[barcap] = ThreatCircle(
+                barcap.position.x, barcap.position.y, cap_threat_range.meters
+            )
 
         for tgo in air_defenses:
-            for group in tgo.groups:
-                threat_range = group.max_threat_range()
-                # Any system with a shorter range than this is not worth
-                # even avoiding.
-                if threat_range > nautical_miles(3):
-                    point = ShapelyPoint(tgo.position.x, tgo.position.y)
-                    threat_zone = point.buffer(threat_range.meters)
-                    air_defense_threats.append(threat_zone)
-                radar_threat_range = group.max_threat_range(radar_only=True)
-                if radar_threat_range > nautical_miles(3):
-                    point = ShapelyPoint(tgo.position.x, tgo.position.y)
-                    threat_zone = point.buffer(radar_threat_range.meters)
-                    radar_sam_threats.append(threat_zone)
-
+            # The threat zones of every group in the TGO are centered on the TGO, so
+            # the union of those zones is the zone of the longest ranged group.
+            threat_range = tgo.max_threat_range()
+            radar_threat_range = tgo.max_radar_threat_range()
+            # Any system with a shorter range than this is not worth even avoiding.
+            if threat_range > nautical_miles(3):
+                air_defense_threats[tgo] = ThreatCircle(
+                    tgo.position.x, tgo.position.y, threat_range.meters
+                )
+            if radar_threat_range > nautical_miles(3):
+                radar_sam_threats[tgo] = ThreatCircle(
+                    tgo.position.x, tgo.position.y, radar_threat_range.meters
+                )
+
+        if previous is None:
+            return ThreatZones(
+                theater,
+                airbases=ThreatLayer.from_circles(air_threats),
+                air_defenses=ThreatLayer.from_circles(air_defense_threats),
+                radar_sam_threats=ThreatLayer.from_circles(radar_sam_threats),
+            )
         return ThreatZones(
             theater,
-            airbases=unary_union(air_threats),
-            air_defenses=unary_union(air_defense_threats),
-            radar_sam_threats=unary_union(radar_sam_threats),
+            airbases=previous.airbase_layer.updated(air_threats),
+            air_defenses=previous.air_defense_layer.updated(air_defense_threats),
+            radar_sam_threats=previous.radar_sam_layer.updated(radar_sam_threats),
+            all_threats=previous.all_layer.updated(
+                {**air_threats, **air_defense_threats}
+            ),
         )
 
     @staticmethod
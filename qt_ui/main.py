@@ -2,6 +2,7 @@
 
 import argparse
 import logging
+import multiprocessing
 import ntpath
 import os
 import sys
@@ -22,12 +23,14 @@
 from game.data.weapons import Pylon, Weapon, WeaponGroup
 from game.dcs.aircrafttype import AircraftType
 from game.factions.factions import Factions
+from game.persistence import SaveManager
 from game.persistence.paths import liberation_user_dir
 from game.plugins import LuaPluginManager
 from game.profiling import logged_duration
 from game.server import EventStream, Server
 from game.settings import Settings
 from game.sim import GameUpdateEvents
+from game.staticdata import load_static_data
 from game.theater.start_generator import GameGenerator, GeneratorSettings, ModSettings
 from pydcs_extensions import load_mods
 from qt_ui import (
@@ -107,6 +110,7 @@ def run_ui(create_game_params: CreateGameParams | None, ui_flags: UiFlags) -> No
     splash.show()
 
     # Once splash screen is up : load resources & setup stuff
+    load_static_data()
     uiconstants.load_icons()
     uiconstants.load_event_icons()
     uiconstants.load_aircraft_icons()
@@ -163,6 +167,9 @@ def run_ui(create_game_params: CreateGameParams | None, ui_flags: UiFlags) -> No
     splash.finish(window)
     qt_execution_code = app.exec_()
 
+    logging.info("Waiting for saves to finish writing")
+    SaveManager.flush()
+
     # Restore Mission Scripting file
     logging.info("QT App terminated with status code : " + str(qt_execution_code))
     logging.info("Attempt to restore original mission scripting file")
@@ -411,6 +418,9 @@ def dump_task_priorities() -> None:
 
 
 def main():
+    # Required for the process pools used during start up in the packaged app.
+    multiprocessing.freeze_support()
+
     logging_config.init_logging(VERSION)
 
     logging.debug("Python version %s", sys.version)
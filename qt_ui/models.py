@@ -531,6 +531,7 @@ def set_auto_assignable(self, task: FlightType, auto_assignable: bool) -> None:
             self.squadron.auto_assignable_mission_types.add(task)
         else:
             self.squadron.auto_assignable_mission_types.remove(task)
+        self.squadron.coalition.air_wing.invalidate_auto_assignable_index()
 
 
 class GameModel:
@@ -565,6 +565,7 @@ def apply(self) -> None:
         self.air_wing.squadrons = {}
         for aircraft, page in self.squadrons_pages.items():
             self.air_wing.squadrons[aircraft] = page.apply()
+        self.air_wing.invalidate_auto_assignable_index()
 
     def revert(self) -> None:
         for _, page in self.squadrons_pages.items():
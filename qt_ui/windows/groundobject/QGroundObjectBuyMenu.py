@@ -221,7 +221,7 @@ def buy_group(self) -> None:
             or self.ground_object.heading
         )
         self.game.blue.budget -= self.cost
-        self.ground_object.groups = []
+        self.ground_object.clear()
         for group_name, groups in self.layout_model.groups.items():
             for group in groups:
                 if group.enabled:
@@ -233,6 +233,7 @@ def repair_unit(self, unit, price):
         if self.game.blue.budget > price:
             self.game.blue.budget -= price
             unit.alive = True
+            unit.ground_object.invalidate_threat_ranges()
             GameUpdateSignal.get_instance().updateGame(self.game)
 
             # Remove destroyed units in the vicinity
@@ -253,7 +254,7 @@ def rotate_tgo(self, heading: Heading) -> None:
     def sell_all(self):
         self.update_total_value()
         self.game.blue.budget += self.total_value
-        self.ground_object.groups = []
+        self.ground_object.clear()
         self.update_game()
 
     def buy_group(self) -> None:
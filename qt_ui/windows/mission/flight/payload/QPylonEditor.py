@@ -1,5 +1,6 @@
 import logging
 import operator
+from collections.abc import Iterable
 from typing import Optional
 
 from PySide6.QtWidgets import QComboBox
@@ -25,6 +26,7 @@ def __init__(
         current = self.flight_member.loadout.pylons.get(self.pylon.number)
 
         self.addItem("None", None)
+        weapons: Iterable[Weapon]
         if self.game.settings.restrict_weapons_by_date:
             weapons = pylon.available_on(
                 self.game.date, flight.squadron.coalition.faction
@@ -119,6 +119,7 @@ def on_changed(self) -> None:
                 self.flight.flight_plan.waypoints[i + 1].alt = Distance.from_feet(
                     altitude_feet
                 )
+        self.flight.flight_plan.invalidate_leg_table()
 
     def tot_text(self, flight: Flight, waypoint: FlightWaypoint) -> str:
         if waypoint.waypoint_type == FlightWaypointType.TAKEOFF:
@@ -122,6 +122,7 @@ def delete_waypoint(self, waypoint: FlightWaypoint) -> None:
         self.degrade_to_custom_flight_plan()
         assert isinstance(self.flight.flight_plan, CustomFlightPlan)
         self.flight.flight_plan.layout.custom_waypoints.remove(waypoint)
+        self.flight.flight_plan.invalidate_leg_table()
 
     def on_fast_waypoint(self):
         self.subwindow = QPredefinedWaypointSelectionWindow(
@@ -136,6 +137,7 @@ def on_waypoints_added(self, waypoints: Iterable[FlightWaypoint]) -> None:
         self.degrade_to_custom_flight_plan()
         assert isinstance(self.flight.flight_plan, CustomFlightPlan)
         self.flight.flight_plan.layout.custom_waypoints.extend(waypoints)
+        self.flight.flight_plan.invalidate_leg_table()
         self.flight_waypoint_list.update_list()
         self.on_change()
 
@@ -144,6 +146,7 @@ def on_rtb_waypoint(self):
         self.degrade_to_custom_flight_plan()
         assert isinstance(self.flight.flight_plan, CustomFlightPlan)
         self.flight.flight_plan.layout.custom_waypoints.append(rtb)
+        self.flight.flight_plan.invalidate_leg_table()
         self.flight_waypoint_list.update_list()
         self.on_change()
 
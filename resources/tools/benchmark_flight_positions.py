@@ -0,0 +1,145 @@
+"""Benchmarks encoding flight position updates for the map.
+
+Compares the JSON encoding of flight positions in the event stream with the binary
+encoding used by clients that connect with ?flight_positions=binary. The positions are
+random points within the bounds of the control points of each save, for the given
+number of flights. The report includes the size of the encoded positions and the
+median time to encode them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, cast
+from uuid import uuid4
+
+from dcs import Point
+from fastapi.encoders import jsonable_encoder
+
+from game import Game
+from game.ato import Flight
+from game.profiling import Timer
+from game.server.eventstream.flightpositions import (
+    FlightIndexTable,
+    encode_flight_positions,
+)
+from game.server.leaflet import LeafletPoint
+from resources.tools.benchmarking import init_headless, load_game
+
+
+class BenchmarkFlight:
+    def __init__(self) -> None:
+        self.id = uuid4()
+
+
+def random_positions(game: Game, count: int, seed: int) -> list[tuple[Flight, Point]]:
+    rng = random.Random(seed)
+    positions = [cp.position for cp in game.theater.controlpoints]
+    min_x = min(p.x for p in positions)
+    max_x = max(p.x for p in positions)
+    min_y = min(p.y for p in positions)
+    max_y = max(p.y for p in positions)
+    return [
+        (
+            cast(Flight, BenchmarkFlight()),
+            game.point_in_world(rng.uniform(min_x, max_x), rng.uniform(min_y, max_y)),
+        )
+        for _ in range(count)
+    ]
+
+
+def encode_json(positions: list[tuple[Flight, Point]]) -> bytes:
+    # Matches GameUpdateEventsJs.updated_flight_positions.
+    return json.dumps(
+        jsonable_encoder({f.id: LeafletPoint.from_pydcs(p) for f, p in positions}),
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def median_seconds(encode: Callable[[], object], repetitions: int) -> float:
+    durations = []
+    for _ in range(repetitions):
+        timer = Timer()
+        with timer:
+            encode()
+        durations.append(timer.duration.total_seconds())
+    return statistics.median(durations)
+
+
+def benchmark_save(
+    path: Path, flights: int, repetitions: int, seed: int
+) -> dict[str, Any]:
+    game = load_game(path)
+    positions = random_positions(game, flights, seed)
+    # The flight table is only sent when flights are added to it, so it is not included
+    # in the size of each update.
+    table = FlightIndexTable()
+    table.indices_for([f.id for f, _ in positions])
+
+    def encode_binary() -> bytes:
+        message, _ = encode_flight_positions(positions, table, game.theater.terrain)
+        return message
+
+    return {
+        "save": str(path),
+        "flights": flights,
+        "json_bytes": len(encode_json(positions)),
+        "json_seconds": median_seconds(lambda: encode_json(positions), repetitions),
+        "binary_bytes": len(encode_binary()),
+        "binary_table_bytes": len(table.message),
+        "binary_seconds": median_seconds(encode_binary, repetitions),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "saves",
+        type=Path,
+        nargs="+",
+        help="Paths to the .liberation.zip files to load.",
+    )
+    parser.add_argument(
+        "--flights",
+        type=int,
+        default=500,
+        help="Number of flight positions to encode.",
+    )
+    parser.add_argument(
+        "--repetitions",
+        type=int,
+        default=50,
+        help="Number of times to encode the positions.",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Path to write the JSON report to. Defaults to stdout.",
+    )
+    args = parser.parse_args()
+
+    init_headless()
+    report = {
+        "saves": [
+            benchmark_save(path, args.flights, args.repetitions, args.seed)
+            for path in args.saves
+        ]
+    }
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        with args.output.open("w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
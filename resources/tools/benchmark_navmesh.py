@@ -0,0 +1,95 @@
+"""Benchmarks nav mesh queries on the meshes of a saved game.
+
+Compares NavMesh.localize against the linear scan of nav polys that it replaced, and
+reports the throughput of NavMesh.shortest_path for the portal search.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import timeit
+from pathlib import Path
+from typing import Optional
+
+from dcs.mapping import Point
+from shapely.geometry import Point as ShapelyPoint
+
+from game.navmesh import NavMesh, NavMeshPoly
+from resources.tools.benchmarking import init_headless, load_game
+
+
+def linear_localize(mesh: NavMesh, point: Point) -> Optional[NavMeshPoly]:
+    p = ShapelyPoint(point.x, point.y)
+    for navpoly in mesh.polys:
+        if navpoly.poly.intersects(p):
+            return navpoly
+    return None
+
+
+def random_points(mesh: NavMesh, count: int, rng: random.Random) -> list[Point]:
+    min_x = min(p.poly.bounds[0] for p in mesh.polys)
+    min_y = min(p.poly.bounds[1] for p in mesh.polys)
+    max_x = max(p.poly.bounds[2] for p in mesh.polys)
+    max_y = max(p.poly.bounds[3] for p in mesh.polys)
+    return [
+        Point(
+            rng.uniform(min_x, max_x), rng.uniform(min_y, max_y), mesh.theater.terrain
+        )
+        for _ in range(count)
+    ]
+
+
+def benchmark_mesh(name: str, mesh: NavMesh, lookups: int, seed: int) -> None:
+    points = random_points(mesh, lookups, random.Random(seed))
+
+    for point in points:
+        if mesh.localize(point) != linear_localize(mesh, point):
+            raise RuntimeError(f"Indexed and linear localization disagree at {point}")
+
+    indexed = timeit.timeit(lambda: [mesh.localize(p) for p in points], number=1)
+    linear = timeit.timeit(lambda: [linear_localize(mesh, p) for p in points], number=1)
+    print(f"{name}: {len(mesh.polys)} polys")
+    print(f"\tindexed: {lookups / indexed:.0f} lookups/s")
+    print(f"\tlinear:  {lookups / linear:.0f} lookups/s")
+    print(f"\tspeedup: {linear / indexed:.1f}x")
+
+
+def benchmark_paths(name: str, mesh: NavMesh, paths: int, seed: int) -> None:
+    portal_mesh = NavMesh(mesh.polys, mesh.theater, use_portal_search=True)
+    rng = random.Random(seed)
+    endpoints: list[tuple[Point, Point]] = []
+    while len(endpoints) < paths:
+        origin, destination = random_points(mesh, 2, rng)
+        if mesh.localize(origin) is not None and mesh.localize(destination) is not None:
+            endpoints.append((origin, destination))
+
+    duration = timeit.timeit(
+        lambda: [portal_mesh.shortest_path(a, b) for a, b in endpoints], number=1
+    )
+    print(f"{name}: {paths / duration:.0f} paths/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("save", type=Path, help="Path to a .liberation.zip to load.")
+    parser.add_argument(
+        "--lookups", type=int, default=10000, help="Number of points to localize."
+    )
+    parser.add_argument(
+        "--paths", type=int, default=1000, help="Number of paths to search for."
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    args = parser.parse_args()
+
+    init_headless()
+    game = load_game(args.save)
+    print(f"{game.theater.terrain.name}, turn {game.turn}")
+    for coalition in game.coalitions:
+        name = "Blue" if coalition.player else "Red"
+        benchmark_mesh(name, coalition.nav_mesh, args.lookups, args.seed)
+        benchmark_paths(name, coalition.nav_mesh, args.paths, args.seed)
+
+
+if __name__ == "__main__":
+    main()
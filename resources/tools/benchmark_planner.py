@@ -0,0 +1,87 @@
+"""Benchmarks the HTN mission planner on a set of saved games.
+
+Each save is loaded, its ATOs are cleared as they would be at the start of a turn, and
+the theater commander plans missions for both coalitions. The results are written as
+JSON so that runs can be compared between releases. For each coalition the report
+includes the wall time, the number of plans found and backtracks, and the time spent
+in each task class, broken down by preconditions, effects, decompositions and
+execution.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+from game import Game
+from game.commander import TheaterCommander
+from game.profiling import MultiEventTracer, PlannerStats, Timer
+from resources.tools.benchmarking import init_headless, load_game
+
+
+def benchmark_coalition(game: Game, player: bool) -> dict[str, Any]:
+    coalition = game.coalition_for(player)
+    # Matches Coalition.initialize_turn so that the planner starts with every aircraft
+    # available, rather than planning around the packages already in the save.
+    coalition.ato.clear()
+    coalition.air_wing.reset()
+
+    stats = PlannerStats()
+    tracer = MultiEventTracer()
+    timer = Timer()
+    with timer:
+        TheaterCommander(game, player, stats).plan_missions(
+            game.conditions.start_time, tracer
+        )
+    return {
+        "seconds": timer.duration.total_seconds(),
+        "packages": len(coalition.ato.packages),
+        "planner": stats.to_dict(),
+        "events": {
+            name: {"count": event.count, "seconds": event.duration.total_seconds()}
+            for name, event in sorted(tracer.events.items())
+        },
+    }
+
+
+def benchmark_save(path: Path) -> dict[str, Any]:
+    game = load_game(path)
+    return {
+        "save": str(path),
+        "theater": game.theater.terrain.name,
+        "turn": game.turn,
+        "blue": benchmark_coalition(game, player=True),
+        "red": benchmark_coalition(game, player=False),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "saves",
+        type=Path,
+        nargs="+",
+        help="Paths to the .liberation.zip files to load.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Path to write the JSON report to. Defaults to stdout.",
+    )
+    args = parser.parse_args()
+
+    init_headless()
+    report = {"saves": [benchmark_save(path) for path in args.saves]}
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        with args.output.open("w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
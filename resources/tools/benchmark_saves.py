@@ -0,0 +1,126 @@
+"""Benchmarks saving and loading games with each save compression option.
+
+For each save and each compression option, a bundle is written the way the game writes
+them during a turn: the last turn and start of turn saves are written first, then the
+pre-sim checkpoint, which copies the existing members, and finally the player save. The
+report includes the time to pickle the game without compression for reference, the time
+of each save and load, the time to compute the threat zones and navmeshes of the loaded
+game, and the size of the resulting bundle. It also reports whether the game could be
+saved in segments, since a game that cannot is saved as a whole.
+
+Pass several saves of the same campaign from consecutive turns to see how the size of
+the bundle and the time to save change as the campaign progresses.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import pickle
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+
+from game import Game
+from game.persistence.savecompression import SaveCompression
+from game.persistence.savegamebundle import SaveGameBundle
+from game.persistence.segmentedpickle import SegmentedSnapshot
+from game.profiling import Timer
+from resources.tools.benchmarking import init_headless, load_game
+
+
+def benchmark_compression(
+    game: Game, compression: SaveCompression, directory: Path
+) -> dict[str, Any]:
+    game.settings.save_compression = compression
+    bundle = SaveGameBundle(directory / f"{compression.name}.liberation.zip")
+    results: dict[str, Any] = {}
+
+    timer = Timer()
+    with timer:
+        bundle.save_last_turn(game)
+    results["save_first_member_seconds"] = timer.duration.total_seconds()
+    bundle.save_start_of_turn(game)
+
+    timer = Timer()
+    with timer:
+        bundle.save_pre_sim_checkpoint(game)
+    results["save_with_copy_seconds"] = timer.duration.total_seconds()
+    bundle.save_player(game, copy_from=bundle)
+    results["bundle_bytes"] = bundle.bundle_path.stat().st_size
+
+    timer = Timer()
+    with timer:
+        loaded = bundle.load_player()
+    results["load_seconds"] = timer.duration.total_seconds()
+
+    # Threat zones and navmeshes are computed on first use rather than on load.
+    timer = Timer()
+    with timer:
+        for coalition in loaded.coalitions:
+            coalition.nav_mesh
+    results["threat_zones_and_navmeshes_seconds"] = timer.duration.total_seconds()
+    return results
+
+
+def benchmark_save(path: Path) -> dict[str, Any]:
+    game = load_game(path)
+    original_compression = game.settings.save_compression
+
+    pickle_timer = Timer()
+    with pickle_timer:
+        pickled = io.BytesIO()
+        pickle.dump(game, pickled, protocol=pickle.HIGHEST_PROTOCOL)
+
+    timer = Timer()
+    with timer:
+        snapshot = SaveGameBundle.snapshot(game)
+    segmented = isinstance(snapshot, SegmentedSnapshot)
+
+    with TemporaryDirectory() as temp_dir:
+        results = {
+            compression.name: benchmark_compression(game, compression, Path(temp_dir))
+            for compression in SaveCompression
+        }
+    game.settings.save_compression = original_compression
+    return {
+        "save": str(path),
+        "turn": game.turn,
+        "pickle_seconds": pickle_timer.duration.total_seconds(),
+        "pickle_bytes": pickled.getbuffer().nbytes,
+        "segmented": segmented,
+        "segments": len(snapshot.segments) if segmented else None,
+        "snapshot_seconds": timer.duration.total_seconds(),
+        "compression": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "saves",
+        type=Path,
+        nargs="+",
+        help="Paths to the .liberation.zip files to load.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Path to write the JSON report to. Defaults to stdout.",
+    )
+    args = parser.parse_args()
+
+    init_headless()
+    report = {"saves": [benchmark_save(path) for path in args.saves]}
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        with args.output.open("w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmarks the aircraft simulation tick on the flights of a saved game.
+
+Compares ticking each flight state individually against FlightKinematics, which
+advances navigating flights in one batch. The flights of the save are copied as
+needed to reach each flight count, and every copy starts at its first waypoint.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import itertools
+import timeit
+from datetime import datetime
+from pathlib import Path
+
+from game import Game
+from game.ato import Flight
+from game.ato.flightstate import Navigating
+from game.sim.flightkinematics import FlightKinematics
+from game.sim.gameupdateevents import GameUpdateEvents
+from game.sim.missionsimulation import TICK
+from resources.tools.benchmarking import init_headless, load_game
+
+
+def navigating_flights(game: Game, count: int) -> list[Flight]:
+    packages = itertools.chain(game.blue.ato.packages, game.red.ato.packages)
+    source = [
+        flight
+        for package in packages
+        for flight in package.flights
+        if len(flight.flight_plan.waypoints) > 1
+    ]
+    if not source:
+        raise RuntimeError("The save has no planned flights to simulate")
+
+    flights = []
+    for template in itertools.islice(itertools.cycle(source), count):
+        flight = copy.copy(template)
+        flight.set_state(Navigating(flight, game.settings, waypoint_index=0))
+        flights.append(flight)
+    return flights
+
+
+def tick_individually(flights: list[Flight], time: datetime, ticks: int) -> None:
+    for _ in range(ticks):
+        events = GameUpdateEvents()
+        time += TICK
+        for flight in flights:
+            flight.on_game_tick(events, time, TICK)
+
+
+def tick_batched(flights: list[Flight], time: datetime, ticks: int) -> None:
+    kinematics = FlightKinematics()
+    for _ in range(ticks):
+        events = GameUpdateEvents()
+        time += TICK
+        kinematics.tick(flights, events, time, TICK)
+
+
+def benchmark(game: Game, count: int, ticks: int) -> None:
+    start = game.conditions.start_time
+    individual_flights = navigating_flights(game, count)
+    batched_flights = navigating_flights(game, count)
+    individual = timeit.timeit(
+        lambda: tick_individually(individual_flights, start, ticks), number=1
+    )
+    batched = timeit.timeit(
+        lambda: tick_batched(batched_flights, start, ticks), number=1
+    )
+    print(f"{count} flights:")
+    print(f"\tindividual: {ticks / individual:.0f} ticks/s")
+    print(f"\tbatched:    {ticks / batched:.0f} ticks/s")
+    print(f"\tspeedup:    {individual / batched:.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("save", type=Path, help="Path to a .liberation.zip to load.")
+    parser.add_argument(
+        "--flights",
+        type=int,
+        nargs="+",
+        default=[50, 200, 1000],
+        help="Numbers of flights to simulate.",
+    )
+    parser.add_argument(
+        "--ticks", type=int, default=600, help="Number of one second ticks to run."
+    )
+    args = parser.parse_args()
+
+    init_headless()
+    game = load_game(args.save)
+    print(f"{game.theater.terrain.name}, turn {game.turn}")
+    for count in args.flights:
+        benchmark(game, count, args.ticks)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Shared setup for the command-line benchmark tools.
+
+The benchmarks in this directory load real saved games rather than synthetic data so
+that the results reflect the size and shape of the data that players actually have.
+Run them from the root of the repository, e.g.:
+
+    python -m resources.tools.benchmark_navmesh path/to/game.liberation.zip
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from game import Game, persistence
+from game.persistence import SaveManager
+from game.staticdata import load_static_data
+from pydcs_extensions import load_mods
+
+# TODO: Move this logic out of the UI.
+from qt_ui import liberation_install
+from qt_ui.main import inject_custom_payloads
+
+
+def init_headless() -> None:
+    """Performs the subset of application start up needed to load a saved game."""
+    first_start = liberation_install.init()
+    if first_start:
+        sys.exit(
+            "Cannot run benchmarks without configuring DCS Liberation. Start the UI "
+            "for the first run configuration."
+        )
+    inject_custom_payloads(Path(persistence.base_path()))
+    load_mods()
+    load_static_data()
+
+
+def load_game(path: Path) -> Game:
+    return SaveManager.load_player_save(path)
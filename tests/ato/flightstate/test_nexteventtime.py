@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta
+from typing import Any, cast
+
+import pytest
+from dcs.mapping import Point
+from dcs.terrain import Caucasus
+
+from game.ato import Flight
+from game.ato.flightstate import (
+    Completed,
+    FlightState,
+    Navigating,
+    StartUp,
+    Takeoff,
+    Taxi,
+    WaitingForStart,
+)
+from game.ato.flightwaypoint import FlightWaypoint
+from game.ato.flightwaypointtype import FlightWaypointType
+from game.ato.starttype import StartType
+from game.sim import GameUpdateEvents
+
+T0 = datetime(1999, 3, 28)
+TICK = timedelta(seconds=1)
+TERRAIN = Caucasus()
+SETTINGS: Any = None
+
+
+class StubFlightPlan:
+    def __init__(self, waypoints: list[FlightWaypoint], speed: float) -> None:
+        self.waypoints = waypoints
+        self.speed = speed
+
+    def startup_time(self) -> datetime:
+        return T0 + timedelta(minutes=5, microseconds=300_000)
+
+    def estimate_startup(self) -> timedelta:
+        return timedelta(minutes=10, milliseconds=500)
+
+    def estimate_ground_ops(self) -> timedelta:
+        return timedelta(minutes=7, microseconds=1)
+
+    def travel_time_between_waypoints(
+        self, a: FlightWaypoint, b: FlightWaypoint
+    ) -> timedelta:
+        return timedelta(seconds=a.position.distance_to_point(b.position) / self.speed)
+
+
+class StubFlight:
+    def __init__(self, start_type: StartType) -> None:
+        points = [(0, 0), (30_000, 0), (30_150, 0), (30_150, 45_000)]
+        waypoints = [
+            FlightWaypoint("", FlightWaypointType.NAV, Point(x, y, TERRAIN))
+            for x, y in points
+        ]
+        waypoints[-1].waypoint_type = FlightWaypointType.LANDING_POINT
+        self.start_type = start_type
+        self.flight_plan = StubFlightPlan(waypoints, 313.7)
+        self.state: FlightState = WaitingForStart(cast(Flight, self), SETTINGS)
+
+    def set_state(self, state: FlightState) -> None:
+        self.state = state
+
+
+def run_to_completion(flight: StubFlight) -> list[type[FlightState]]:
+    """Ticks the flight until it completes, checking the event time of each state.
+
+    Each state must change on the first tick at or after the event time it reported
+    before that tick, and not on any earlier tick.
+    """
+    states: list[type[FlightState]] = [type(flight.state)]
+    time = T0
+    while not isinstance(flight.state, Completed):
+        assert time < T0 + timedelta(hours=2)
+        state = flight.state
+        event_time = state.next_event_time(time)
+        assert event_time is not None
+        time += TICK
+        state.on_game_tick(GameUpdateEvents(), time, TICK)
+        if flight.state is state:
+            assert time < event_time
+        else:
+            assert time >= event_time
+            states.append(type(flight.state))
+    return states
+
+
+@pytest.mark.parametrize(
+    "start_type,expected",
+    [
+        (StartType.COLD, [WaitingForStart, StartUp, Taxi, Takeoff]),
+        (StartType.WARM, [WaitingForStart, Taxi, Takeoff]),
+        (StartType.RUNWAY, [WaitingForStart, Takeoff]),
+        (StartType.IN_FLIGHT, [WaitingForStart]),
+    ],
+)
+def test_states_change_on_first_tick_after_event_time(
+    start_type: StartType, expected: list[type[FlightState]]
+) -> None:
+    states = run_to_completion(StubFlight(start_type))
+    # Every leg is flown before the flight completes.
+    assert states == [*expected, Navigating, Navigating, Navigating, Completed]
+
+
+def test_completed_has_no_event() -> None:
+    flight = StubFlight(StartType.COLD)
+    assert Completed(cast(Flight, flight), SETTINGS).next_event_time(T0) is None
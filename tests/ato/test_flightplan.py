@@ -1,3 +1,6 @@
+import math
+from datetime import timedelta
+from types import SimpleNamespace
 from typing import cast, Any
 
 import pytest
@@ -7,7 +10,9 @@
 from game.ato import Flight, FlightWaypoint
 from game.ato.flightplans.custom import CustomFlightPlan, CustomLayout
 from game.ato.flightplans.flightplan import FlightPlan
+from game.ato.flightplans.planningerror import PlanningError
 from game.ato.flightwaypointtype import FlightWaypointType
+from game.utils import knots
 
 
 @pytest.fixture(name="unescorted_flight_plan")
@@ -83,3 +88,73 @@ def test_unescorted_flight_plan_dismiss_escort_at(
     unescorted_flight_plan: FlightPlan[Any],
 ) -> None:
     assert unescorted_flight_plan.dismiss_escort_at() is None
+
+
+@pytest.fixture(name="timed_flight_plan")
+def timed_flight_plan_fixture() -> FlightPlan[Any]:
+    terrain = Caucasus()
+    departure = FlightWaypoint("", FlightWaypointType.TAKEOFF, Point(0, 0, terrain))
+
+    waypoints = [
+        FlightWaypoint(f"{i}", FlightWaypointType.NAV, Point(i * 12345, i, terrain))
+        for i in range(1, 10)
+    ]
+    flight = SimpleNamespace(
+        squadron=SimpleNamespace(aircraft=SimpleNamespace(cruise_speed=knots(400))),
+        unit_type=SimpleNamespace(
+            fuel_consumption=SimpleNamespace(climb=30, cruise=10, combat=20)
+        ),
+    )
+    return CustomFlightPlan(cast(Flight, flight), CustomLayout(departure, waypoints))
+
+
+def summed_travel_time(flight_plan: FlightPlan[Any], index: int) -> timedelta:
+    waypoints = flight_plan.waypoints[: index + 1]
+    total = sum(
+        (
+            flight_plan.total_time_between_waypoints(a, b)
+            for a, b in zip(waypoints, waypoints[1:])
+        ),
+        timedelta(),
+    )
+    return timedelta(seconds=math.floor(total.total_seconds()))
+
+
+def test_travel_time_to_waypoint(timed_flight_plan: FlightPlan[Any]) -> None:
+    for index, waypoint in enumerate(timed_flight_plan.waypoints):
+        assert timed_flight_plan._travel_time_to_waypoint(
+            waypoint
+        ) == summed_travel_time(timed_flight_plan, index)
+
+    with pytest.raises(PlanningError):
+        timed_flight_plan._travel_time_to_waypoint(
+            FlightWaypoint("", FlightWaypointType.NAV, Point(1, 1, Caucasus()))
+        )
+
+
+def test_leg_table_is_rebuilt_after_invalidation(
+    timed_flight_plan: FlightPlan[Any],
+) -> None:
+    last = timed_flight_plan.waypoints[-1]
+    before = timed_flight_plan._travel_time_to_waypoint(last)
+
+    last.position = Point(last.position.x * 2, 0, Caucasus())
+    timed_flight_plan.invalidate_leg_table()
+
+    after = timed_flight_plan._travel_time_to_waypoint(last)
+    assert after > before
+    assert after == summed_travel_time(
+        timed_flight_plan, len(timed_flight_plan.waypoints) - 1
+    )
+
+
+def test_fuel_consumption_to_waypoint(timed_flight_plan: FlightPlan[Any]) -> None:
+    waypoints = timed_flight_plan.waypoints
+    expected = 0.0
+    for index, (a, b) in enumerate(zip(waypoints, waypoints[1:]), 1):
+        consumption = timed_flight_plan.fuel_consumption_between_points(a, b)
+        assert consumption is not None
+        expected += consumption
+        assert timed_flight_plan.fuel_consumption_to_waypoint(index) == pytest.approx(
+            expected
+        )
@@ -0,0 +1,41 @@
+import os
+from pathlib import Path
+
+import pytest
+from dcs.payloads import PayloadDirectories
+
+from game.ato.payloadindex import PayloadIndex
+
+
+def fingerprint() -> bytes:
+    PayloadIndex._fingerprint = None
+    return PayloadIndex._payload_fingerprint()
+
+
+def test_fingerprint_covers_user_payloads(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(PayloadIndex, "_fingerprint", None)
+    fallback = tmp_path / "fallback"
+    fallback.mkdir()
+    (fallback / "A-10C.lua").write_text("local unitPayloads = {}", encoding="utf-8")
+    user = tmp_path / "user"
+    monkeypatch.setattr(PayloadDirectories, "fallback", fallback)
+    monkeypatch.setattr(PayloadDirectories, "preferred", None)
+    monkeypatch.setattr(PayloadDirectories, "dcs", [])
+    monkeypatch.setattr(PayloadDirectories, "mod", [])
+    # The mission editor's payload directory does not exist until a payload is saved.
+    monkeypatch.setattr(PayloadDirectories, "user", user)
+    initial = fingerprint()
+    assert fingerprint() == initial
+
+    user.mkdir()
+    payload = user / "A-10C.lua"
+    payload.write_text("local unitPayloads = {}", encoding="utf-8")
+    os.utime(payload, ns=(1_000_000_000, 1_000_000_000))
+    saved = fingerprint()
+    assert saved != initial
+
+    # Saving a payload in the mission editor rewrites the file.
+    os.utime(payload, ns=(2_000_000_000, 2_000_000_000))
+    assert fingerprint() != saved
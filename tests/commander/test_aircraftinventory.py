@@ -0,0 +1,109 @@
+from types import SimpleNamespace
+from typing import Any, cast
+
+from game.ato.flighttype import FlightType
+from game.commander.aircraftinventory import AircraftInventory
+from game.commander.missionproposals import EscortType, ProposedFlight, ProposedMission
+from game.commander.packagefulfiller import PackageFulfiller
+from game.procurement import AircraftProcurementRequest
+
+
+class StubSquadron:
+    def __init__(
+        self,
+        tasks: set[FlightType],
+        untasked_aircraft: int,
+        captured: bool = True,
+        ferry_only: bool = False,
+        runway_operational: bool = True,
+    ) -> None:
+        self.auto_assignable_mission_types = tasks
+        self.untasked_aircraft = untasked_aircraft
+        self.location = SimpleNamespace(
+            captured=captured,
+            ferry_only=ferry_only,
+            runway_is_operational=lambda: runway_operational,
+        )
+
+    def can_auto_assign_mission(
+        self, location: Any, task: FlightType, size: int, this_turn: bool
+    ) -> bool:
+        return task in self.auto_assignable_mission_types and (
+            not this_turn or self.untasked_aircraft >= size
+        )
+
+
+def make_inventory(*squadrons: StubSquadron) -> AircraftInventory:
+    return AircraftInventory(
+        cast(Any, SimpleNamespace(player=True, iter_squadrons=lambda: squadrons))
+    )
+
+
+def test_only_usable_squadrons_are_indexed() -> None:
+    usable = StubSquadron({FlightType.STRIKE}, 2)
+    inventory = make_inventory(
+        usable,
+        StubSquadron({FlightType.CAS}, 2, captured=False),
+        StubSquadron({FlightType.CAS}, 2, ferry_only=True),
+        StubSquadron({FlightType.CAS}, 2, runway_operational=False),
+    )
+
+    assert inventory.squadrons_for_task == {FlightType.STRIKE: [usable]}
+    assert inventory.can_auto_plan(FlightType.CAS)
+    assert not inventory.can_auto_plan(FlightType.BARCAP)
+
+
+def test_may_fulfill_checks_current_inventory() -> None:
+    squadron = StubSquadron({FlightType.STRIKE}, 2)
+    inventory = make_inventory(squadron)
+    flight = ProposedFlight(FlightType.STRIKE, 2)
+
+    assert inventory.may_fulfill(cast(Any, None), flight)
+    squadron.untasked_aircraft = 1
+    assert not inventory.may_fulfill(cast(Any, None), flight)
+    assert not inventory.may_fulfill(cast(Any, None), ProposedFlight(FlightType.CAS, 1))
+
+
+def test_unfulfillable_missions_are_forgotten_in_next_epoch() -> None:
+    inventory = make_inventory()
+    target = cast(Any, "target")
+    inventory.record_unfulfillable(PackageFulfiller, target, 1)
+
+    assert inventory.known_unfulfillable(PackageFulfiller, target, 1)
+    assert not inventory.known_unfulfillable(PackageFulfiller, target, 2)
+    inventory.record_fulfilled()
+    assert not inventory.known_unfulfillable(PackageFulfiller, target, 1)
+
+
+def test_screen_requests_missing_aircraft() -> None:
+    inventory = make_inventory(
+        StubSquadron({FlightType.STRIKE, FlightType.ESCORT}, 2),
+        StubSquadron({FlightType.CAS, FlightType.SEAD_ESCORT}, 0),
+    )
+    requests: list[AircraftProcurementRequest] = []
+    fulfiller = PackageFulfiller.__new__(PackageFulfiller)
+    fulfiller.coalition = cast(
+        Any, SimpleNamespace(player=True, add_procurement_request=requests.append)
+    )
+    mission = ProposedMission(
+        cast(Any, SimpleNamespace(name="target")),
+        [
+            ProposedFlight(FlightType.STRIKE, 2),
+            ProposedFlight(FlightType.CAS, 2),
+            ProposedFlight(FlightType.BAI, 2),
+            ProposedFlight(FlightType.SEAD_ESCORT, 2, EscortType.Sead),
+            ProposedFlight(FlightType.ESCORT, 2, EscortType.AirToAir),
+        ],
+    )
+
+    assert fulfiller.screen_mission(
+        ProposedMission(mission.location, mission.flights[:1]), 3, inventory
+    )
+    assert not requests
+
+    assert not fulfiller.screen_mission(mission, 3, inventory)
+    # BAI can never be planned by this air wing, so it is not purchased.
+    assert [(r.task_capability, r.number) for r in requests] == [
+        (FlightType.CAS, 6),
+        (FlightType.SEAD_ESCORT, 6),
+    ]
@@ -0,0 +1,75 @@
+import random
+from types import SimpleNamespace
+from typing import Any, cast
+
+from dcs.mapping import Point
+
+from game.commander.airdefenseindex import AirDefenseIndex
+from game.utils import meters
+
+
+class StubAirDefense:
+    def __init__(self, x: float, y: float, threat: float, detection: float) -> None:
+        self.position = Point(x, y, None)  # type: ignore
+        self.threat_range = threat
+        self.detection_range = detection
+
+    def max_threat_range(self) -> Any:
+        return meters(self.threat_range)
+
+    def max_detection_range(self) -> Any:
+        return meters(self.detection_range)
+
+    def distance_to(self, other: Any) -> float:
+        return self.position.distance_to_point(other.position)
+
+
+def target_at(x: float, y: float) -> Any:
+    return SimpleNamespace(position=Point(x, y, None))  # type: ignore
+
+
+def test_covering_matches_range_checks() -> None:
+    rng = random.Random(0)
+    air_defenses = [
+        StubAirDefense(
+            rng.uniform(0, 500_000),
+            rng.uniform(0, 500_000),
+            rng.choice([0, rng.uniform(5_000, 100_000)]),
+            rng.uniform(0, 150_000),
+        )
+        for _ in range(100)
+    ]
+    index = AirDefenseIndex(cast(Any, air_defenses))
+
+    for _ in range(50):
+        target = target_at(rng.uniform(0, 500_000), rng.uniform(0, 500_000))
+        assert [a for a, _ in index.threatening(target)] == [
+            a
+            for a in air_defenses
+            if a.threat_range and a.distance_to(target) <= a.threat_range
+        ]
+        assert [a for a, _ in index.detecting(target)] == [
+            a
+            for a in air_defenses
+            if a.detection_range and a.distance_to(target) <= a.detection_range
+        ]
+
+
+def test_distance_to_threat_is_overlap() -> None:
+    air_defense = StubAirDefense(0, 0, 1000, 0)
+    index = AirDefenseIndex(cast(Any, [air_defense]))
+    assert index.threatening(target_at(600, 0)) == [(air_defense, meters(-400))]
+    assert index.threatening(target_at(1000, 0)) == [(air_defense, meters(0))]
+    assert not index.threatening(target_at(1001, 0))
+    assert not index.detecting(target_at(0, 0))
+
+
+def test_without_removes_air_defense() -> None:
+    first = StubAirDefense(0, 0, 1000, 0)
+    second = StubAirDefense(10, 0, 1000, 0)
+    index = AirDefenseIndex(cast(Any, [first, second]))
+    eliminated = index.without(cast(Any, first))
+
+    assert [a for a, _ in eliminated.threatening(target_at(0, 0))] == [second]
+    assert [a for a, _ in index.threatening(target_at(0, 0))] == [first, second]
+    assert not AirDefenseIndex([]).threatening(target_at(0, 0))
@@ -0,0 +1,80 @@
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+
+from game.commander.battlepositions import BattlePositions
+from game.commander.theaterstate import TheaterState, without
+from game.ground_forces.combat_stance import CombatStance
+
+
+def make_state(**kwargs: Any) -> TheaterState:
+    fields: dict[str, Any] = dict(
+        context=None,
+        barcaps_needed={},
+        active_front_lines=(),
+        front_line_stances={},
+        vulnerable_front_lines=(),
+        aewc_targets=(),
+        refueling_targets=(),
+        enemy_air_defenses=(),
+        threatening_air_defenses=[],
+        detecting_air_defenses=[],
+        enemy_convoys=(),
+        enemy_shipping=(),
+        enemy_ships=(),
+        enemy_air_defense_index=None,
+        enemy_battle_positions={},
+        oca_targets=(),
+        strike_targets=(),
+        enemy_barcaps=(),
+        threat_zones=None,
+    )
+    fields.update(kwargs)
+    return TheaterState(**fields)
+
+
+def test_without() -> None:
+    assert without((1, 2, 3, 2), 2) == (1, 3, 2)
+    with pytest.raises(ValueError):
+        without((1, 2), 3)
+
+
+def test_clone_shares_unchanged_fields() -> None:
+    state = make_state(strike_targets=("a", "b"), oca_targets=("c",))
+    clone = state.clone()
+    assert clone.strike_targets is state.strike_targets
+    assert clone.oca_targets is state.oca_targets
+    assert clone.threatening_air_defenses is state.threatening_air_defenses
+
+    state.eliminate_strike_target(cast(Any, "a"))
+    assert state.strike_targets == ("b",)
+    assert clone.strike_targets == ("a", "b")
+    assert clone.oca_targets is state.oca_targets
+
+
+def test_clone_isolates_mappings() -> None:
+    front_line = cast(Any, "front line")
+    state = make_state(barcaps_needed={"cp": 2}, front_line_stances={front_line: None})
+    clone = state.clone()
+
+    state.plan_barcap_round(cast(Any, "cp"))
+    state.set_front_line_stance(front_line, CombatStance.BREAKTHROUGH)
+    assert state.barcaps_needed == {"cp": 1}
+    assert state.front_line_stances == {front_line: CombatStance.BREAKTHROUGH}
+    assert clone.barcaps_needed == {"cp": 2}
+    assert clone.front_line_stances == {front_line: None}
+
+
+def test_clone_isolates_battle_positions() -> None:
+    control_point = object()
+    blocking = SimpleNamespace(name="blocking", control_point=control_point)
+    defending = SimpleNamespace(name="defending", control_point=control_point)
+    positions = BattlePositions(cast(Any, (blocking,)), cast(Any, (defending,)))
+    state = make_state(enemy_battle_positions={control_point: positions})
+    clone = state.clone()
+
+    state.eliminate_battle_position(cast(Any, blocking))
+    assert not state.has_battle_position(cast(Any, blocking))
+    assert state.has_battle_position(cast(Any, defending))
+    assert clone.has_battle_position(cast(Any, blocking))
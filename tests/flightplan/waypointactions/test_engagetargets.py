@@ -36,3 +36,8 @@ def test_engage_targets_description() -> None:
     assert (
         EngageTargets(meters(100), [Targets.All]).describe() == "Searching for targets"
     )
+
+
+def test_engage_targets_next_event_time() -> None:
+    task = EngageTargets(meters(100), [Targets.All])
+    assert task.next_event_time(datetime.now()) is None
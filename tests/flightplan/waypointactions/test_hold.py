@@ -64,3 +64,11 @@ def test_hold_description() -> None:
         ).describe()
         == "Holding until 00:05:00"
     )
+
+
+def test_hold_next_event_time() -> None:
+    t0 = datetime(1999, 3, 28)
+    push_time = t0 + timedelta(minutes=5)
+    task = Hold(lambda: push_time, meters(8000), kph(400))
+    assert task.next_event_time(t0) == push_time
+    assert task.next_event_time(push_time + timedelta(minutes=1)) == push_time
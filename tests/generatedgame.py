@@ -0,0 +1,60 @@
+import datetime
+from pathlib import Path
+
+from dcs.payloads import PayloadDirectories
+
+from game import Game
+from game.campaignloader.campaign import Campaign, DEFAULT_BUDGET
+from game.factions.factions import Factions
+from game.persistence.paths import set_dcs_save_game_directory
+from game.plugins import LuaPluginManager
+from game.settings import Settings
+from game.staticdata import load_static_data
+from game.theater.start_generator import GameGenerator, GeneratorSettings, ModSettings
+from pydcs_extensions import load_mods
+
+ROOT = Path(__file__).parents[1]
+
+
+def generate_game(save_game_directory: Path, campaign_name: str = "black_sea") -> Game:
+    """Generates a game from a campaign the same way as a new game in the UI.
+
+    Most tests use stubs. This is for tests that need the object graph of a real game,
+    such as the pydcs terrain shared by every position or the flights planned for the
+    first turn.
+    """
+    set_dcs_save_game_directory(save_game_directory)
+    PayloadDirectories.set_fallback(ROOT / "resources/customized_payloads")
+    load_mods()
+    load_static_data()
+
+    campaign = Campaign.from_file(ROOT / f"resources/campaigns/{campaign_name}.yaml")
+    theater = campaign.load_theater(advanced_iads=False)
+    factions = Factions.load()
+    assert campaign.recommended_start_date is not None
+    generator = GameGenerator(
+        campaign.recommended_player_faction.get_faction(factions),
+        campaign.recommended_enemy_faction.get_faction(factions),
+        theater,
+        campaign.load_air_wing_config(theater),
+        Settings(),
+        GeneratorSettings(
+            start_date=datetime.datetime.combine(
+                campaign.recommended_start_date, datetime.time()
+            ),
+            start_time=campaign.recommended_start_time,
+            player_budget=DEFAULT_BUDGET,
+            enemy_budget=DEFAULT_BUDGET,
+            inverted=False,
+            advanced_iads=False,
+            no_carrier=False,
+            no_lha=False,
+            no_player_navy=False,
+            no_enemy_navy=False,
+        ),
+        ModSettings(),
+        LuaPluginManager.load(),
+    )
+    game = generator.generate()
+    game.begin_turn_0()
+    return game
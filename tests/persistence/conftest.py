@@ -5,11 +5,13 @@
 
 from game import Game
 from game.persistence import SaveManager
+from game.settings import Settings
 
 
 class StubGame:
     def __init__(self) -> None:
         self.date = datetime.date.min
+        self.settings = Settings()
         self.save_manager = SaveManager(cast(Game, self))
 
 
@@ -0,0 +1,54 @@
+from pathlib import Path
+
+import pytest
+
+from game import Game
+from game.persistence.savegamebundle import SaveGameBundle
+from game.persistence.segmentedpickle import SegmentedSnapshot
+from tests.generatedgame import generate_game
+
+
+# The other persistence tests use a stub game. This one saves a generated game so that
+# the object graph of a real game (such as the pydcs terrain shared by every position)
+# is saved.
+@pytest.fixture(scope="module")
+def generated_game(tmp_path_factory: pytest.TempPathFactory) -> Game:
+    return generate_game(tmp_path_factory.mktemp("dcs"))
+
+
+def test_generated_game_is_segmented(generated_game: Game) -> None:
+    snapshot = SaveGameBundle.snapshot(generated_game)
+    assert isinstance(snapshot, SegmentedSnapshot)
+    assert len(snapshot.segments) > len(generated_game.theater.controlpoints)
+
+
+def test_generated_game_round_trip(generated_game: Game, tmp_zip: Path) -> None:
+    bundle = SaveGameBundle(tmp_zip)
+    bundle.save_player(generated_game, copy_from=None)
+    loaded = bundle.load_player()
+
+    assert loaded.turn == generated_game.turn
+    assert loaded.date == generated_game.date
+    assert [(cp.name, cp.captured) for cp in loaded.theater.controlpoints] == [
+        (cp.name, cp.captured) for cp in generated_game.theater.controlpoints
+    ]
+    assert [tgo.name for tgo in loaded.theater.ground_objects] == [
+        tgo.name for tgo in generated_game.theater.ground_objects
+    ]
+    for loaded_coalition, coalition in zip(
+        loaded.coalitions, generated_game.coalitions
+    ):
+        assert [str(f) for p in loaded_coalition.ato.packages for f in p.flights] == [
+            str(f) for p in coalition.ato.packages for f in p.flights
+        ]
+
+    # Objects shared by segments are restored once rather than once per segment.
+    terrain = loaded.theater.terrain
+    assert all(cp.position._terrain is terrain for cp in loaded.theater.controlpoints)
+    assert all(
+        tgo.position._terrain is terrain for tgo in loaded.theater.ground_objects
+    )
+    assert all(
+        cp.coalition is loaded.coalition_for(cp.captured)
+        for cp in loaded.theater.controlpoints
+    )
@@ -1,11 +1,21 @@
 import datetime
+import pickle
 from pathlib import Path
-from zipfile import ZipFile
+from zipfile import ZIP_DEFLATED, ZIP_LZMA, ZIP_STORED, ZipFile
 
 import pytest
 
 from game import Game
-from game.persistence.savegamebundle import SaveGameBundle
+from game.persistence.savecompression import SaveCompression
+from game.persistence.savegamebundle import (
+    PACK_DIRECTORY,
+    MANIFEST_COMMENT,
+    SaveGameBundle,
+)
+
+
+def saved_games(zip_file: ZipFile) -> list[str]:
+    return [n for n in zip_file.namelist() if not n.startswith(PACK_DIRECTORY)]
 
 
 @pytest.fixture
@@ -20,7 +30,7 @@ def test_save_player_new_save(game: Game, tmp_bundle: SaveGameBundle) -> None:
     tmp_bundle.save_player(game, copy_from=None)
 
     with ZipFile(tmp_bundle.bundle_path, "r") as zip_file:
-        assert zip_file.namelist() == [SaveGameBundle.MANUAL_SAVE_NAME]
+        assert saved_games(zip_file) == [SaveGameBundle.MANUAL_SAVE_NAME]
 
 
 def test_save_player_existing_save(game: Game, tmp_bundle: SaveGameBundle) -> None:
@@ -43,7 +53,7 @@ def test_save_last_turn(game: Game, tmp_bundle: SaveGameBundle) -> None:
     tmp_bundle.save_last_turn(game)
 
     with ZipFile(tmp_bundle.bundle_path, "r") as zip_file:
-        assert zip_file.namelist() == [SaveGameBundle.LAST_TURN_SAVE_NAME]
+        assert saved_games(zip_file) == [SaveGameBundle.LAST_TURN_SAVE_NAME]
 
 
 def test_save_start_of_turn(game: Game, tmp_bundle: SaveGameBundle) -> None:
@@ -53,7 +63,7 @@ def test_save_start_of_turn(game: Game, tmp_bundle: SaveGameBundle) -> None:
     tmp_bundle.save_start_of_turn(game)
 
     with ZipFile(tmp_bundle.bundle_path, "r") as zip_file:
-        assert zip_file.namelist() == [SaveGameBundle.START_OF_TURN_SAVE_NAME]
+        assert saved_games(zip_file) == [SaveGameBundle.START_OF_TURN_SAVE_NAME]
 
 
 def test_save_pre_sim_checkpoint(game: Game, tmp_bundle: SaveGameBundle) -> None:
@@ -63,7 +73,7 @@ def test_save_pre_sim_checkpoint(game: Game, tmp_bundle: SaveGameBundle) -> None
     tmp_bundle.save_pre_sim_checkpoint(game)
 
     with ZipFile(tmp_bundle.bundle_path, "r") as zip_file:
-        assert zip_file.namelist() == [SaveGameBundle.PRE_SIM_CHECKPOINT_SAVE_NAME]
+        assert saved_games(zip_file) == [SaveGameBundle.PRE_SIM_CHECKPOINT_SAVE_NAME]
 
 
 def test_failed_save_leaves_original_intact(
@@ -112,3 +122,68 @@ def test_load_from_absent_member_raises(game: Game, tmp_bundle: SaveGameBundle)
     tmp_bundle.save_start_of_turn(game)
     with pytest.raises(KeyError):
         tmp_bundle.load_last_turn()
+
+
+@pytest.mark.parametrize(
+    "compression,expected",
+    [
+        (SaveCompression.LZMA, ZIP_LZMA),
+        (SaveCompression.DEFLATE, ZIP_DEFLATED),
+        (SaveCompression.NONE, ZIP_STORED),
+    ],
+)
+def test_save_uses_selected_compression(
+    game: Game, tmp_bundle: SaveGameBundle, compression: SaveCompression, expected: int
+) -> None:
+    game.settings.save_compression = compression
+    tmp_bundle.save_last_turn(game)
+    tmp_bundle.save_start_of_turn(game)
+
+    with ZipFile(tmp_bundle.bundle_path, "r") as zip_file:
+        assert [
+            zip_file.getinfo(name).compress_type for name in saved_games(zip_file)
+        ] == [expected, expected]
+    assert tmp_bundle.load_last_turn().date == game.date
+
+
+def test_load_legacy_lzma_save(game: Game, tmp_bundle: SaveGameBundle) -> None:
+    last_turn_date = datetime.date.today()
+    game.date = last_turn_date
+    with ZipFile(tmp_bundle.bundle_path, "w", compression=ZIP_LZMA) as zip_file:
+        with zip_file.open(SaveGameBundle.LAST_TURN_SAVE_NAME, "w") as entry:
+            pickle.dump(game, entry, protocol=4)
+
+    game.date = datetime.date.min
+    game.settings.save_compression = SaveCompression.DEFLATE
+    tmp_bundle.save_start_of_turn(game)
+
+    with ZipFile(tmp_bundle.bundle_path, "r") as zip_file:
+        assert {
+            zip_file.getinfo(name).compress_type for name in saved_games(zip_file)
+        } == {ZIP_DEFLATED}
+    assert tmp_bundle.load_last_turn().date == last_turn_date
+    assert tmp_bundle.load_start_of_turn().date == datetime.date.min
+
+
+def test_snapshots_share_segments(game: Game, tmp_bundle: SaveGameBundle) -> None:
+    tmp_bundle.save_last_turn(game)
+    with ZipFile(tmp_bundle.bundle_path, "r") as zip_file:
+        segments = set(zip_file.namelist()) - set(saved_games(zip_file))
+
+    tmp_bundle.save_start_of_turn(game)
+    with ZipFile(tmp_bundle.bundle_path, "r") as zip_file:
+        assert set(zip_file.namelist()) - set(saved_games(zip_file)) == segments
+        assert all(
+            zip_file.getinfo(name).comment == MANIFEST_COMMENT
+            for name in saved_games(zip_file)
+        )
+
+    # Replacing a snapshot drops the segments that are no longer used.
+    game.date = datetime.date.today()
+    tmp_bundle.save_last_turn(game)
+    tmp_bundle.save_start_of_turn(game)
+    with ZipFile(tmp_bundle.bundle_path, "r") as zip_file:
+        new_segments = set(zip_file.namelist()) - set(saved_games(zip_file))
+    assert len(new_segments) == len(segments)
+    assert new_segments != segments
+    assert tmp_bundle.load_last_turn().date == game.date
@@ -0,0 +1,98 @@
+import datetime
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+
+from game import Game
+from game.persistence.savecompression import SaveCompression
+from game.persistence.savegamebundle import SaveGameBundle, Snapshot
+from game.persistence.savewriter import SaveWriter
+
+
+def test_submit_snapshots_game(game: Game, tmp_path: Path) -> None:
+    writer = SaveWriter()
+    bundle = SaveGameBundle(tmp_path / "test.liberation.zip")
+    expect_date = datetime.date.today()
+    game.date = expect_date
+    writer.submit(bundle, SaveGameBundle.LAST_TURN_SAVE_NAME, game, copy_from=bundle)
+    game.date = datetime.date.min
+    writer.flush()
+
+    assert bundle.load_last_turn().date == expect_date
+
+
+def test_queued_saves_are_coalesced(
+    game: Game, tmp_path: Path, mocker: MockerFixture
+) -> None:
+    writes: list[tuple[Path, list[str]]] = []
+    first_write_started = threading.Event()
+    release_writer = threading.Event()
+    write_members = SaveGameBundle.write_members
+
+    def blocking_write_members(
+        bundle: SaveGameBundle,
+        members: Mapping[str, Snapshot],
+        compression: SaveCompression,
+        copy_from: SaveGameBundle | None,
+    ) -> None:
+        writes.append((bundle.bundle_path, list(members)))
+        first_write_started.set()
+        release_writer.wait()
+        write_members(bundle, members, compression, copy_from)
+
+    mocker.patch.object(SaveGameBundle, "write_members", blocking_write_members)
+
+    writer = SaveWriter()
+    first = SaveGameBundle(tmp_path / "first.liberation.zip")
+    second = SaveGameBundle(tmp_path / "second.liberation.zip")
+    writer.submit(first, SaveGameBundle.LAST_TURN_SAVE_NAME, game, copy_from=first)
+    first_write_started.wait()
+
+    # The writer is busy with the first bundle, so these are queued together.
+    writer.submit(second, SaveGameBundle.LAST_TURN_SAVE_NAME, game, copy_from=second)
+    writer.submit(
+        second, SaveGameBundle.START_OF_TURN_SAVE_NAME, game, copy_from=second
+    )
+    expect_date = datetime.date.today()
+    game.date = expect_date
+    writer.submit(second, SaveGameBundle.LAST_TURN_SAVE_NAME, game, copy_from=second)
+    release_writer.set()
+    writer.flush()
+
+    assert writes == [
+        (first.bundle_path, [SaveGameBundle.LAST_TURN_SAVE_NAME]),
+        (
+            second.bundle_path,
+            [
+                SaveGameBundle.LAST_TURN_SAVE_NAME,
+                SaveGameBundle.START_OF_TURN_SAVE_NAME,
+            ],
+        ),
+    ]
+    assert second.load_last_turn().date == expect_date
+    assert second.load_start_of_turn().date == datetime.date.min
+
+
+def test_failed_write_leaves_bundle_intact(game: Game, tmp_path: Path) -> None:
+    writer = SaveWriter()
+    bundle = SaveGameBundle(tmp_path / "test.liberation.zip")
+    expect_date = datetime.date.today()
+    game.date = expect_date
+    writer.submit(bundle, SaveGameBundle.LAST_TURN_SAVE_NAME, game, copy_from=bundle)
+    writer.flush()
+
+    # Copying from a corrupt bundle fails after the snapshot has been queued.
+    corrupt = SaveGameBundle(tmp_path / "corrupt.liberation.zip")
+    corrupt.bundle_path.write_bytes(b"not a zip file")
+    game.date = datetime.date.min
+    writer.submit(bundle, SaveGameBundle.START_OF_TURN_SAVE_NAME, game, corrupt)
+    writer.flush()
+
+    assert bundle.load_last_turn().date == expect_date
+    # The temporary bundle was cleaned up.
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "corrupt.liberation.zip",
+        "test.liberation.zip",
+    ]
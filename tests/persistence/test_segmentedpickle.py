@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+
+import pytest
+
+from game.persistence.segmentedpickle import (
+    NotSegmentableError,
+    SegmentLoader,
+    SegmentedSnapshot,
+    snapshot,
+)
+
+
+class Root:
+    def __init__(self) -> None:
+        self.children: list[Child] = []
+        self.shared: Any = None
+
+
+class Child:
+    def __init__(self, root: Root, name: str) -> None:
+        self.root = root
+        self.name = name
+        self.shared: Any = None
+
+
+class Restored:
+    def __init__(self, child: Child) -> None:
+        self.child = child
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # Like Flight.__setstate__, depends on the state of another segment.
+        state["child_name"] = state["child"].name
+        self.__dict__.update(state)
+
+
+def load(segmented: SegmentedSnapshot) -> Any:
+    return SegmentLoader(
+        {key: segment.type for key, segment in segmented.segments.items()},
+        lambda key: segmented.segments[key].data,
+    ).object_for(segmented.root)
+
+
+def make_root() -> Root:
+    root = Root()
+    root.children = [Child(root, "a"), Child(root, "b")]
+    return root
+
+
+def test_round_trip() -> None:
+    root = make_root()
+    segmented = snapshot(root, (Child,))
+    assert len(segmented.segments) == 3
+
+    loaded = load(segmented)
+    assert [c.name for c in loaded.children] == ["a", "b"]
+    assert all(c.root is loaded for c in loaded.children)
+
+
+def test_shared_objects_keep_identity() -> None:
+    root = make_root()
+    shared = {"value": 1}
+    root.children[0].shared = shared
+    root.children[1].shared = shared
+    promoted: dict[int, type] = {}
+    segmented = snapshot(root, (Child,), promoted=promoted)
+    assert promoted == {id(shared): dict}
+
+    loaded = load(segmented)
+    assert loaded.children[0].shared is loaded.children[1].shared
+    assert loaded.children[0].shared == shared
+
+
+def test_shared_objects_that_cannot_be_segmented() -> None:
+    root = make_root()
+    shared: deque[int] = deque([1])
+    root.children[0].shared = shared
+    root.children[1].shared = shared
+    with pytest.raises(NotSegmentableError):
+        snapshot(root, (Child,))
+
+    # Unless they are values.
+    loaded = load(snapshot(root, (Child,), value_types=(deque,)))
+    assert loaded.children[0].shared == shared
+
+
+def test_segments_are_restored_when_first_referenced() -> None:
+    root = make_root()
+    root.shared = Restored(root.children[1])
+    loaded = load(snapshot(root, (Child, Restored)))
+    assert loaded.shared.child_name == "b"
+
+
+def test_unchanged_segments_are_identical() -> None:
+    root = make_root()
+    first = snapshot(root, (Child,))
+    root.children[1].name = "c"
+    second = snapshot(root, (Child,))
+
+    def data(segmented: SegmentedSnapshot, obj: Any) -> bytes:
+        return segmented.segments[id(obj)].data
+
+    assert data(first, root) == data(second, root)
+    assert data(first, root.children[0]) == data(second, root.children[0])
+    assert data(first, root.children[1]) != data(second, root.children[1])
@@ -0,0 +1,50 @@
+from types import SimpleNamespace
+from typing import Any, Optional, cast
+from uuid import uuid4
+
+import pytest
+from dcs.mapping import Point
+from dcs.terrain import Caucasus
+
+from game.server.controlpoints.models import ControlPointJs
+
+
+class StubControlPoint:
+    def __init__(self, position: Point, target_position: Optional[Point]) -> None:
+        self.id = uuid4()
+        self.name = str(self.id)
+        self.captured = True
+        self.moveable = target_position is not None
+        self.position = position
+        self.target_position = target_position
+
+    def sidc(self) -> str:
+        return "10031000001211000000"
+
+
+def test_for_control_points_matches_per_point_projection() -> None:
+    terrain = Caucasus()
+    theater: Any = SimpleNamespace(terrain=terrain)
+    control_points = [
+        StubControlPoint(Point(0, 0, terrain), None),
+        StubControlPoint(Point(-1000, 2000, terrain), Point(5000, 6000, terrain)),
+        StubControlPoint(Point(30_000, -40_000, terrain), None),
+        StubControlPoint(Point(10_000, 0, terrain), Point(-7000, 8000, terrain)),
+    ]
+
+    models = ControlPointJs.for_control_points(cast(Any, control_points), theater)
+
+    assert [m.id for m in models] == [cp.id for cp in control_points]
+    for model, control_point in zip(models, control_points):
+        latlng = control_point.position.latlng()
+        assert (model.position.lat, model.position.lng) == pytest.approx(
+            (latlng.lat, latlng.lng)
+        )
+        if control_point.target_position is None:
+            assert model.destination is None
+        else:
+            assert model.destination is not None
+            latlng = control_point.target_position.latlng()
+            assert (model.destination.lat, model.destination.lng) == pytest.approx(
+                (latlng.lat, latlng.lng)
+            )
@@ -0,0 +1,75 @@
+import struct
+from typing import cast
+from uuid import uuid4
+
+import numpy as np
+from dcs.mapping import Point
+from dcs.terrain import Caucasus
+
+from game.ato import Flight
+from game.server.eventstream.flightpositions import (
+    FLIGHT_POSITIONS_MESSAGE,
+    FLIGHT_TABLE_MESSAGE,
+    FlightIndexTable,
+    HEADER,
+    encode_flight_positions,
+)
+
+
+class StubFlight:
+    def __init__(self) -> None:
+        self.id = uuid4()
+
+
+def test_flight_table_assigns_stable_indices() -> None:
+    table = FlightIndexTable()
+    first, second = uuid4(), uuid4()
+
+    indices, changed = table.indices_for([first])
+    assert list(indices) == [0] and changed
+    indices, changed = table.indices_for([second, first])
+    assert list(indices) == [1, 0] and changed
+    table_id = table.table_id
+    indices, changed = table.indices_for([first, second])
+    assert list(indices) == [0, 1] and not changed
+    assert table.table_id == table_id
+
+    message_type, message_table_id, count = HEADER.unpack_from(table.message)
+    assert (message_type, message_table_id, count) == (
+        FLIGHT_TABLE_MESSAGE,
+        table_id,
+        2,
+    )
+    assert table.message[HEADER.size :] == first.bytes + second.bytes
+
+    table.reset()
+    assert table.table_id != table_id
+    assert HEADER.unpack_from(table.message)[2] == 0
+
+
+def test_encode_flight_positions() -> None:
+    terrain = Caucasus()
+    flights = [cast(Flight, StubFlight()) for _ in range(3)]
+    points = [Point(i * 1000, -i * 2000, terrain) for i in range(3)]
+    table = FlightIndexTable()
+    table.indices_for([flights[2].id])
+
+    message, table_changed = encode_flight_positions(
+        list(zip(flights, points)), table, terrain
+    )
+
+    assert table_changed
+    message_type, table_id, count = HEADER.unpack_from(message)
+    assert (message_type, table_id, count) == (
+        FLIGHT_POSITIONS_MESSAGE,
+        table.table_id,
+        3,
+    )
+    indices = struct.unpack_from("<3I", message, HEADER.size)
+    assert indices == (1, 2, 0)
+    latlng = np.frombuffer(message, dtype="<f4", offset=HEADER.size + 3 * 4)
+    assert len(latlng) == 6
+    for point, (lat, lng) in zip(points, latlng.reshape(3, 2)):
+        expected = point.latlng()
+        assert lat == np.float32(expected.lat)
+        assert lng == np.float32(expected.lng)
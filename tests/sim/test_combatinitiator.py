@@ -0,0 +1,134 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, Optional, cast
+
+import pytest
+from dcs.mapping import Point
+from dcs.terrain import Caucasus
+from shapely.geometry import Point as ShapelyPoint
+
+from game import Game
+from game.ato import Flight
+from game.ato.airtaaskingorder import AirTaskingOrder
+from game.ato.flightstate import FlightState, Navigating
+from game.ato.flightwaypoint import FlightWaypoint
+from game.ato.flightwaypointtype import FlightWaypointType
+from game.sim import GameUpdateEvents
+from game.sim.combat import CombatInitiator, EngagementZones
+from game.sim.combat.samengagementzones import SamEngagementZones
+from game.threatzones import ThreatPoly
+from game.utils import Speed, dcs_to_shapely_point, mps
+
+T0 = datetime(1999, 3, 28)
+TICK = timedelta(seconds=1)
+TERRAIN = Caucasus()
+SETTINGS: Any = None
+COMMIT_RADIUS = 5000
+
+
+class StubFlightPlan:
+    def __init__(self, waypoints: list[FlightWaypoint], speed: float) -> None:
+        self.waypoints = waypoints
+        self.speed = speed
+
+    def travel_time_between_waypoints(
+        self, a: FlightWaypoint, b: FlightWaypoint
+    ) -> timedelta:
+        return timedelta(seconds=a.position.distance_to_point(b.position) / self.speed)
+
+    def speed_between_waypoints(self, a: FlightWaypoint, b: FlightWaypoint) -> Speed:
+        return mps(self.speed)
+
+
+class Intercepting(Navigating):
+    """A flight with a commit region that moves with it, unlike a race track."""
+
+    def a2a_commit_region(self) -> Optional[ThreatPoly]:
+        return dcs_to_shapely_point(self.estimate_position()).buffer(COMMIT_RADIUS)
+
+
+class StubFlight:
+    def __init__(
+        self,
+        player: bool,
+        points: list[tuple[float, float]],
+        speed: float,
+        state: type[Navigating] = Navigating,
+    ) -> None:
+        waypoints = [
+            FlightWaypoint("", FlightWaypointType.NAV, Point(x, y, TERRAIN))
+            for x, y in points
+        ]
+        waypoints[-1].waypoint_type = FlightWaypointType.LANDING_POINT
+        self.squadron = SimpleNamespace(player=player)
+        self.flight_plan = StubFlightPlan(waypoints, speed)
+        self.state: FlightState = state(cast(Flight, self), SETTINGS, 0)
+
+    def set_state(self, state: FlightState) -> None:
+        self.state = state
+
+    @property
+    def position(self) -> Point:
+        return self.state.estimate_position()
+
+
+def make_ato(*flights: StubFlight) -> AirTaskingOrder:
+    return cast(
+        AirTaskingOrder, SimpleNamespace(packages=[SimpleNamespace(flights=flights)])
+    )
+
+
+def make_initiator(zones: EngagementZones) -> CombatInitiator:
+    return CombatInitiator(cast(Game, None), [], GameUpdateEvents(), zones)
+
+
+def contact_time_for(flight: StubFlight, zones: EngagementZones) -> Optional[datetime]:
+    return make_initiator(zones).next_contact_time_for(cast(Flight, flight), T0, False)
+
+
+def test_contact_time_accounts_for_moving_zones() -> None:
+    blue = StubFlight(True, [(0, 0), (100_000, 0), (100_000, 10_000)], 250)
+    red = StubFlight(
+        False, [(100_000, 0), (0, 0), (0, -10_000)], 250, state=Intercepting
+    )
+    ato = make_ato(red)
+    zones = EngagementZones()
+    zones.red_a2a.update_from_ato(ato)
+
+    contact_time = contact_time_for(blue, zones)
+    assert contact_time is not None
+    # The flights close at 500 m/s, so the 95 km gap closes in 190 seconds. Flying
+    # into the zone where it started would take twice that.
+    assert (contact_time - T0).total_seconds() == pytest.approx(189)
+
+    time = T0
+    while not zones.red_a2a.covers(blue.position):
+        assert time < T0 + timedelta(minutes=10)
+        time += TICK
+        for flight in (blue, red):
+            flight.state.on_game_tick(GameUpdateEvents(), time, TICK)
+        zones.red_a2a.update_from_ato(ato)
+    assert contact_time < time
+
+
+def test_contact_time_along_leg_into_sam() -> None:
+    blue = StubFlight(True, [(0, 0), (100_000, 0), (100_000, 10_000)], 250)
+    zones = EngagementZones()
+    sam: Any = SimpleNamespace()
+    zones.red_sam = SamEngagementZones(
+        [(sam, ShapelyPoint(50_000, 20_000).buffer(25_000))]
+    )
+
+    contact_time = contact_time_for(blue, zones)
+    assert contact_time is not None
+    # The leg enters the zone 35 km from its start. The zone is a polygon that is
+    # slightly inside of the circle, so the contact is slightly later.
+    assert (contact_time - T0).total_seconds() == pytest.approx(139, abs=0.5)
+
+    zones.red_sam = SamEngagementZones([(sam, ShapelyPoint(0, 0).buffer(25_000))])
+    assert contact_time_for(blue, zones) == T0
+
+
+def test_no_contact_time_without_zones() -> None:
+    blue = StubFlight(True, [(0, 0), (100_000, 0), (100_000, 10_000)], 250)
+    assert contact_time_for(blue, EngagementZones()) is None
@@ -0,0 +1,138 @@
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+from dcs.mapping import Point
+from dcs.terrain import Caucasus
+from shapely.geometry import Point as ShapelyPoint
+
+from game.ato.airtaaskingorder import AirTaskingOrder
+from game.sim.combat.aircraftengagementzones import AircraftEngagementZones
+from game.sim.combat.samengagementzones import SamEngagementZones
+from game.theater import ConflictTheater
+from game.utils import knots
+
+
+class StubFlight:
+    def __init__(self, name: str, x: float, y: float, radius: float) -> None:
+        self.name = name
+        self.state = SimpleNamespace(a2a_commit_region=lambda: self.region)
+        self.region: Any = ShapelyPoint(x, y).buffer(radius)
+
+
+def make_ato(*flights: StubFlight) -> AirTaskingOrder:
+    return cast(
+        AirTaskingOrder, SimpleNamespace(packages=[SimpleNamespace(flights=flights)])
+    )
+
+
+def point(x: float, y: float) -> Point:
+    return Point(x, y, Caucasus())
+
+
+def test_aircraft_zones_track_commit_regions() -> None:
+    near = StubFlight("near", 0, 0, 1000)
+    far = StubFlight("far", 10_000, 0, 1000)
+    ato = make_ato(near, far)
+    zones = AircraftEngagementZones({})
+
+    zones.update_from_ato(ato)
+    assert list(zones.iter_intercepting_flights(point(0, 0))) == [near]
+    assert not zones.covers(point(5000, 0))
+
+    # Leaving the commit state removes the zone on the next update.
+    near.region = None
+    zones.update_from_ato(ato)
+    assert not zones.covers(point(0, 0))
+
+    # Entering a new commit state adds the new zone.
+    far.region = ShapelyPoint(5000, 0).buffer(1000)
+    zones.update_from_ato(ato)
+    assert list(zones.iter_intercepting_flights(point(5000, 0))) == [far]
+
+
+def test_aircraft_zones_remove_flight() -> None:
+    first = StubFlight("first", 0, 0, 1000)
+    second = StubFlight("second", 500, 0, 1000)
+    zones = AircraftEngagementZones.from_ato(make_ato(first, second))
+    assert list(zones.iter_intercepting_flights(point(250, 0))) == [first, second]
+    zones.remove_flight(cast(Any, first))
+    assert list(zones.iter_intercepting_flights(point(250, 0))) == [second]
+    zones.remove_flight(cast(Any, second))
+    assert not zones.covers(point(250, 0))
+
+
+def test_aircraft_zones_time_to_reach() -> None:
+    first = StubFlight("first", 10_000, 0, 1000)
+    second = StubFlight("second", 0, 5000, 1000)
+    zones = AircraftEngagementZones.from_ato(make_ato(first, second))
+    speed = knots(400)
+    time = zones.time_to_reach(point(0, 0), speed)
+    assert time is not None
+    assert time.total_seconds() == pytest.approx(4000 / speed.meters_per_second)
+    assert zones.time_to_reach(point(0, 5000), speed) == timedelta()
+    # The stub owners are not in flight, so the zones cannot close on a stationary
+    # flight.
+    assert zones.time_to_reach(point(0, 0), knots(0)) is None
+    assert AircraftEngagementZones({}).time_to_reach(point(0, 0), speed) is None
+
+
+class StubTgo:
+    def __init__(self, x: float, y: float, radius: float) -> None:
+        self.zone: Any = ShapelyPoint(x, y).buffer(radius)
+
+    def threat_poly(self) -> Any:
+        return self.zone
+
+
+def make_theater(*tgos: StubTgo) -> ConflictTheater:
+    cp = SimpleNamespace(connected_objectives=tgos)
+    return cast(
+        ConflictTheater,
+        SimpleNamespace(control_points_for=lambda player: [cp] if player else []),
+    )
+
+
+def test_sam_zones_track_threat_polys() -> None:
+    sam = StubTgo(0, 0, 1000)
+    other = StubTgo(500, 0, 1000)
+    theater = make_theater(sam, other)
+    zones = SamEngagementZones.from_theater(theater, player=True)
+    assert list(zones.iter_threatening_sams(point(250, 0))) == [sam, other]
+    assert not zones.covers(point(5000, 0))
+
+    # A killed SAM invalidates the threat poly of its TGO.
+    sam.zone = None
+    zones.update_from_theater(theater, player=True)
+    assert list(zones.iter_threatening_sams(point(250, 0))) == [other]
+
+    assert not SamEngagementZones.from_theater(theater, player=False).covers(
+        point(500, 0)
+    )
+
+
+def test_aircraft_zones_distance_to_contact() -> None:
+    first = StubFlight("first", 10_000, 0, 1000)
+    second = StubFlight("second", 5000, 0, 1000)
+    zones = AircraftEngagementZones.from_ato(make_ato(first, second))
+    assert zones.distance_to_contact(point(0, 0), point(20_000, 0)) == pytest.approx(
+        4000
+    )
+    assert zones.distance_to_contact(point(0, 5000), point(20_000, 5000)) is None
+    zones.remove_flight(cast(Any, second))
+    assert zones.distance_to_contact(point(0, 0), point(20_000, 0)) == pytest.approx(
+        9000
+    )
+
+
+def test_sam_zones_distance_to_contact() -> None:
+    theater = make_theater(StubTgo(10_000, 0, 1000), StubTgo(5000, 0, 1000))
+    zones = SamEngagementZones.from_theater(theater, player=True)
+    assert zones.distance_to_contact(point(0, 0), point(20_000, 0)) == pytest.approx(
+        4000
+    )
+    assert zones.distance_to_contact(point(20_000, 0), point(0, 0)) == pytest.approx(
+        9000
+    )
+    assert zones.distance_to_contact(point(0, 0), point(3000, 0)) is None
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any, Optional, cast
+
+import pytest
+from dcs.mapping import Point
+from dcs.terrain import Caucasus
+
+from game.ato import Flight
+from game.ato.flightstate import Completed, FlightState, InFlight, Navigating
+from game.ato.flightwaypoint import FlightWaypoint
+from game.ato.flightwaypointtype import FlightWaypointType
+from game.flightplan.waypointactions.hold import Hold
+from game.sim import GameUpdateEvents
+from game.sim.flightkinematics import FlightKinematics
+from game.utils import kph, meters
+
+T0 = datetime(1999, 3, 28)
+TICK = timedelta(seconds=1)
+TERRAIN = Caucasus()
+SETTINGS: Any = None
+
+
+class StubFlightPlan:
+    def __init__(self, waypoints: list[FlightWaypoint], speed: float) -> None:
+        self.waypoints = waypoints
+        self.speed = speed
+
+    def travel_time_between_waypoints(
+        self, a: FlightWaypoint, b: FlightWaypoint
+    ) -> timedelta:
+        return timedelta(seconds=a.position.distance_to_point(b.position) / self.speed)
+
+
+class StubFlight:
+    def __init__(self, name: str, waypoints: list[FlightWaypoint], speed: float):
+        self.name = name
+        self.flight_plan = StubFlightPlan(waypoints, speed)
+        self.state: FlightState = Navigating(cast(Flight, self), SETTINGS, 0)
+
+    def set_state(self, state: FlightState) -> None:
+        self.state = state
+
+    def on_game_tick(
+        self, events: GameUpdateEvents, time: datetime, duration: timedelta
+    ) -> None:
+        self.state.on_game_tick(events, time, duration)
+
+
+def waypoint(x: float, y: float) -> FlightWaypoint:
+    return FlightWaypoint("", FlightWaypointType.NAV, Point(x, y, TERRAIN))
+
+
+def route(*points: tuple[float, float]) -> list[FlightWaypoint]:
+    waypoints = [waypoint(x, y) for x, y in points]
+    waypoints[-1].waypoint_type = FlightWaypointType.LANDING_POINT
+    return waypoints
+
+
+def make_flights() -> list[StubFlight]:
+    # Speeds and distances are chosen so that legs end part of the way through a tick,
+    # and one leg is shorter than a single tick.
+    return [
+        StubFlight(
+            "fast", route((0, 0), (30_000, 0), (30_000, 45_000), (0, 60_000)), 313.7
+        ),
+        StubFlight(
+            "slow", route((5_000, 5_000), (5_100, 5_050), (20_000, 15_000)), 123.4
+        ),
+        StubFlight(
+            "short",
+            route((0, 0), (12_000, -7_000), (12_150, -7_000), (12_150, -7_100)),
+            250,
+        ),
+    ]
+
+
+def state_of(flight: StubFlight) -> tuple[str, Optional[int]]:
+    state = flight.state
+    if isinstance(state, InFlight):
+        return type(state).__name__, state.waypoint_index
+    return type(state).__name__, None
+
+
+def describe(flights: list[StubFlight]) -> list[tuple[Any, ...]]:
+    return [
+        (
+            flight.name,
+            *state_of(flight),
+            getattr(flight.state, "elapsed_time", None),
+        )
+        for flight in flights
+    ]
+
+
+Transitions = dict[str, list[tuple[int, str, Optional[int]]]]
+
+
+def record_transitions(
+    transitions: Transitions, tick: int, flights: list[StubFlight]
+) -> None:
+    for flight in flights:
+        history = transitions.setdefault(flight.name, [])
+        if not history or history[-1][1:] != state_of(flight):
+            history.append((tick, *state_of(flight)))
+
+
+def positions(events: GameUpdateEvents) -> dict[str, tuple[float, float]]:
+    return {
+        cast(StubFlight, flight).name: (position.x, position.y)
+        for flight, position in events.updated_flight_positions
+    }
+
+
+class LockstepSimulation:
+    """Ticks one set of flights in a batch and an identical set individually."""
+
+    def __init__(self, make: Callable[[], list[StubFlight]] = make_flights) -> None:
+        self.batched = make()
+        self.individual = make()
+        self.kinematics = FlightKinematics()
+        self.time = T0
+        self.ticks = 0
+        self.transitions: Transitions = {}
+
+    def tick(self) -> None:
+        self.time += TICK
+        self.ticks += 1
+        batched_events = GameUpdateEvents()
+        self.kinematics.tick(
+            cast(list[Flight], self.batched), batched_events, self.time, TICK
+        )
+        individual_events = GameUpdateEvents()
+        for flight in self.individual:
+            flight.on_game_tick(individual_events, self.time, TICK)
+
+        assert describe(self.batched) == describe(self.individual)
+        batched_positions = positions(batched_events)
+        individual_positions = positions(individual_events)
+        assert batched_positions.keys() == individual_positions.keys()
+        for name, (x, y) in individual_positions.items():
+            assert batched_positions[name] == pytest.approx((x, y), abs=1e-6)
+        record_transitions(self.transitions, self.ticks, self.batched)
+
+    def run(self, ticks: int) -> None:
+        for _ in range(ticks):
+            self.tick()
+
+    def run_to_completion(self) -> None:
+        while not all(isinstance(f.state, Completed) for f in self.batched):
+            assert self.ticks < 10_000
+            self.tick()
+
+    def both(self, name: str) -> tuple[StubFlight, StubFlight]:
+        return (
+            next(f for f in self.batched if f.name == name),
+            next(f for f in self.individual if f.name == name),
+        )
+
+    def is_tracked(self, flight: StubFlight) -> bool:
+        row = self.kinematics.rows.get(cast(Flight, flight))
+        return row is not None and self.kinematics.states[row] is flight.state
+
+
+def expected_transitions() -> Transitions:
+    # The tick on which each flight reaches each waypoint when every flight is ticked
+    # individually.
+    flights = make_flights()
+    transitions: Transitions = {}
+    time = T0
+    for tick in range(1, 10_000):
+        time += TICK
+        for flight in flights:
+            flight.on_game_tick(GameUpdateEvents(), time, TICK)
+        record_transitions(transitions, tick, flights)
+        if all(isinstance(f.state, Completed) for f in flights):
+            return transitions
+    raise RuntimeError("Flights did not complete")
+
+
+def test_batched_ticks_match_individual_ticks() -> None:
+    sim = LockstepSimulation()
+    sim.tick()
+    assert all(sim.is_tracked(f) for f in sim.batched)
+
+    sim.run_to_completion()
+    assert sim.transitions == expected_transitions()
+    assert not len(sim.kinematics)
+
+
+def test_replaced_state_is_tracked_again() -> None:
+    sim = LockstepSimulation()
+    sim.run(30)
+    for flight in sim.both("fast"):
+        # As when the flight leaves combat.
+        flight.set_state(Navigating(cast(Flight, flight), SETTINGS, 1))
+    for flight in sim.both("slow"):
+        # As when the flight is ticked by something other than the simulation.
+        flight.state.on_game_tick(GameUpdateEvents(), sim.time, TICK)
+
+    batched_fast, _ = sim.both("fast")
+    assert not sim.is_tracked(batched_fast)
+    sim.tick()
+    assert all(sim.is_tracked(f) for f in sim.batched)
+    sim.run_to_completion()
+
+
+def is_holding(flight: StubFlight) -> bool:
+    return isinstance(flight.state, InFlight) and bool(flight.state.pending_actions)
+
+
+def test_flights_with_pending_actions_are_ticked_individually() -> None:
+    push_time = T0 + timedelta(minutes=4, microseconds=250_000)
+
+    def make() -> list[StubFlight]:
+        flights = make_flights()
+        flights[0].flight_plan.waypoints[1].add_action(
+            Hold(lambda: push_time, meters(6000), kph(500))
+        )
+        return flights
+
+    sim = LockstepSimulation(make)
+    holding, _ = sim.both("fast")
+    while not is_holding(holding):
+        sim.tick()
+    while sim.time < push_time:
+        assert not sim.is_tracked(holding)
+        sim.tick()
+    assert not is_holding(holding)
+    assert sim.is_tracked(holding)
+    # The time left over after the push time is spent flying the next leg.
+    assert isinstance(holding.state, Navigating)
+    assert holding.state.elapsed_time == timedelta(microseconds=750_000)
+    sim.run_to_completion()
+
+
+def test_moved_waypoint_is_tracked_again() -> None:
+    sim = LockstepSimulation()
+    sim.run(30)
+    for flight in sim.both("fast"):
+        state = flight.state
+        assert isinstance(state, Navigating)
+        # Moving a waypoint in the UI replaces its position without replacing the
+        # flight state.
+        state.next_waypoint.position = Point(40_000, 5_000, TERRAIN)
+
+    batched_fast, _ = sim.both("fast")
+    sim.tick()
+    assert sim.is_tracked(batched_fast)
+    sim.run_to_completion()
@@ -0,0 +1,65 @@
+from typing import cast
+from uuid import uuid4
+
+from dcs.mapping import Point
+from dcs.terrain import Caucasus
+
+from game.ato import Flight
+from game.sim import GameUpdateEvents
+
+
+class StubFlight:
+    def __init__(self) -> None:
+        self.id = uuid4()
+
+
+def flight() -> Flight:
+    return cast(Flight, StubFlight())
+
+
+def point(x: float) -> Point:
+    return Point(x, 0, Caucasus())
+
+
+def test_merge_keeps_latest_flight_positions() -> None:
+    first = flight()
+    second = flight()
+    events = GameUpdateEvents().update_flight_positions(
+        [(first, point(0)), (second, point(0))]
+    )
+    events.merge(GameUpdateEvents().update_flight_position(first, point(1)))
+
+    assert [(f, p.x) for f, p in events.updated_flight_positions] == [
+        (first, 1),
+        (second, 0),
+    ]
+    assert events.only_flight_positions
+
+
+def test_merge_combines_events() -> None:
+    updated = flight()
+    deleted = flight()
+    events = GameUpdateEvents().update_flight(updated).select_flight(updated)
+    events.merge(GameUpdateEvents().update_flight(updated).delete_flight(deleted))
+    events.merge(GameUpdateEvents().deselect_flight().begin_new_turn())
+
+    assert events.updated_flights == {updated}
+    assert events.deleted_flights == {deleted.id}
+    assert events.selected_flight is None
+    assert events.deselected_flight
+    assert events.new_turn
+    assert not events.only_flight_positions
+
+
+def test_merge_does_not_modify_later_events() -> None:
+    later = GameUpdateEvents().update_flight(flight())
+    GameUpdateEvents().merge(later).update_flight(flight())
+    assert len(later.updated_flights) == 1
+
+
+def test_merge_with_reset_discards_earlier_events() -> None:
+    events = GameUpdateEvents().update_flight(flight())
+    events.merge(GameUpdateEvents().game_loaded(None))
+
+    assert events.game_unloaded
+    assert not events.updated_flights
@@ -0,0 +1,86 @@
+import pickle
+import random
+from collections.abc import Callable
+from datetime import timedelta
+from typing import Any
+
+import pytest
+
+from game import Game
+from game.settings.settings import CombatResolutionMethod, FastForwardStopCondition
+from game.sim import GameUpdateEvents
+from game.sim.missionsimulation import MissionSimulation
+from tests.generatedgame import generate_game
+
+DURATION = timedelta(hours=2)
+
+
+@pytest.fixture(scope="module")
+def generated_game(tmp_path_factory: pytest.TempPathFactory) -> Game:
+    game = generate_game(tmp_path_factory.mktemp("dcs"))
+    # Resolve combat rather than pausing for it so that the whole mission is simulated.
+    game.settings.fast_forward_stop_condition = FastForwardStopCondition.MANUAL
+    game.settings.combat_resolution_method = CombatResolutionMethod.RESOLVE
+    return game
+
+
+class SimulationRun:
+    """Simulates its own copy of a game.
+
+    Combat is resolved randomly, so each run keeps its own random state. That keeps
+    the results of two runs that are advanced in turn independent of each other.
+    """
+
+    def __init__(self, game: Game) -> None:
+        self.sim = MissionSimulation(pickle.loads(pickle.dumps(game)))
+        self.sim.begin_simulation()
+        self.completed = False
+        self.steps = 0
+        self.random_state = random.Random(0).getstate()
+
+    def advance(self, step: Callable[[GameUpdateEvents], GameUpdateEvents]) -> None:
+        random.setstate(self.random_state)
+        self.completed = step(GameUpdateEvents()).simulation_complete
+        self.random_state = random.getstate()
+        self.steps += 1
+
+    def describe(self) -> dict[str, Any]:
+        aircraft = self.sim.aircraft_simulation
+        return {
+            "flights": [
+                (
+                    flight.id,
+                    type(flight.state).__name__,
+                    getattr(flight.state, "waypoint_index", None),
+                    getattr(flight.state, "elapsed_time", None),
+                )
+                for flight in aircraft.iter_flights()
+            ],
+            "combats": sorted(
+                sorted(str(flight.id) for flight in combat.iter_flights())
+                for combat in aircraft.combats
+            ),
+            "losses": [
+                (loss.flight.id, None if loss.pilot is None else loss.pilot.name)
+                for loss in aircraft.results.air_losses
+            ],
+        }
+
+
+def test_tick_to_next_event_matches_tick(generated_game: Game) -> None:
+    ticked = SimulationRun(generated_game)
+    skipped = SimulationRun(generated_game)
+    assert ticked.describe()["flights"]
+
+    end = skipped.sim.time + DURATION
+    while not skipped.completed and skipped.sim.time < end:
+        skipped.advance(skipped.sim.tick_to_next_event)
+        while ticked.sim.time < skipped.sim.time:
+            assert not ticked.completed
+            ticked.advance(ticked.sim.tick)
+        assert ticked.sim.time == skipped.sim.time
+        assert ticked.completed == skipped.completed
+        assert ticked.describe() == skipped.describe()
+
+    # Some ticks were skipped, or the test did not test anything.
+    assert skipped.steps < ticked.steps
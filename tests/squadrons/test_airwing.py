@@ -0,0 +1,145 @@
+from collections import defaultdict
+from collections.abc import Iterable
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+from dcs.mapping import Point
+from dcs.terrain import Caucasus
+
+from game.ato.closestairfields import ClosestAirfields, ObjectiveDistanceCache
+from game.ato.flighttype import FlightType
+from game.dcs.aircrafttype import AircraftType
+from game.squadrons import AirWing, Squadron
+
+
+class StubControlPoint:
+    def __init__(
+        self,
+        x: float,
+        captured: bool = True,
+        ferry_only: bool = False,
+        runway_operational: bool = True,
+    ) -> None:
+        self.position = Point(x, 0, Caucasus())
+        self.captured = captured
+        self.ferry_only = ferry_only
+        self.runway_operational = runway_operational
+
+    def runway_is_operational(self) -> bool:
+        return self.runway_operational
+
+
+class StubSquadron:
+    def __init__(
+        self,
+        aircraft: str,
+        location: StubControlPoint,
+        primary_task: FlightType = FlightType.CAS,
+        tasks: frozenset[FlightType] = frozenset({FlightType.CAS}),
+        untasked_aircraft: int = 2,
+    ) -> None:
+        self.aircraft = aircraft
+        self.location = location
+        self.primary_task = primary_task
+        self.auto_assignable_mission_types = tasks
+        self.untasked_aircraft = untasked_aircraft
+        self.coalition = SimpleNamespace(air_wing=None)
+
+    def capable_of(self, task: FlightType) -> bool:
+        return True
+
+    def set_auto_assignable_mission_types(
+        self, mission_types: Iterable[FlightType]
+    ) -> None:
+        Squadron.set_auto_assignable_mission_types(cast(Any, self), mission_types)
+
+    def can_auto_assign_mission(
+        self, location: Any, task: FlightType, size: int, this_turn: bool
+    ) -> bool:
+        return task in self.auto_assignable_mission_types and (
+            not this_turn or self.untasked_aircraft >= size
+        )
+
+
+@pytest.fixture
+def control_points(monkeypatch: pytest.MonkeyPatch) -> list[StubControlPoint]:
+    control_points = [
+        StubControlPoint(5, captured=False),
+        StubControlPoint(10),
+        StubControlPoint(15, ferry_only=True),
+        StubControlPoint(20),
+        StubControlPoint(30, runway_operational=False),
+    ]
+    monkeypatch.setattr(
+        AircraftType, "priority_ranks_for_task", lambda task: {"best": 0, "good": 1}
+    )
+    monkeypatch.setattr(
+        ObjectiveDistanceCache,
+        "get_closest_airfields",
+        lambda location: ClosestAirfields(location, cast(Any, control_points)),
+    )
+    return control_points
+
+
+def make_air_wing(*squadrons: StubSquadron) -> AirWing:
+    air_wing = AirWing.__new__(AirWing)
+    air_wing.player = True
+    air_wing.squadrons = defaultdict(list)
+    air_wing.invalidate_auto_assignable_index()
+    for squadron in squadrons:
+        squadron.coalition.air_wing = air_wing
+        air_wing.add_squadron(cast(Any, squadron))
+    return air_wing
+
+
+def test_best_squadrons_for(control_points: list[StubControlPoint]) -> None:
+    enemy, near, ferry, far, damaged = control_points
+    target = cast(Any, StubControlPoint(0))
+    expected = [
+        StubSquadron("best", near),
+        StubSquadron("good", near),
+        StubSquadron("unknown", near),
+        StubSquadron("best", far),
+        StubSquadron("best", near, FlightType.BAI),
+    ]
+    air_wing = make_air_wing(
+        *reversed(expected),
+        StubSquadron("best", enemy),
+        StubSquadron("best", ferry),
+        StubSquadron("best", damaged),
+        StubSquadron("best", near, tasks=frozenset({FlightType.BAI})),
+        StubSquadron("best", near, untasked_aircraft=1),
+    )
+
+    assert (
+        air_wing.best_squadrons_for(target, FlightType.CAS, 2, this_turn=True)
+        == expected
+    )
+    assert not air_wing.best_squadrons_for(target, FlightType.BARCAP, 2, this_turn=True)
+
+
+def test_added_squadrons_are_indexed(control_points: list[StubControlPoint]) -> None:
+    near = control_points[1]
+    target = cast(Any, StubControlPoint(0))
+    air_wing = make_air_wing(StubSquadron("good", near))
+    assert air_wing.best_squadron_for(target, FlightType.CAS, 2, this_turn=True)
+
+    best = StubSquadron("best", near)
+    air_wing.add_squadron(cast(Any, best))
+    assert air_wing.best_squadron_for(target, FlightType.CAS, 2, this_turn=True) is best
+
+
+def test_changed_mission_types_are_indexed(
+    control_points: list[StubControlPoint],
+) -> None:
+    near = control_points[1]
+    target = cast(Any, StubControlPoint(0))
+    squadron = StubSquadron("best", near)
+    air_wing = make_air_wing(squadron)
+    assert air_wing.best_squadron_for(target, FlightType.CAS, 2, this_turn=True)
+    assert not air_wing.best_squadron_for(target, FlightType.BAI, 2, this_turn=True)
+
+    squadron.set_auto_assignable_mission_types({FlightType.BAI})
+    assert not air_wing.best_squadron_for(target, FlightType.CAS, 2, this_turn=True)
+    assert air_wing.best_squadron_for(target, FlightType.BAI, 2, this_turn=True)
@@ -0,0 +1,60 @@
+from unittest.mock import MagicMock
+
+from pytest_mock import MockerFixture
+
+from game.coalition import Coalition
+
+
+def make_coalitions() -> tuple[Coalition, Coalition]:
+    # The coalitions are created empty, the way they are when unpickled, since
+    # constructing them requires a full game.
+    game = MagicMock()
+    blue = Coalition.__new__(Coalition)
+    red = Coalition.__new__(Coalition)
+    for coalition, player in ((blue, True), (red, False)):
+        coalition.__setstate__(
+            {
+                "game": game,
+                "player": player,
+                "faction": MagicMock(locales=None),
+                "_opponent": None,
+            }
+        )
+    blue.set_opponent(red)
+    red.set_opponent(blue)
+    return blue, red
+
+
+def test_threat_zones_are_computed_on_first_access(mocker: MockerFixture) -> None:
+    for_faction = mocker.patch("game.coalition.ThreatZones.for_faction")
+    blue, _ = make_coalitions()
+    for_faction.assert_not_called()
+
+    assert blue.threat_zone is for_faction.return_value
+    assert blue.threat_zone is for_faction.return_value
+    for_faction.assert_called_once_with(blue.game, True)
+
+
+def test_nav_mesh_is_computed_from_opponent_threat_zones(
+    mocker: MockerFixture,
+) -> None:
+    for_faction = mocker.patch("game.coalition.ThreatZones.for_faction")
+    from_threat_zones = mocker.patch("game.coalition.NavMesh.from_threat_zones")
+    blue, red = make_coalitions()
+
+    assert blue.nav_mesh is from_threat_zones.return_value
+    assert blue.nav_mesh is from_threat_zones.return_value
+    for_faction.assert_called_once_with(red.game, False)
+    from_threat_zones.assert_called_once()
+    assert from_threat_zones.call_args.args[0] is red.threat_zone
+
+
+def test_derived_state_is_not_persisted(mocker: MockerFixture) -> None:
+    mocker.patch("game.coalition.ThreatZones.for_faction")
+    mocker.patch("game.coalition.NavMesh.from_threat_zones")
+    blue, _ = make_coalitions()
+    blue.nav_mesh
+
+    state = blue.__getstate__()
+    assert "_threat_zone" not in state
+    assert "_navmesh" not in state
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+from game.htn import CompoundTask, Method, Planner, PrimitiveTask, WorldState
+from game.profiling import PlannerStats
+
+
+class Counter(WorldState["Counter"]):
+    def __init__(self, value: int = 0) -> None:
+        self.value = value
+
+    def clone(self) -> Counter:
+        return Counter(self.value)
+
+
+class Increment(PrimitiveTask[Counter]):
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+
+    def preconditions_met(self, state: Counter) -> bool:
+        return state.value < self.limit
+
+    def apply_effects(self, state: Counter) -> None:
+        state.value += 1
+
+
+class IncrementTwice(CompoundTask[Counter]):
+    def each_valid_method(self, state: Counter) -> Iterator[Method[Counter]]:
+        # The first method can never be applied and forces a backtrack.
+        yield [Increment(limit=0), Increment(limit=0)]
+        yield [Increment(limit=2), Increment(limit=2)]
+
+
+def test_planner_backtracks() -> None:
+    result = Planner[Counter, Increment](IncrementTwice()).plan(Counter())
+    assert result is not None
+    assert len(result.tasks) == 2
+    assert result.end_state.value == 2
+
+
+def test_planner_without_plan() -> None:
+    assert Planner[Counter, Increment](IncrementTwice()).plan(Counter(2)) is None
+
+
+def test_planner_stats() -> None:
+    stats = PlannerStats()
+    planner = Planner[Counter, Increment](IncrementTwice(), stats)
+    assert planner.plan(Counter()) is not None
+    assert planner.plan(Counter(2)) is None
+
+    assert stats.plans_found == 1
+    assert stats.plans_failed == 1
+    # Each plan backtracks out of the first method, and the second plan also backtracks
+    # out of the second method before it runs out of methods.
+    assert stats.backtracks == 3
+    assert stats.preconditions["Increment"].count == 5
+    assert stats.preconditions_failed["Increment"] == 3
+    assert stats.effects["Increment"].count == 2
+    assert stats.decompositions["IncrementTwice"].count == 5
+    assert stats.clones["Counter"].count == 4
+
+    data = stats.to_dict()
+    assert data["preconditions"]["Increment"]["failed"] == 3
+    assert data["decompositions"]["IncrementTwice"]["count"] == 5
@@ -0,0 +1,93 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from game.resourcecache import ResourceCache
+
+
+def write_yaml(path: Path, content: str, mtime_ns: int) -> None:
+    path.write_text(content, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_resource_cache_round_trip(tmp_path: Path) -> None:
+    source = tmp_path / "unit.yaml"
+    write_yaml(source, "name: A-10C\nprice: 20\n", 1_000_000_000)
+    cache_path = tmp_path / "resources.p"
+
+    cache = ResourceCache(cache_path)
+    data = cache.load_yaml(source)
+    assert data == {"name": "A-10C", "price": 20}
+    # Callers may modify the data they are given without affecting the cache.
+    data["price"] = 0
+    assert cache.load_yaml(source) == {"name": "A-10C", "price": 20}
+    cache.save()
+    assert cache_path.is_file()
+
+    reloaded = ResourceCache(cache_path)
+    assert reloaded.load_yaml(source) == {"name": "A-10C", "price": 20}
+
+
+def test_resource_cache_detects_changes(tmp_path: Path) -> None:
+    source = tmp_path / "unit.yaml"
+    write_yaml(source, "price: 20\n", 1_000_000_000)
+    cache_path = tmp_path / "resources.p"
+    cache = ResourceCache(cache_path)
+    cache.load_yaml(source)
+    cache.save()
+
+    # Touching the file without changing it updates the entry.
+    write_yaml(source, "price: 20\n", 2_000_000_000)
+    cache = ResourceCache(cache_path)
+    assert cache.load_yaml(source) == {"price": 20}
+    cache.save()
+
+    # Changing the content of the file without changing its size parses it again.
+    write_yaml(source, "price: 30\n", 3_000_000_000)
+    assert ResourceCache(cache_path).load_yaml(source) == {"price": 30}
+
+
+def test_resource_cache_ignores_corrupt_cache(tmp_path: Path) -> None:
+    source = tmp_path / "unit.yaml"
+    write_yaml(source, "price: 20\n", 1_000_000_000)
+    cache_path = tmp_path / "resources.p"
+    cache_path.write_bytes(b"not a pickle")
+    assert ResourceCache(cache_path).load_yaml(source) == {"price": 20}
+
+
+def test_resource_cache_preload(tmp_path: Path) -> None:
+    cached = tmp_path / "cached.yaml"
+    write_yaml(cached, "price: 20\n", 1_000_000_000)
+    uncached = tmp_path / "uncached.yaml"
+    write_yaml(uncached, "price: 30\n", 1_000_000_000)
+    cache = ResourceCache(tmp_path / "resources.p")
+    cache.load_yaml(cached)
+
+    assert cache.uncached([cached, uncached]) == [uncached]
+    with ThreadPoolExecutor() as executor:
+        cache.preload([uncached], executor)
+    assert not cache.uncached([cached, uncached])
+    assert cache.load_yaml(uncached) == {"price": 30}
+
+
+def test_resource_cache_derived_data(tmp_path: Path) -> None:
+    cache_path = tmp_path / "resources.p"
+    builds = 0
+
+    def build() -> list[int]:
+        nonlocal builds
+        builds += 1
+        return [1, 2, 3]
+
+    cache = ResourceCache(cache_path)
+    assert cache.load_derived("numbers", b"v1", build) == [1, 2, 3]
+    assert cache.load_derived("numbers", b"v1", build) == [1, 2, 3]
+    assert builds == 1
+    cache.save()
+
+    reloaded = ResourceCache(cache_path)
+    assert reloaded.load_derived("numbers", b"v1", build) == [1, 2, 3]
+    assert builds == 1
+    # A new fingerprint means the inputs changed, so the data is built again.
+    assert reloaded.load_derived("numbers", b"v2", build) == [1, 2, 3]
+    assert builds == 2
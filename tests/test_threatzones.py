@@ -0,0 +1,185 @@
+import random
+from collections.abc import Hashable, Mapping
+from typing import cast
+
+import pytest
+from dcs.mapping import Point
+from dcs.terrain import Caucasus
+from shapely.ops import unary_union
+
+from game.ato import FlightWaypoint
+from game.ato.flightwaypointtype import FlightWaypointType
+from game.theater import ConflictTheater
+from game.threatzones import ThreatCircle, ThreatLayer, ThreatZones
+from game.utils import meters
+
+
+class Source:
+    """Stand-in for the control points and TGOs that project threats."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+def random_circles(count: int, seed: int) -> dict[Hashable, ThreatCircle]:
+    rng = random.Random(seed)
+    return {
+        Source(f"source {i}"): ThreatCircle(
+            rng.uniform(0, 1_000_000),
+            rng.uniform(0, 1_000_000),
+            rng.uniform(10_000, 60_000),
+        )
+        for i in range(count)
+    }
+
+
+def assert_union_of(
+    layer: ThreatLayer, circles: Mapping[Hashable, ThreatCircle]
+) -> None:
+    expected = unary_union([c.to_polygon() for c in circles.values()])
+    assert layer.geometry.symmetric_difference(expected).area == pytest.approx(
+        0, abs=1e-3
+    )
+
+
+def test_empty_layer() -> None:
+    layer = ThreatLayer.from_circles({})
+    assert layer.geometry.is_empty
+
+
+def test_from_circles_matches_union() -> None:
+    circles = random_circles(100, seed=0)
+    assert_union_of(ThreatLayer.from_circles(circles), circles)
+
+
+def test_without_removes_only_that_source() -> None:
+    circles = random_circles(100, seed=1)
+    layer = ThreatLayer.from_circles(circles)
+    removed = list(circles)[:20]
+    for source in removed:
+        del circles[source]
+        updated = layer.without(source)
+        assert_union_of(updated, circles)
+        layer = updated
+
+
+def test_without_does_not_modify_original() -> None:
+    circles = random_circles(50, seed=2)
+    layer = ThreatLayer.from_circles(circles)
+    before = layer.geometry
+    layer.without(next(iter(circles)))
+    assert layer.geometry is before
+    assert_union_of(layer, circles)
+
+
+def test_without_unknown_source() -> None:
+    layer = ThreatLayer.from_circles(random_circles(10, seed=3))
+    assert layer.without(Source("unknown")) is layer
+
+
+def test_updated_adds_and_changes_sources() -> None:
+    circles = random_circles(100, seed=4)
+    layer = ThreatLayer.from_circles(circles)
+    rng = random.Random(5)
+    for i in range(10):
+        source = rng.choice(list(circles))
+        circle = circles[source]
+        circles[source] = ThreatCircle(circle.x, circle.y, circle.radius * 1.5)
+        circles[Source(f"new {i}")] = ThreatCircle(
+            rng.uniform(0, 1_000_000), rng.uniform(0, 1_000_000), 30_000
+        )
+        layer = layer.updated(circles)
+        assert_union_of(layer, circles)
+
+
+def test_updated_without_changes() -> None:
+    circles = random_circles(10, seed=6)
+    layer = ThreatLayer.from_circles(circles)
+    assert layer.updated(dict(circles)) is layer
+
+
+@pytest.fixture
+def threat_zones() -> ThreatZones:
+    circles = random_circles(50, seed=7)
+    layer = ThreatLayer.from_circles(circles)
+    return ThreatZones(
+        cast(ConflictTheater, None),
+        airbases=layer,
+        air_defenses=layer,
+        radar_sam_threats=ThreatLayer.empty(),
+    )
+
+
+def random_points(count: int, seed: int) -> list[Point]:
+    rng = random.Random(seed)
+    terrain = Caucasus()
+    return [
+        Point(rng.uniform(0, 1_000_000), rng.uniform(0, 1_000_000), terrain)
+        for _ in range(count)
+    ]
+
+
+def test_points_threatened_matches_threatened(threat_zones: ThreatZones) -> None:
+    points = random_points(200, seed=8)
+    assert list(threat_zones.points_threatened(points)) == [
+        threat_zones.threatened(p) for p in points
+    ]
+
+
+def test_segments_threatened_matches_path_threatened(
+    threat_zones: ThreatZones,
+) -> None:
+    starts = random_points(200, seed=9)
+    ends = random_points(200, seed=10)
+    assert list(threat_zones.segments_threatened(starts, ends)) == [
+        threat_zones.path_threatened(a, b) for a, b in zip(starts, ends)
+    ]
+
+
+def test_segments_threatened_mismatched_lengths(threat_zones: ThreatZones) -> None:
+    with pytest.raises(ValueError):
+        threat_zones.segments_threatened(random_points(2, seed=11), [])
+
+
+def test_waypoint_paths_threatened(threat_zones: ThreatZones) -> None:
+    points = random_points(30, seed=12)
+    paths = [
+        [
+            FlightWaypoint("NAV", FlightWaypointType.NAV, p, meters(0))
+            for p in points[i : i + 3]
+        ]
+        for i in range(0, len(points), 3)
+    ]
+    lines = threat_zones.waypoint_paths(paths)
+    assert list(threat_zones.paths_threatened_by_aircraft(lines)) == [
+        threat_zones.waypoints_threatened_by_aircraft(p) for p in paths
+    ]
+    assert not threat_zones.paths_threatened_by_radar_sam(lines).any()
+
+
+def test_waypoint_paths_with_short_paths(threat_zones: ThreatZones) -> None:
+    terrain = Caucasus()
+    threatened = next(iter(random_circles(50, seed=7).values()))
+    inside = Point(threatened.x, threatened.y, terrain)
+    outside = Point(-1_000_000, -1_000_000, terrain)
+    points = random_points(3, seed=13)
+
+    def path(*points: Point) -> list[FlightWaypoint]:
+        return [
+            FlightWaypoint("NAV", FlightWaypointType.NAV, p, meters(0)) for p in points
+        ]
+
+    paths = [path(), path(inside), path(*points), path(outside), path()]
+    lines = threat_zones.waypoint_paths(paths)
+    assert list(threat_zones.paths_threatened_by_aircraft(lines)) == [
+        False,
+        True,
+        threat_zones.waypoints_threatened_by_aircraft(paths[2]),
+        False,
+        False,
+    ]
+    assert not threat_zones.paths_threatened_by_radar_sam(lines).any()
+    assert not len(threat_zones.waypoint_paths([]))
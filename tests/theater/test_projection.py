@@ -0,0 +1,40 @@
+from dcs.mapping import Point
+from dcs.terrain import Caucasus
+
+from game.theater.projection import TerrainProjection
+
+
+def test_xy_to_latlng_matches_point_latlng() -> None:
+    terrain = Caucasus()
+    points = [Point(x, y, terrain) for x, y in ((0, 0), (-300_000, 600_000), (1, -2))]
+
+    lat, lng = TerrainProjection.for_terrain(terrain).xy_to_latlng(
+        [p.x for p in points], [p.y for p in points]
+    )
+
+    for point, point_lat, point_lng in zip(points, lat, lng):
+        latlng = point.latlng()
+        assert point_lat == latlng.lat
+        assert point_lng == latlng.lng
+
+
+def test_latlng_to_xy_matches_point_from_latlng() -> None:
+    terrain = Caucasus()
+    latlngs = [
+        Point(x, y, terrain).latlng() for x, y in ((0, 0), (-300_000, 600_000), (1, -2))
+    ]
+
+    x, y = TerrainProjection.for_terrain(terrain).latlng_to_xy(
+        [ll.lat for ll in latlngs], [ll.lng for ll in latlngs]
+    )
+
+    for latlng, point_x, point_y in zip(latlngs, x, y):
+        point = Point.from_latlng(latlng, terrain)
+        assert point_x == point.x
+        assert point_y == point.y
+
+
+def test_projections_are_cached_by_terrain() -> None:
+    assert TerrainProjection.for_terrain(Caucasus()) is TerrainProjection.for_terrain(
+        Caucasus()
+    )
@@ -0,0 +1,154 @@
+import random
+from datetime import timezone
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+from dcs.mapping import Point
+from dcs.terrain import Caucasus
+
+from game.theater.conflicttheater import ConflictTheater
+from game.theater.controlpoint import Carrier, Fob
+from game.theater.spatialindex import TheaterSpatialIndex
+
+
+class StubGroundObject:
+    def __init__(self, position: Point) -> None:
+        self.position = position
+
+
+class StubControlPoint:
+    def __init__(
+        self,
+        position: Point,
+        captured: bool,
+        is_fleet: bool,
+        ground_objects: list[StubGroundObject],
+    ) -> None:
+        self.position = position
+        self.captured = captured
+        self.is_fleet = is_fleet
+        self.ground_objects = ground_objects
+
+
+def make_theater(seed: int) -> Any:
+    rng = random.Random(seed)
+    terrain = Caucasus()
+
+    def position() -> Point:
+        return Point(rng.uniform(-1e5, 1e5), rng.uniform(-1e5, 1e5), terrain)
+
+    control_points = [
+        StubControlPoint(
+            position=position(),
+            captured=rng.random() < 0.5,
+            is_fleet=rng.random() < 0.2,
+            ground_objects=[
+                StubGroundObject(position()) for _ in range(rng.randrange(5))
+            ],
+        )
+        for _ in range(20)
+    ]
+    return SimpleNamespace(
+        terrain=terrain,
+        controlpoints=control_points,
+        ground_objects=[g for cp in control_points for g in cp.ground_objects],
+    )
+
+
+def test_control_points_by_distance() -> None:
+    theater = make_theater(0)
+    index = TheaterSpatialIndex(theater)
+
+    for target in [*theater.controlpoints, *theater.ground_objects]:
+        assert index.control_points_by_distance(target) == sorted(
+            theater.controlpoints,
+            key=lambda cp: target.position.distance_to_point(cp.position),
+        )
+
+
+def test_distances_to_closest_control_point() -> None:
+    theater = make_theater(1)
+    index = TheaterSpatialIndex(theater)
+
+    for player in (True, False):
+        distances = index.distances_to_closest_control_point(
+            theater.ground_objects, player
+        )
+        for ground_object, distance in zip(theater.ground_objects, distances):
+            assert distance == min(
+                ground_object.position.distance_to_point(cp.position)
+                for cp in theater.controlpoints
+                if cp.captured == player
+            )
+
+
+def test_closest_objects() -> None:
+    theater = make_theater(2)
+    index = TheaterSpatialIndex(theater)
+    terrain = theater.terrain
+
+    for point in (Point(x, y, terrain) for x in (-5e4, 0, 5e4) for y in (-5e4, 0, 5e4)):
+        for allow_naval in (True, False):
+            assert index.closest_control_point(point, allow_naval) == min(
+                (cp for cp in theater.controlpoints if allow_naval or not cp.is_fleet),
+                key=lambda cp: point.distance_to_point(cp.position),
+            )
+
+        closest_ground_object = min(
+            theater.ground_objects, key=lambda g: point.distance_to_point(g.position)
+        )
+        assert index.closest_ground_object(point) == (
+            closest_ground_object,
+            point.distance_to_point(closest_ground_object.position),
+        )
+
+    player_cp, enemy_cp = cast(Any, index.closest_opposing_control_points())
+    assert player_cp.captured and not enemy_cp.captured
+    assert player_cp.position.distance_to_point(enemy_cp.position) == min(
+        p.position.distance_to_point(e.position)
+        for p in theater.controlpoints
+        if p.captured
+        for e in theater.controlpoints
+        if not e.captured
+    )
+
+
+def test_empty_theater() -> None:
+    index = TheaterSpatialIndex(
+        cast(Any, SimpleNamespace(controlpoints=[], ground_objects=[]))
+    )
+
+    assert index.closest_control_point(Point(0, 0, Caucasus())) is None
+    assert index.closest_ground_object(Point(0, 0, Caucasus())) is None
+    assert index.closest_opposing_control_points() is None
+    assert not len(index.distances_to_closest_control_point([], True))
+
+
+def test_closest_control_point_before_finish_init() -> None:
+    # The campaign loader finds the closest control points before the coalitions of
+    # the control points are set by ControlPoint.finish_init.
+    terrain = Caucasus()
+    theater = ConflictTheater(
+        terrain, None, timezone.utc, cast(Any, None), cast(Any, None)
+    )
+    blue = Fob("blue", Point(0, 0, terrain), theater, starts_blue=True)
+    red = Fob("red", Point(50_000, 0, terrain), theater, starts_blue=False)
+    carrier = Carrier("carrier", Point(-10_000, 0, terrain), theater, starts_blue=True)
+    for control_point in (blue, red, carrier):
+        theater.add_controlpoint(control_point)
+    with pytest.raises(RuntimeError):
+        blue.captured
+
+    assert theater.closest_control_point(Point(-8_000, 0, terrain)) is blue
+    assert (
+        theater.closest_control_point(Point(-8_000, 0, terrain), allow_naval=True)
+        is carrier
+    )
+
+    # Ownership set after the index was built is used by later queries.
+    for control_point in (blue, red, carrier):
+        control_point._coalition = cast(
+            Any, SimpleNamespace(player=control_point.starts_blue)
+        )
+    assert theater.closest_opposing_control_points() == (blue, red)
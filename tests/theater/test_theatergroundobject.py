@@ -18,7 +18,7 @@
     IadsBuildingGroundObject,
 )
 from game.theater.controlpoint import OffMapSpawn
-from game.utils import Heading
+from game.utils import Heading, meters
 
 
 def test_mission_types_friendly(mocker: Any) -> None:
@@ -203,3 +203,31 @@ def test_mission_types_enemy(mocker: Any) -> None:
     assert FlightType.TARCAP in mission_types
     assert FlightType.SEAD_ESCORT in mission_types
     assert FlightType.SWEEP in mission_types
+
+
+def test_threat_ranges_are_cached_until_invalidated(mocker: Any) -> None:
+    dummy_location = PresetLocation(
+        name="dummy_location", position=Point(0, 0, None), heading=Heading(0)  # type: ignore
+    )
+    dummy_control_point = OffMapSpawn(
+        name="dummy_control_point",
+        position=Point(0, 0, None),  # type: ignore
+        theater=None,  # type: ignore
+        starts_blue=True,
+    )
+    ground_object = SamGroundObject(
+        name="test", location=dummy_location, control_point=dummy_control_point
+    )
+    group = mocker.MagicMock()
+    group.max_threat_range.return_value = meters(10)
+    group.max_detection_range.return_value = meters(20)
+    ground_object.groups = [group]
+
+    assert ground_object.max_threat_range() == meters(10)
+    assert ground_object.max_detection_range() == meters(20)
+    group.max_threat_range.return_value = meters(5)
+    assert ground_object.max_threat_range() == meters(10)
+
+    ground_object.invalidate_threat_ranges()
+    assert ground_object.max_threat_range() == meters(5)
+    assert ground_object.max_radar_threat_range() == meters(5)